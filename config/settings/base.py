@@ -320,6 +320,7 @@ CELERY_RESULT_SERIALIZER = "json"
 CELERY_TASK_TIME_LIMIT = 5 * 60
 # https://docs.celeryq.dev/en/stable/userguide/configuration.html#task-soft-time-limit
 # TODO: set to whatever value is adequate in your circumstances
+# Image generation tasks set their own, longer limits (image_processing.tasks)
 CELERY_TASK_SOFT_TIME_LIMIT = 60
 # https://docs.celeryq.dev/en/stable/userguide/configuration.html#beat-scheduler
 CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
@@ -340,6 +341,21 @@ CELERY_BEAT_SCHEDULE = {
         'task': 'usage_limits.tasks.cleanup_usage_system',
         'schedule': crontab(hour=4, minute=0),  # Daily at 4 AM
     },
+    # Newsletter sends whose worker died mid-way - resumes from the ledger
+    'resume-stalled-newsletter-sends': {
+        'task': 'newsletter.tasks.resume_stalled_newsletter_sends',
+        'schedule': crontab(minute=15),  # Hourly
+    },
+    # Popular-tag counts - picks up scheduled posts going live
+    'rebuild-blog-tag-counts': {
+        'task': 'newsletter.tasks.rebuild_blog_tag_counts',
+        'schedule': crontab(minute=5),  # Hourly
+    },
+    # Buffered blog view / wedding link click counters -> database
+    'flush-buffered-counters': {
+        'task': 'saas_base.utils.counters.flush_buffered_counters',
+        'schedule': crontab(minute='*'),  # Every minute
+    },
 }
 
 # https://docs.celeryq.dev/en/stable/userguide/configuration.html#worker-send-task-events
@@ -348,6 +364,47 @@ CELERY_WORKER_SEND_TASK_EVENTS = True
 CELERY_TASK_SEND_SENT_EVENT = True
 # https://docs.celeryq.dev/en/stable/userguide/configuration.html#worker-hijack-root-logger
 CELERY_WORKER_HIJACK_ROOT_LOGGER = False
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#worker-pool
+# Async Gemini mode spends most of its time waiting on the network, so a
+# threads pool sharing one event loop replaces one process per job.
+CELERY_WORKER_POOL = env(
+    "CELERY_WORKER_POOL",
+    default="threads" if env("GEMINI_EXECUTION_MODE", default="sync") == "async" else "prefork",
+)
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#worker-concurrency
+# Each task thread blocks on its own Gemini calls, so in async mode one
+# thread per in-flight call (GEMINI_MAX_IN_FLIGHT) is what lets the engine
+# fill its window; otherwise Celery's default of one per CPU.
+CELERY_WORKER_CONCURRENCY = env.int(
+    "CELERY_WORKER_CONCURRENCY",
+    default=(
+        env.int("GEMINI_MAX_IN_FLIGHT", default=32)
+        if env("GEMINI_EXECUTION_MODE", default="sync") == "async"
+        else None
+    ),
+)
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#worker-prefetch-multiplier
+# Generation tasks are long - don't let one worker reserve a queue's backlog
+# ahead of higher-priority messages.
+CELERY_WORKER_PREFETCH_MULTIPLIER = env.int("CELERY_WORKER_PREFETCH_MULTIPLIER", default=1)
+# https://docs.celeryq.dev/en/stable/userguide/routing.html#redis-message-priorities
+# Ten priority levels per queue, 0 consumed first.
+CELERY_BROKER_TRANSPORT_OPTIONS = {
+    "priority_steps": list(range(10)),
+    "sep": ":",
+    "queue_order_strategy": "priority",
+}
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#task-routes
+# Image generation is routed per call by subscription tier (see
+# GENERATION_QUEUE_CONFIG); periodic housekeeping gets its own queue so it
+# never shares workers with customer jobs. Run one worker per queue, e.g.
+#   CELERY_WORKER_QUEUES=generation_paid CELERY_WORKER_CONCURRENCY=8
+CELERY_TASK_ROUTES = {
+    "image_processing.tasks.cleanup_old_jobs": {"queue": "maintenance"},
+    "image_processing.tasks.cleanup_failed_jobs": {"queue": "maintenance"},
+    "usage_limits.tasks.*": {"queue": "maintenance"},
+    "saas_base.utils.counters.flush_buffered_counters": {"queue": "maintenance"},
+}
 
 # django-allauth
 # ------------------------------------------------------------------------------
@@ -419,6 +476,8 @@ GEMINI_MODEL = env("GEMINI_MODEL", default="gemini-2.5-flash-image-preview")
 GEMINI_API_CONFIG = {
     'timeout': 120,  # 2 minutes for image processing
     'max_retries': 3,
+    'client_max_age': 3600,  # Recycle the per-process client hourly
+    'client_max_failures': 3,  # Rebuild the client after this many failures in a row
     
     'safety_settings': [
         {
@@ -432,6 +491,76 @@ GEMINI_API_CONFIG = {
     ]
 }
 
+# 'sync' runs each Gemini call on its task's thread; 'async' sends it to a
+# per-process asyncio loop (image_processing.async_engine) so one worker
+# process can keep many calls in flight. Use async with the threads pool.
+GEMINI_EXECUTION_MODE = env("GEMINI_EXECUTION_MODE", default="sync")
+GEMINI_ASYNC_CONFIG = {
+    'max_in_flight': env.int("GEMINI_MAX_IN_FLIGHT", default=32),
+    'call_timeout': GEMINI_API_CONFIG['timeout'],
+}
+
+# Fleet-wide Gemini budget shared through Redis (see
+# image_processing.rate_limiter). Each call needs a token and a concurrency
+# slot; without one the job is rescheduled rather than holding its worker.
+# Throttled and failed jobs back off exponentially with jitter and honour
+# Retry-After.
+GEMINI_RATE_LIMIT = {
+    'enabled': env.bool("GEMINI_RATE_LIMIT_ENABLED", default=True),
+    'rpm': env.int("GEMINI_RPM", default=60),
+    'burst': env.int("GEMINI_RATE_BURST", default=10),
+    'max_concurrency': env.int("GEMINI_MAX_CONCURRENCY", default=10),
+    'slot_ttl': GEMINI_API_CONFIG['timeout'] + 60,
+}
+
+# Circuit breaker shared through Redis (see image_processing.services). Opens
+# on a high error rate or mostly-slow calls in the rolling window; while open,
+# jobs are parked and new submissions get a 503 instead of waiting on timeouts.
+GEMINI_CIRCUIT_BREAKER = {
+    'enabled': env.bool("GEMINI_CIRCUIT_BREAKER_ENABLED", default=True),
+    'failure_rate': env.float("GEMINI_CIRCUIT_FAILURE_RATE", default=0.5),
+    # Well under the generation tasks' soft time limit - a call the task
+    # limit kills first is never recorded as slow
+    'slow_call_seconds': env.int("GEMINI_CIRCUIT_SLOW_CALL_SECONDS", default=30),
+    'open_seconds': env.int("GEMINI_CIRCUIT_OPEN_SECONDS", default=60),
+    'probe_timeout': GEMINI_API_CONFIG['timeout'] + 60,
+}
+
+# Input images are downsampled and re-encoded before every Gemini call
+# (see image_processing.preprocessing)
+GEMINI_INPUT_PREPROCESSING = {
+    'enabled': env.bool("GEMINI_INPUT_PREPROCESSING_ENABLED", default=True),
+    'max_edge': env.int("GEMINI_INPUT_MAX_EDGE", default=1024),
+    'format': 'jpeg',
+    'quality': 90,
+    'cache': True,
+}
+
+# Reuse a previous output when the input images (by content hash), prompt
+# and model are identical (see image_processing.generation_cache).
+# Entries are small pointers stored in the default cache with a sliding TTL.
+GENERATION_CACHE = {
+    'enabled': env.bool("GENERATION_CACHE_ENABLED", default=False),
+    'ttl': env.int("GENERATION_CACHE_TTL", default=7 * 24 * 60 * 60),
+}
+
+# Queue routing for process_image_job by subscription tier (see
+# image_processing.queues). Redis priorities: 0 runs first.
+GENERATION_QUEUE_CONFIG = {
+    'paid_queue': env("GENERATION_PAID_QUEUE", default="generation_paid"),
+    'free_queue': env("GENERATION_FREE_QUEUE", default="generation_free"),
+}
+
+# Image derivatives
+# ------------------------------------------------------------------------------
+# Sizes (longest edge, px) generated after upload by
+# image_processing.tasks.generate_user_image_thumbnails
+IMAGE_THUMBNAIL_CONFIG = {
+    'sizes': {'small': 256, 'medium': 512, 'large': 1024},
+    'grid_size': 'medium',
+    'formats': ['webp', 'jpeg'],
+}
+
 SOCIALACCOUNT_PROVIDERS = {
     'google': {
         'APP': {
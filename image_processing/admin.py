@@ -11,12 +11,8 @@ from django.utils import timezone
 from datetime import timedelta
 
 from .models import (
-    UserImage, ImageProcessingJob, ProcessedImage, 
-    Collection, CollectionItem, Favorite, FavoriteUpload,
-    WEDDING_THEMES, SPACE_TYPES, COLOR_SCHEMES,
-    ENGAGEMENT_SETTINGS, ENGAGEMENT_ACTIVITIES,
-    WEDDING_MOMENTS, WEDDING_SETTINGS, ATTIRE_STYLES,
-    COMPOSITION_CHOICES, EMOTIONAL_TONE_CHOICES
+    UserImage, ImageProcessingJob, ImageProcessingBatch, ProcessedImage, 
+    Collection, CollectionItem, Favorite, FavoriteUpload, get_choice_label
 )
 
 User = get_user_model()
@@ -29,13 +25,14 @@ class ImageDisplayMixin:
     def image_thumbnail(self, obj):
         """Display thumbnail with link to full image"""
         if hasattr(obj, 'image') and obj.image:
+            preview_url = obj.thumbnail.url if getattr(obj, 'thumbnail', None) else obj.image.url
             return format_html(
                 '<a href="{}" target="_blank">'
                 '<img src="{}" style="max-width: 100px; max-height: 100px; border-radius: 4px;" '
                 'title="Click to view full size" />'
                 '</a>',
                 obj.image.url,
-                obj.image.url
+                preview_url
             )
         elif hasattr(obj, 'thumbnail') and obj.thumbnail:
             return format_html(
@@ -129,14 +126,14 @@ class UserImageAdmin(admin.ModelAdmin, ImageDisplayMixin):
             if job.custom_prompt:
                 description = f"Custom: {job.custom_prompt[:50]}..."
             elif job.studio_mode == 'venue':
-                theme = dict(WEDDING_THEMES).get(job.wedding_theme, job.wedding_theme)
-                space = dict(SPACE_TYPES).get(job.space_type, job.space_type) if job.space_type else 'N/A'
+                theme = get_choice_label('wedding_theme', job.wedding_theme)
+                space = get_choice_label('space_type', job.space_type) if job.space_type else 'N/A'
                 description = f"Venue: {theme} - {space}"
             elif job.studio_mode == 'portrait_engagement':
-                activity = dict(ENGAGEMENT_ACTIVITIES).get(job.engagement_activity, job.engagement_activity) if job.engagement_activity else 'N/A'
+                activity = get_choice_label('engagement_activity', job.engagement_activity) if job.engagement_activity else 'N/A'
                 description = f"Engagement: {activity}"
             else:  # portrait_wedding
-                moment = dict(WEDDING_MOMENTS).get(job.wedding_moment, job.wedding_moment) if job.wedding_moment else 'N/A'
+                moment = get_choice_label('wedding_moment', job.wedding_moment) if job.wedding_moment else 'N/A'
                 description = f"Wedding: {moment}"
             
             processed_count = job.processed_images.count()
@@ -203,13 +200,13 @@ class ImageProcessingJobAdmin(admin.ModelAdmin):
             return format_html('<span title="Custom prompt">Custom 📝</span>')
         
         if obj.studio_mode == 'venue':
-            theme = dict(WEDDING_THEMES).get(obj.wedding_theme, obj.wedding_theme or 'N/A')
+            theme = get_choice_label('wedding_theme', obj.wedding_theme, obj.wedding_theme or 'N/A')
             return format_html('<span title="{}">Venue</span>', theme)
         elif obj.studio_mode == 'portrait_engagement':
-            activity = dict(ENGAGEMENT_ACTIVITIES).get(obj.engagement_activity, obj.engagement_activity or 'N/A')
+            activity = get_choice_label('engagement_activity', obj.engagement_activity, obj.engagement_activity or 'N/A')
             return format_html('<span title="{}">Activity</span>', activity)
         else:  # portrait_wedding
-            moment = dict(WEDDING_MOMENTS).get(obj.wedding_moment, obj.wedding_moment or 'N/A')
+            moment = get_choice_label('wedding_moment', obj.wedding_moment, obj.wedding_moment or 'N/A')
             return format_html('<span title="{}">Moment</span>', moment)
     
     mode_details.short_description = "Details"
@@ -246,42 +243,42 @@ class ImageProcessingJobAdmin(admin.ModelAdmin):
         else:
             if obj.studio_mode == 'venue':
                 html += '<div style="margin-bottom: 10px;"><strong>Venue Mode:</strong></div>'
-                html += f'<div><strong>Theme:</strong> {dict(WEDDING_THEMES).get(obj.wedding_theme, obj.wedding_theme or "N/A")}</div>'
+                html += f'<div><strong>Theme:</strong> {get_choice_label("wedding_theme", obj.wedding_theme, obj.wedding_theme or "N/A")}</div>'
                 if obj.space_type:
-                    html += f'<div><strong>Space:</strong> {dict(SPACE_TYPES).get(obj.space_type, obj.space_type)}</div>'
+                    html += f'<div><strong>Space:</strong> {get_choice_label("space_type", obj.space_type)}</div>'
             
             elif obj.studio_mode == 'portrait_engagement':
                 html += '<div style="margin-bottom: 10px;"><strong>Engagement Portrait Mode:</strong></div>'
                 if obj.engagement_activity:
-                    html += f'<div><strong>Activity:</strong> {dict(ENGAGEMENT_ACTIVITIES).get(obj.engagement_activity, obj.engagement_activity)}</div>'
+                    html += f'<div><strong>Activity:</strong> {get_choice_label("engagement_activity", obj.engagement_activity)}</div>'
                 if obj.engagement_setting:
-                    html += f'<div><strong>Setting:</strong> {dict(ENGAGEMENT_SETTINGS).get(obj.engagement_setting, obj.engagement_setting)}</div>'
+                    html += f'<div><strong>Setting:</strong> {get_choice_label("engagement_setting", obj.engagement_setting)}</div>'
                 if obj.attire_style:
-                    html += f'<div><strong>Attire:</strong> {dict(ATTIRE_STYLES).get(obj.attire_style, obj.attire_style)}</div>'
+                    html += f'<div><strong>Attire:</strong> {get_choice_label("attire_style", obj.attire_style)}</div>'
             
             else:  # portrait_wedding
                 html += '<div style="margin-bottom: 10px;"><strong>Wedding Portrait Mode:</strong></div>'
                 if obj.wedding_moment:
-                    html += f'<div><strong>Moment:</strong> {dict(WEDDING_MOMENTS).get(obj.wedding_moment, obj.wedding_moment)}</div>'
+                    html += f'<div><strong>Moment:</strong> {get_choice_label("wedding_moment", obj.wedding_moment)}</div>'
                 if obj.wedding_setting:
-                    html += f'<div><strong>Setting:</strong> {dict(WEDDING_SETTINGS).get(obj.wedding_setting, obj.wedding_setting)}</div>'
+                    html += f'<div><strong>Setting:</strong> {get_choice_label("wedding_setting", obj.wedding_setting)}</div>'
                 if obj.attire_style:
-                    html += f'<div><strong>Attire:</strong> {dict(ATTIRE_STYLES).get(obj.attire_style, obj.attire_style)}</div>'
+                    html += f'<div><strong>Attire:</strong> {get_choice_label("attire_style", obj.attire_style)}</div>'
             
             # Shared fields
             html += '<div style="margin-top: 10px; padding-top: 10px; border-top: 1px solid #dee2e6;">'
             html += '<strong>Additional Options:</strong>'
             
             if obj.composition:
-                html += f'<div><strong>Composition:</strong> {dict(COMPOSITION_CHOICES).get(obj.composition, obj.composition)}</div>'
+                html += f'<div><strong>Composition:</strong> {get_choice_label("composition", obj.composition)}</div>'
             if obj.emotional_tone:
-                html += f'<div><strong>Emotional Tone:</strong> {dict(EMOTIONAL_TONE_CHOICES).get(obj.emotional_tone, obj.emotional_tone)}</div>'
+                html += f'<div><strong>Emotional Tone:</strong> {get_choice_label("emotional_tone", obj.emotional_tone)}</div>'
             if obj.season:
                 html += f'<div><strong>Season:</strong> {obj.season.title()}</div>'
             if obj.lighting_mood:
                 html += f'<div><strong>Lighting:</strong> {obj.lighting_mood.replace("_", " ").title()}</div>'
             if obj.color_scheme:
-                html += f'<div><strong>Color Scheme:</strong> {dict(COLOR_SCHEMES).get(obj.color_scheme, obj.color_scheme)}</div>'
+                html += f'<div><strong>Color Scheme:</strong> {get_choice_label("color_scheme", obj.color_scheme)}</div>'
             html += '</div>'
         
         if obj.user_instructions:
@@ -415,6 +412,22 @@ class ProcessedImageAdmin(admin.ModelAdmin, ImageDisplayMixin):
     job_details.short_description = "Job Info"
 
 
+# Batch Studio Admin
+@admin.register(ImageProcessingBatch)
+class ImageProcessingBatchAdmin(admin.ModelAdmin):
+    list_display = ['id', 'user_link', 'status', 'total_jobs', 'completed_jobs', 'failed_jobs', 'created_at', 'completed_at']
+    list_filter = ['status', 'created_at']
+    search_fields = ['user__username', 'user__email']
+    readonly_fields = ['total_jobs', 'completed_jobs', 'failed_jobs', 'created_at', 'completed_at']
+    ordering = ['-created_at']
+    list_select_related = ['user']
+    
+    def user_link(self, obj):
+        url = reverse('admin:users_user_change', args=[obj.user.pk])
+        return format_html('<a href="{}">{}</a>', url, obj.user.username)
+    user_link.short_description = "User"
+
+
 # Favorite Uploads Admin (star icon)
 @admin.register(FavoriteUpload)
 class FavoriteUploadAdmin(admin.ModelAdmin):
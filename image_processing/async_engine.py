@@ -0,0 +1,133 @@
+# image_processing/async_engine.py - Shared asyncio loop for concurrent Gemini calls
+
+import asyncio
+import logging
+import os
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+class GeminiAsyncEngine:
+    """
+    One asyncio event loop per worker process, running in a background thread.
+
+    Celery task threads hand their Gemini call to the loop and wait on the
+    result, so a single process (run with the threads pool) keeps many
+    generate_content calls in flight on one shared HTTP client instead of
+    tying up a whole prefork process per call.
+
+    - max_in_flight: calls allowed on the wire at once (extra calls queue).
+      Each task thread blocks on its calls, so the worker needs about this
+      many threads to reach it - CELERY_WORKER_CONCURRENCY defaults to it
+    - call_timeout: per-call deadline, enforced inside the loop
+    - cancellation: if the waiting task thread is interrupted, the in-flight
+      call is cancelled instead of being left to finish on its own
+    """
+    _instance = None
+    _pid = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None or cls._pid != os.getpid():
+            with cls._lock:
+                if cls._instance is None or cls._pid != os.getpid():
+                    cls._instance = cls()
+                    cls._pid = os.getpid()
+        return cls._instance
+
+    @classmethod
+    def reset(cls):
+        """The loop thread does not survive a fork - start a fresh engine in the child"""
+        cls._instance = None
+        cls._pid = None
+        cls._lock = threading.Lock()
+
+    def __init__(self):
+        config = getattr(settings, 'GEMINI_ASYNC_CONFIG', {})
+        self.max_in_flight = config.get('max_in_flight', 32)
+        self.call_timeout = config.get('call_timeout', settings.GEMINI_API_CONFIG.get('timeout', 120))
+        self.in_flight = 0
+
+        self._loop = asyncio.new_event_loop()
+        self._semaphore = asyncio.Semaphore(self.max_in_flight)
+        self._thread = threading.Thread(
+            target=self._run_loop,
+            name='gemini-async-engine',
+            daemon=True,
+        )
+        self._thread.start()
+
+        logger.info(
+            f"Gemini async engine started for process {os.getpid()} "
+            f"(max_in_flight={self.max_in_flight}, call_timeout={self.call_timeout}s)"
+        )
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    async def _generate(self, client, model, contents, config):
+        async with self._semaphore:
+            self.in_flight += 1
+            try:
+                return await client.aio.models.generate_content(model=model, contents=contents, config=config)
+            finally:
+                self.in_flight -= 1
+
+    def generate_content(self, client, model, contents, config, timeout=None):
+        """
+        Run client.aio.models.generate_content on the shared loop and block
+        the calling thread until it finishes.
+
+        Raises:
+            TimeoutError: if the call exceeds the timeout (queue wait included)
+        """
+        timeout = timeout or self.call_timeout
+        future = asyncio.run_coroutine_threadsafe(
+            asyncio.wait_for(self._generate(client, model, contents, config), timeout=timeout),
+            self._loop,
+        )
+        return self._wait(future, timeout)
+
+    def generate_content_many(self, client, model, contents, config, count, timeout=None):
+        """
+        Run `count` identical calls concurrently (one per output variation)
+        and block until all of them finish.
+
+        Each call has its own deadline. Results come back in call order, with
+        the raised exception in place of any call that failed.
+        """
+        timeout = timeout or self.call_timeout
+
+        async def gather():
+            return await asyncio.gather(
+                *[
+                    asyncio.wait_for(self._generate(client, model, contents, config), timeout=timeout)
+                    for _ in range(count)
+                ],
+                return_exceptions=True,
+            )
+
+        future = asyncio.run_coroutine_threadsafe(gather(), self._loop)
+        return self._wait(future, timeout)
+
+    def _wait(self, future, timeout):
+        try:
+            # Small grace period so the in-loop wait_for fires first
+            return future.result(timeout=timeout + 5)
+        except (asyncio.TimeoutError, FutureTimeoutError) as e:
+            future.cancel()
+            raise TimeoutError(f"Gemini call exceeded {timeout}s") from e
+        except BaseException:
+            # Soft time limit, worker shutdown, revoke - don't leave the call running
+            future.cancel()
+            raise
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=GeminiAsyncEngine.reset)
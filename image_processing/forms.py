@@ -4,11 +4,9 @@ from django import forms
 from django.core.exceptions import ValidationError
 from .models import (
     UserImage, ImageProcessingJob,
-    WEDDING_THEMES, SPACE_TYPES, COLOR_SCHEMES,
-    ENGAGEMENT_SETTINGS, ENGAGEMENT_ACTIVITIES,
-    WEDDING_MOMENTS, WEDDING_SETTINGS, ATTIRE_STYLES,
+    SPACE_TYPES, ENGAGEMENT_ACTIVITIES,
     COMPOSITION_CHOICES, EMOTIONAL_TONE_CHOICES,
-    SEASONS, LIGHTING_MOODS
+    SEASONS, LIGHTING_MOODS, SORTED_CHOICES
 )
 
 # Essential Choices
@@ -163,7 +161,7 @@ class UnifiedStudioForm(forms.ModelForm):
     )
     
     color_scheme = forms.ChoiceField(
-        choices=[('', 'Theme default')] + list(COLOR_SCHEMES),
+        choices=[('', 'Theme default')] + list(SORTED_CHOICES['color_scheme']),
         required=False,
         widget=forms.Select(attrs={
             'class': 'form-select form-select-sm',
@@ -250,19 +248,13 @@ class UnifiedStudioForm(forms.ModelForm):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         
-        # Sort choices alphabetically (except 'na' which stays at end)
-        def sort_with_na(choices):
-            """Sort choices but keep 'na' at the end"""
-            regular = [(k, v) for k, v in choices if k != 'na']
-            na_option = [(k, v) for k, v in choices if k == 'na']
-            return sorted(regular, key=lambda x: x[1]) + na_option
-        
-        sorted_wedding_themes = sort_with_na(WEDDING_THEMES)
-        sorted_engagement_settings = sort_with_na(ENGAGEMENT_SETTINGS)
-        sorted_wedding_moments = sort_with_na(WEDDING_MOMENTS)
-        sorted_wedding_settings = sort_with_na(WEDDING_SETTINGS)
-        sorted_attire = sort_with_na(ATTIRE_STYLES)
-        sorted_color_schemes = sort_with_na(COLOR_SCHEMES)
+        # Pre-sorted alphabetically ('na' last) once at import
+        sorted_wedding_themes = SORTED_CHOICES['wedding_theme']
+        sorted_engagement_settings = SORTED_CHOICES['engagement_setting']
+        sorted_wedding_moments = SORTED_CHOICES['wedding_moment']
+        sorted_wedding_settings = SORTED_CHOICES['wedding_setting']
+        sorted_attire = SORTED_CHOICES['attire_style']
+        sorted_color_schemes = SORTED_CHOICES['color_scheme']
         
         # Setup venue mode choices
         self.fields['wedding_theme'].choices = [('', 'Choose your wedding style...')] + list(sorted_wedding_themes)
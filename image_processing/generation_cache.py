@@ -0,0 +1,121 @@
+# image_processing/generation_cache.py - Reuse Gemini outputs for identical requests
+
+import hashlib
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+# Defaults - override with GENERATION_CACHE in settings
+DEFAULT_GENERATION_CACHE_CONFIG = {
+    'enabled': False,
+    'ttl': 7 * 24 * 60 * 60,  # Sliding - refreshed on every hit
+    'key_prefix': 'gen_result',
+}
+
+
+def get_generation_cache_config():
+    """Merge settings overrides on top of the defaults"""
+    config = dict(DEFAULT_GENERATION_CACHE_CONFIG)
+    config.update(getattr(settings, 'GENERATION_CACHE', {}))
+    return config
+
+
+def build_cache_key(input_images, prompt, model=None, output_count=1):
+    """
+    Cache key for a generation request.
+
+    Keyed on the content hashes of the input images (in order), the final
+    prompt, the Gemini model and the number of outputs, so the same photos +
+    settings map to the same entry regardless of which UserImage rows they
+    came from.
+
+    Returns:
+        str or None: Cache key, or None when the cache is disabled
+    """
+    config = get_generation_cache_config()
+    if not config['enabled']:
+        return None
+
+    model = model or settings.GEMINI_MODEL
+    hashes = [img.ensure_content_hash() for img in input_images]
+
+    digest = hashlib.sha256()
+    for part in [model, prompt or '', str(output_count)] + hashes:
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+
+    return f"{config['key_prefix']}:{digest.hexdigest()}"
+
+
+def get_cached_result(cache_key):
+    """
+    Look up a previous output for this key.
+
+    Entries only hold the storage paths of earlier ProcessedImages; the bytes
+    are read back so the caller can save them as new ProcessedImages.
+    Any missing file is treated as a miss and evicts the entry.
+
+    Returns:
+        dict or None: Same shape as GeminiImageService results, plus 'cached': True
+    """
+    if not cache_key:
+        return None
+
+    entry = cache.get(cache_key)
+    if not entry:
+        return None
+
+    from django.core.files.storage import default_storage
+
+    images = []
+    try:
+        for output in entry['outputs']:
+            with default_storage.open(output['path'], 'rb') as cached_file:
+                images.append({
+                    'image_data': cached_file.read(),
+                    'finish_reason': output.get('finish_reason', 'STOP'),
+                })
+    except Exception as e:
+        logger.info(f"Cached generation output gone, evicting {cache_key}: {str(e)}")
+        cache.delete(cache_key)
+        return None
+
+    # Sliding expiry: entries that keep getting hit stay, idle ones age out
+    cache.touch(cache_key, get_generation_cache_config()['ttl'])
+
+    logger.info(f"Generation cache hit: {cache_key}")
+    return {
+        'success': True,
+        'image_data': images[0]['image_data'],
+        'images': images,
+        'model': entry.get('model'),
+        'finish_reason': images[0]['finish_reason'],
+        'cached': True,
+    }
+
+
+def store_result(cache_key, processed_images):
+    """Remember freshly generated ProcessedImages for future identical requests"""
+    if not cache_key or not processed_images:
+        return
+
+    try:
+        cache.set(
+            cache_key,
+            {
+                'model': processed_images[0].gemini_model,
+                'outputs': [
+                    {
+                        'path': processed_image.processed_image.name,
+                        'finish_reason': processed_image.finish_reason,
+                    }
+                    for processed_image in processed_images
+                ],
+            },
+            get_generation_cache_config()['ttl'],
+        )
+    except Exception as e:
+        logger.warning(f"Could not store generation result {cache_key}: {str(e)}")
@@ -0,0 +1,93 @@
+# image_processing/job_events.py - Job status state in Redis for cheap polling
+
+import json
+import logging
+
+from django.conf import settings
+
+from usage_limits.redis_client import RedisClient
+
+logger = logging.getLogger(__name__)
+
+# Defaults - override with JOB_EVENTS_CONFIG in settings
+DEFAULT_JOB_EVENTS_CONFIG = {
+    'key_prefix': 'job_events',
+    'state_ttl': 60 * 60,        # Last known status kept for pollers
+}
+
+TERMINAL_STATUSES = ('completed', 'failed')
+
+
+def get_job_events_config():
+    """Merge settings overrides on top of the defaults"""
+    config = dict(DEFAULT_JOB_EVENTS_CONFIG)
+    config.update(getattr(settings, 'JOB_EVENTS_CONFIG', {}))
+    return config
+
+
+def _state_key(job_id):
+    return f"{get_job_events_config()['key_prefix']}:state:{job_id}"
+
+
+def build_job_event(job, processed_images=None):
+    """
+    Status payload for a job - everything the studio needs to update the
+    page, so pollers never have to query the database.
+    """
+    event = {
+        'job_id': job.id,
+        'user_id': job.user_image.user_id,
+        'status': job.status,
+        'mode': job.studio_mode,
+    }
+
+    if job.status == 'completed':
+        event['completed_at'] = job.completed_at.isoformat() if job.completed_at else None
+        event['results'] = [
+            {
+                'id': processed_img.id,
+                'image_url': processed_img.processed_image.url,
+                'width': processed_img.width,
+                'height': processed_img.height,
+                'file_size': processed_img.file_size,
+                'gemini_model': processed_img.gemini_model,
+                'is_favorited': False,
+            }
+            for processed_img in (processed_images or [])
+        ]
+        if event['results']:
+            event['result'] = event['results'][0]
+    elif job.status == 'failed':
+        event['error_message'] = job.error_message
+    elif job.status == 'processing':
+        event['started_at'] = job.started_at.isoformat() if job.started_at else None
+
+    return event
+
+
+def publish_job_status(job, processed_images=None):
+    """
+    Record the job's current status for pollers.
+    Never raises - status pushes are best effort, the database stays the
+    source of truth.
+    """
+    try:
+        event = build_job_event(job, processed_images)
+        payload = json.dumps(event)
+
+        RedisClient.get_client().set(_state_key(job.id), payload, ex=get_job_events_config()['state_ttl'])
+
+        logger.debug(f"Published job {job.id} status: {job.status}")
+    except Exception as e:
+        logger.warning(f"Could not publish status for job {job.id}: {str(e)}")
+
+
+def get_job_event(job_id):
+    """Last published event for a job, or None if nothing is recorded"""
+    try:
+        raw = RedisClient.get_client().get(_state_key(job_id))
+        return json.loads(raw) if raw else None
+    except Exception as e:
+        logger.warning(f"Could not read status event for job {job_id}: {str(e)}")
+        return None
+
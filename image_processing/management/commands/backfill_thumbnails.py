@@ -0,0 +1,84 @@
+# image_processing/management/commands/backfill_thumbnails.py
+"""
+Backfill thumbnail/WebP derivatives for existing UserImage rows.
+Queues Celery tasks by default; use --sync to generate inline.
+"""
+
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from image_processing.models import UserImage
+from image_processing.tasks import generate_user_image_thumbnails
+from image_processing.thumbnails import generate_derivatives
+
+
+class Command(BaseCommand):
+    help = 'Generate missing thumbnails and derivatives for uploaded images'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--user-id',
+            type=int,
+            help='Only backfill images for this user ID',
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Regenerate derivatives even if they already exist',
+        )
+        parser.add_argument(
+            '--sync',
+            action='store_true',
+            help='Generate inline instead of queueing Celery tasks',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Rows fetched per database round-trip (default: 500)',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Show how many images would be processed without doing anything',
+        )
+
+    def handle(self, *args, **options):
+        images = UserImage.objects.exclude(image='')
+
+        if options['user_id']:
+            images = images.filter(user_id=options['user_id'])
+
+        if not options['force']:
+            images = images.filter(
+                Q(thumbnail__isnull=True) | Q(thumbnail='') | Q(derivatives={})
+            )
+
+        total = images.count()
+        self.stdout.write(f"Found {total} image(s) needing derivatives")
+
+        if options['dry_run'] or total == 0:
+            return
+
+        processed = 0
+        errors = 0
+
+        for image_id in images.order_by('id').values_list('id', flat=True).iterator(chunk_size=options['batch_size']):
+            if not options['sync']:
+                generate_user_image_thumbnails.delay(image_id, force=options['force'])
+                processed += 1
+                continue
+
+            try:
+                user_image = UserImage.objects.get(id=image_id)
+                generate_derivatives(user_image, force=options['force'])
+                processed += 1
+            except Exception as e:
+                errors += 1
+                self.stdout.write(self.style.WARNING(f"✗ Image {image_id}: {str(e)}"))
+
+            if processed and processed % 100 == 0:
+                self.stdout.write(f"  ...{processed}/{total}")
+
+        verb = 'Generated' if options['sync'] else 'Queued'
+        self.stdout.write(self.style.SUCCESS(f"✓ {verb} derivatives for {processed} image(s), {errors} error(s)"))
@@ -0,0 +1,78 @@
+# image_processing/management/commands/benchmark_prompts.py
+"""
+Benchmark guided prompt generation across random studio choice combinations.
+Reports cold (first build) and warm (memoized) timings per prompt.
+"""
+
+import random
+import time
+
+from django.core.management.base import BaseCommand
+
+from image_processing.models import CHOICE_LABELS
+from image_processing.prompt_generator import PortraitPromptGenerator, VenuePromptGenerator
+
+
+class Command(BaseCommand):
+    help = 'Measure per-prompt generation time for guided studio prompts'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--jobs',
+            type=int,
+            default=5000,
+            help='Number of prompts to generate per pass (default: 5000)',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='Random seed for choice combinations (default: 0)',
+        )
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        choices = {field: list(labels) for field, labels in CHOICE_LABELS.items()}
+
+        def pick(field):
+            return rng.choice(choices[field])
+
+        calls = []
+        for i in range(options['jobs']):
+            mode = ('venue', 'portrait_engagement', 'portrait_wedding')[i % 3]
+            instructions = 'Add more candles' if i % 2 else None
+            if mode == 'venue':
+                calls.append((VenuePromptGenerator.generate_prompt, dict(
+                    wedding_theme=pick('wedding_theme'), space_type=pick('space_type'),
+                    season=pick('season'), lighting_mood=pick('lighting_mood'),
+                    color_scheme=pick('color_scheme'), user_instructions=instructions,
+                )))
+            else:
+                calls.append((PortraitPromptGenerator.generate_prompt, dict(
+                    studio_mode=mode,
+                    engagement_setting=pick('engagement_setting'),
+                    engagement_activity=pick('engagement_activity'),
+                    wedding_moment=pick('wedding_moment'), wedding_setting=pick('wedding_setting'),
+                    attire_style=pick('attire_style'), composition=pick('composition'),
+                    emotional_tone=pick('emotional_tone'), season=pick('season'),
+                    lighting_mood=pick('lighting_mood'), color_scheme=pick('color_scheme'),
+                    user_instructions=instructions,
+                )))
+
+        VenuePromptGenerator._guided_prompt_body.cache_clear()
+        PortraitPromptGenerator._guided_prompt_body.cache_clear()
+
+        for label in ('cold', 'warm'):
+            started = time.perf_counter()
+            for generate, kwargs in calls:
+                generate(**kwargs)
+            elapsed = time.perf_counter() - started
+            per_prompt_us = elapsed / len(calls) * 1_000_000
+            self.stdout.write(f"{label}: {len(calls)} prompts in {elapsed * 1000:.1f}ms ({per_prompt_us:.1f}µs/prompt)")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"✓ Venue cache: {VenuePromptGenerator._guided_prompt_body.cache_info()}"
+        ))
+        self.stdout.write(self.style.SUCCESS(
+            f"✓ Portrait cache: {PortraitPromptGenerator._guided_prompt_body.cache_info()}"
+        ))
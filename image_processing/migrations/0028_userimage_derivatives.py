@@ -0,0 +1,18 @@
+# Generated by Django 5.1.8 on 2026-10-16 20:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('image_processing', '0027_remove_imageprocessingjob_photo_theme_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userimage',
+            name='derivatives',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
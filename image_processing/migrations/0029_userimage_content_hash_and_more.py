@@ -0,0 +1,24 @@
+# Generated by Django 5.1.8 on 2026-10-16 20:48
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('image_processing', '0028_userimage_derivatives'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userimage',
+            name='content_hash',
+            field=models.CharField(blank=True, default='', help_text='SHA-256 of the stored image (after EXIF correction)', max_length=64),
+        ),
+        migrations.AddIndex(
+            model_name='userimage',
+            index=models.Index(fields=['user', 'content_hash'], name='image_proce_user_id_e91bbb_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.8 on 2026-10-16 20:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('image_processing', '0029_userimage_content_hash_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='imageprocessingjob',
+            name='output_count',
+            field=models.PositiveSmallIntegerField(default=1),
+        ),
+    ]
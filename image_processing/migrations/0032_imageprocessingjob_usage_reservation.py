@@ -0,0 +1,18 @@
+# Generated by Django 5.1.8 on 2026-10-16 23:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('image_processing', '0031_imageprocessingbatch_imageprocessingjob_batch'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='imageprocessingjob',
+            name='usage_reservation',
+            field=models.CharField(blank=True, default='', max_length=32),
+        ),
+    ]
@@ -1,9 +1,11 @@
 # image_processing/models.py - UPDATED with Composition, Emotional Tone, Activities, and Wedding Moments
 
+import hashlib
 import os
 import uuid
 from datetime import timedelta
-from django.db import models
+from types import MappingProxyType
+from django.db import models, transaction
 from django.conf import settings
 from django.urls import reverse
 from django.utils import timezone
@@ -23,6 +25,15 @@ def user_image_upload_path(instance, filename):
     return f"user_images/{instance.user.id}/{filename}"
 
 
+def compute_content_hash(file_obj):
+    """SHA-256 of a file's contents, read in chunks so large uploads aren't loaded at once"""
+    digest = hashlib.sha256()
+    for chunk in file_obj.chunks():
+        digest.update(chunk)
+    file_obj.seek(0)
+    return digest.hexdigest()
+
+
 def processed_image_upload_path(instance, filename):
     """Generate upload path for processed images - preserves human-readable filename"""
     import os
@@ -734,6 +745,58 @@ COLOR_SCHEMES = [
 ]
 
 
+# ==================== CHOICE LABEL REGISTRY ====================
+
+# Built once at import, keyed by ImageProcessingJob field name. Use
+# get_choice_label() instead of dict(CHOICES).get(...) so views, tasks and
+# admin never rebuild these per job or per request.
+_CHOICE_LISTS = {
+    'wedding_theme': WEDDING_THEMES,
+    'space_type': SPACE_TYPES,
+    'engagement_setting': ENGAGEMENT_SETTINGS,
+    'engagement_activity': ENGAGEMENT_ACTIVITIES,
+    'wedding_moment': WEDDING_MOMENTS,
+    'wedding_setting': WEDDING_SETTINGS,
+    'attire_style': ATTIRE_STYLES,
+    'composition': COMPOSITION_CHOICES,
+    'emotional_tone': EMOTIONAL_TONE_CHOICES,
+    'season': SEASONS,
+    'lighting_mood': LIGHTING_MOODS,
+    'color_scheme': COLOR_SCHEMES,
+}
+
+CHOICE_LABELS = MappingProxyType({
+    field_name: MappingProxyType(dict(choices))
+    for field_name, choices in _CHOICE_LISTS.items()
+})
+
+
+def _sort_with_na_last(choices):
+    """Sort choices by label, keeping 'na' at the end"""
+    regular = sorted((choice for choice in choices if choice[0] != 'na'), key=lambda choice: choice[1])
+    return tuple(regular) + tuple(choice for choice in choices if choice[0] == 'na')
+
+
+# Alphabetical by label ('na' last), for the studio dropdowns and forms
+SORTED_CHOICES = MappingProxyType({
+    field_name: _sort_with_na_last(choices)
+    for field_name, choices in _CHOICE_LISTS.items()
+})
+
+_NO_DEFAULT = object()
+
+
+def get_choice_label(field_name, value, default=_NO_DEFAULT):
+    """
+    Display label for a stored choice value.
+    
+    Falls back to the raw value (or `default` if given) for unknown values.
+    """
+    if default is _NO_DEFAULT:
+        default = value
+    return CHOICE_LABELS[field_name].get(value, default)
+
+
 # ==================== MODELS ====================
 
 class UserImage(models.Model):
@@ -749,6 +812,9 @@ class UserImage(models.Model):
     image = models.ImageField(upload_to=user_image_upload_path)
     thumbnail = models.ImageField(upload_to='thumbnails/', blank=True, null=True)
     
+    # Resized copies keyed by size then format, e.g. {'small': {'webp': 'thumbnails/...'}}
+    derivatives = models.JSONField(default=dict, blank=True)
+    
     # Image classification
     image_type = models.CharField(max_length=20, choices=IMAGE_TYPE_CHOICES, default='venue')
     
@@ -761,11 +827,15 @@ class UserImage(models.Model):
     file_size = models.PositiveIntegerField(help_text="Size in bytes")
     width = models.PositiveIntegerField()
     height = models.PositiveIntegerField()
+    content_hash = models.CharField(max_length=64, blank=True, default='', help_text="SHA-256 of the stored image (after EXIF correction)")
     
     uploaded_at = models.DateTimeField(auto_now_add=True)
     
     class Meta:
         ordering = ['-uploaded_at']
+        indexes = [
+            models.Index(fields=['user', 'content_hash']),
+        ]
     
     def __str__(self):
         return f"{self.user.username} - {self.original_filename}"
@@ -783,6 +853,121 @@ class UserImage(models.Model):
                 self.file_size = getattr(self.image, 'size', 0) or 0
         
         super().save(*args, **kwargs)
+    
+    def reuse_stored_upload(self):
+        """
+        Point this row at an identical image the same user already uploaded.
+        Copies the stored blob, dimensions and derivatives, so nothing is
+        written to storage or decoded again.
+        
+        Returns:
+            bool: True if an existing upload was reused
+        """
+        if not self.content_hash:
+            return False
+        
+        existing = UserImage.objects.filter(
+            user_id=self.user_id,
+            content_hash=self.content_hash
+        ).exclude(image='').order_by('-uploaded_at').first()
+        
+        if not existing:
+            return False
+        
+        self.image = existing.image.name
+        self.thumbnail = existing.thumbnail.name if existing.thumbnail else None
+        self.derivatives = dict(existing.derivatives or {})
+        self.width = existing.width
+        self.height = existing.height
+        self.file_size = existing.file_size
+        return True
+    
+    def ensure_content_hash(self):
+        """Hash the stored image for rows uploaded before content hashing existed"""
+        if not self.content_hash and self.image:
+            with self.image.open('rb') as image_file:
+                self.content_hash = compute_content_hash(image_file)
+            self.save(update_fields=['content_hash'])
+        return self.content_hash
+    
+    def merge_derivatives(self, entries, thumbnail=None):
+        """
+        Add `entries` to derivatives (and optionally set the thumbnail path).
+        The row is re-read under a lock and merged into, so keys written
+        meanwhile by another task (thumbnails vs cached model inputs) are kept.
+        
+        Returns:
+            set: Storage paths the row pointed at before and no longer does
+        """
+        with transaction.atomic():
+            current = UserImage.objects.select_for_update().only('derivatives', 'thumbnail').get(pk=self.pk)
+            derivatives = dict(current.derivatives or {})
+            
+            replaced = set()
+            for name in entries:
+                replaced.update((derivatives.get(name) or {}).values())
+            derivatives.update(entries)
+            
+            updates = {'derivatives': derivatives}
+            if thumbnail is not None:
+                updates['thumbnail'] = thumbnail
+                if current.thumbnail:
+                    replaced.add(current.thumbnail.name)
+            UserImage.objects.filter(pk=self.pk).update(**updates)
+        
+        self.derivatives = derivatives
+        if thumbnail is not None:
+            self.thumbnail.name = thumbnail
+        
+        current_paths = {path for entry in derivatives.values() for path in entry.values()}
+        current_paths.add(thumbnail)
+        return replaced - current_paths
+    
+    @property
+    def thumbnail_url(self):
+        """Grid-sized thumbnail URL, falling back to the original until derivatives exist"""
+        return self.thumbnail.url if self.thumbnail else self.image.url
+    
+    def get_derivative_url(self, size='medium', image_format='webp'):
+        """URL for a specific derivative size/format, or the original if it hasn't been generated"""
+        from django.core.files.storage import default_storage
+        
+        path = (self.derivatives or {}).get(size, {}).get(image_format)
+        return default_storage.url(path) if path else self.image.url
+    
+    def get_derivative_srcset(self, image_format='webp'):
+        """
+        srcset value ("<url> 256w, <url> 512w, ...") covering every generated
+        size in one format, or '' until derivatives exist.
+        """
+        from .thumbnails import get_thumbnail_config
+        
+        longest_edge = max(self.width or 0, self.height or 0)
+        sizes = sorted(get_thumbnail_config()['sizes'].items(), key=lambda item: item[1])
+        
+        candidates = []
+        seen_widths = set()
+        for size_name, max_edge in sizes:
+            if image_format not in (self.derivatives or {}).get(size_name, {}):
+                continue
+            # Derivatives are never upscaled, so small originals repeat the same width
+            if longest_edge and max_edge < longest_edge:
+                width = round(self.width * max_edge / longest_edge)
+            else:
+                width = self.width or max_edge
+            if width in seen_widths:
+                continue
+            seen_widths.add(width)
+            candidates.append(f"{self.get_derivative_url(size_name, image_format)} {width}w")
+        return ', '.join(candidates)
+    
+    @property
+    def webp_srcset(self):
+        return self.get_derivative_srcset('webp')
+    
+    @property
+    def jpeg_srcset(self):
+        return self.get_derivative_srcset('jpeg')
 
 
 class FavoriteUpload(models.Model):
@@ -810,6 +995,43 @@ class FavoriteUpload(models.Model):
         self.save(update_fields=['times_used', 'last_used'])
 
 
+class ImageProcessingBatch(models.Model):
+    """Jobs submitted together through the batch studio endpoint, tracked as one unit"""
+    
+    STATUS_CHOICES = [
+        ('processing', 'Processing'),
+        ('completed', 'Completed'),
+        ('failed', 'Failed'),
+    ]
+    
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='processing_batches')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='processing')
+    
+    total_jobs = models.PositiveIntegerField()
+    
+    # Final tally, written once by the chord callback when every job has finished
+    completed_jobs = models.PositiveIntegerField(default=0)
+    failed_jobs = models.PositiveIntegerField(default=0)
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    completed_at = models.DateTimeField(blank=True, null=True)
+    
+    class Meta:
+        ordering = ['-created_at']
+    
+    def __str__(self):
+        return f"Batch {self.id} - {self.total_jobs} jobs ({self.status})"
+    
+    def job_counts(self):
+        """Count this batch's jobs per status in one query"""
+        return self.jobs.aggregate(
+            pending=models.Count('id', filter=models.Q(status='pending')),
+            processing=models.Count('id', filter=models.Q(status='processing')),
+            completed=models.Count('id', filter=models.Q(status='completed')),
+            failed=models.Count('id', filter=models.Q(status='failed')),
+        )
+
+
 class ImageProcessingJob(models.Model):
     """Processing jobs - supports venue, wedding portrait, and engagement portrait modes"""
     
@@ -868,6 +1090,21 @@ class ImageProcessingJob(models.Model):
     # Generated final prompt (cached)
     generated_prompt = models.TextField(blank=True, null=True)
     
+    # Number of variations to generate (each one costs a credit)
+    output_count = models.PositiveSmallIntegerField(default=1)
+    
+    # Set when submitted through the batch studio endpoint
+    batch = models.ForeignKey(
+        ImageProcessingBatch,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='jobs'
+    )
+    
+    # Credits held for this job until it completes (committed) or fails (released)
+    usage_reservation = models.CharField(max_length=32, blank=True, default='')
+    
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
     started_at = models.DateTimeField(blank=True, null=True)
@@ -0,0 +1,140 @@
+# image_processing/preprocessing.py - Normalise input images before sending them to Gemini
+
+import logging
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image as PILImage, ImageOps
+
+from .thumbnails import delete_unreferenced, derivative_path
+
+logger = logging.getLogger(__name__)
+
+# Defaults - override with GEMINI_INPUT_PREPROCESSING in settings
+DEFAULT_PREPROCESSING_CONFIG = {
+    'enabled': True,
+    'max_edge': 1024,   # Gemini downsamples larger inputs anyway
+    'format': 'jpeg',
+    'quality': 90,
+    'cache': True,      # Store normalised bytes alongside the other derivatives
+}
+
+MIME_TYPES = {
+    'JPEG': 'image/jpeg',
+    'PNG': 'image/png',
+    'WEBP': 'image/webp',
+}
+
+
+def get_preprocessing_config():
+    """Merge settings overrides on top of the defaults"""
+    config = dict(DEFAULT_PREPROCESSING_CONFIG)
+    config.update(getattr(settings, 'GEMINI_INPUT_PREPROCESSING', {}))
+    return config
+
+
+def detect_mime_type(image_data):
+    """Read just the header to find the mime type of raw image bytes"""
+    try:
+        with PILImage.open(BytesIO(image_data)) as img:
+            return MIME_TYPES.get(img.format, 'image/jpeg')
+    except Exception:
+        return 'image/jpeg'
+
+
+def normalize_image_bytes(image_data, config=None):
+    """
+    Downsample, strip metadata and re-encode raw image bytes.
+
+    Args:
+        image_data: Raw image bytes in any format PIL can read
+        config: Preprocessing config (defaults to settings)
+
+    Returns:
+        bytes: Normalised image (RGB, longest edge <= max_edge, no EXIF)
+    """
+    config = config or get_preprocessing_config()
+    max_edge = config['max_edge']
+
+    img = PILImage.open(BytesIO(image_data))
+    if img.format == 'JPEG':
+        # Let libjpeg decode at reduced scale instead of full resolution
+        img.draft('RGB', (max_edge, max_edge))
+
+    img = ImageOps.exif_transpose(img)
+
+    if img.mode in ('RGBA', 'LA', 'P'):
+        if img.mode == 'P':
+            img = img.convert('RGBA')
+        background = PILImage.new('RGB', img.size, (255, 255, 255))
+        background.paste(img, mask=img.split()[-1])
+        img = background
+    elif img.mode != 'RGB':
+        img = img.convert('RGB')
+
+    img.thumbnail((max_edge, max_edge), PILImage.LANCZOS)
+
+    # Saving without exif=/icc_profile= drops all metadata
+    output = BytesIO()
+    if config['format'] == 'webp':
+        img.save(output, format='WEBP', quality=config['quality'], method=4)
+    else:
+        img.save(output, format='JPEG', quality=config['quality'], optimize=True)
+
+    return output.getvalue()
+
+
+def _cache_key(config):
+    return f"model_input_{config['max_edge']}"
+
+
+def get_model_input_bytes(user_image):
+    """
+    Get the bytes to send to Gemini for a UserImage.
+
+    The normalised copy is stored once in UserImage.derivatives (keyed by
+    max_edge), so a face or venue photo reused across many jobs is only
+    decoded and resized the first time.
+
+    Returns:
+        bytes: Normalised image bytes, or the original if preprocessing is disabled
+    """
+    config = get_preprocessing_config()
+
+    if not config['enabled']:
+        with user_image.image.open('rb') as image_file:
+            return image_file.read()
+
+    key = _cache_key(config)
+    cached_path = (user_image.derivatives or {}).get(key, {}).get(config['format'])
+
+    if config['cache'] and cached_path:
+        try:
+            with default_storage.open(cached_path, 'rb') as cached_file:
+                return cached_file.read()
+        except Exception as e:
+            logger.warning(f"Cached model input missing for image {user_image.id}: {str(e)}")
+
+    with user_image.image.open('rb') as image_file:
+        original = image_file.read()
+
+    normalized = normalize_image_bytes(original, config)
+    logger.info(
+        f"Normalised image {user_image.id} for model input: "
+        f"{len(original) / 1024:.0f} KB -> {len(normalized) / 1024:.0f} KB"
+    )
+
+    if config['cache']:
+        try:
+            path = derivative_path(user_image, key, config['format'])
+            saved_path = default_storage.save(path, ContentFile(normalized))
+
+            # Merged under a row lock so thumbnail sizes written meanwhile survive
+            replaced = user_image.merge_derivatives({key: {config['format']: saved_path}})
+            delete_unreferenced(user_image, replaced)
+        except Exception as e:
+            logger.warning(f"Could not cache model input for image {user_image.id}: {str(e)}")
+
+    return normalized
@@ -0,0 +1,55 @@
+# image_processing/queues.py - Route generation tasks by subscription tier
+
+import logging
+
+from django.conf import settings
+
+from usage_limits.tier_config import TierLimits
+
+logger = logging.getLogger(__name__)
+
+# Defaults - override with GENERATION_QUEUE_CONFIG in settings.
+# Paid and free users get separate queues (and workers) so a burst of free
+# jobs never sits in front of a paying customer. Priorities follow the Redis
+# transport: 0 is consumed first, 9 last.
+DEFAULT_GENERATION_QUEUE_CONFIG = {
+    'paid_queue': 'generation_paid',
+    'free_queue': 'generation_free',
+    'tier_priorities': {
+        'enterprise': 0,
+        'pro': 3,
+        'basic': 6,
+        'free': 9,
+    },
+    # Batch jobs queue just behind interactive jobs of the same tier
+    'batch_priority_offset': 1,
+}
+
+
+def get_generation_queue_config():
+    """Merge settings overrides on top of the defaults"""
+    config = dict(DEFAULT_GENERATION_QUEUE_CONFIG)
+    config.update(getattr(settings, 'GENERATION_QUEUE_CONFIG', {}))
+    return config
+
+
+def get_generation_routing(user, batch=False):
+    """
+    Queue and priority for a user's generation tasks.
+
+    Returns:
+        dict: queue and priority, ready to pass to apply_async() or
+        Signature.set()
+    """
+    config = get_generation_queue_config()
+    tier = TierLimits.get_user_tier(user)
+
+    priorities = config['tier_priorities']
+    priority = priorities.get(tier, priorities['free'])
+    if batch:
+        priority = min(priority + config['batch_priority_offset'], 9)
+
+    queue = config['free_queue'] if tier == 'free' else config['paid_queue']
+    logger.debug(f"Routing generation for user {user.id} ({tier}) to {queue}, priority {priority}")
+
+    return {'queue': queue, 'priority': priority}
@@ -0,0 +1,272 @@
+# image_processing/rate_limiter.py - Cluster-wide Gemini rate limit and concurrency governor
+
+import logging
+import random
+import re
+import time
+import uuid
+from contextlib import contextmanager
+
+from django.conf import settings
+
+from usage_limits.redis_client import RedisClient
+
+logger = logging.getLogger(__name__)
+
+# Defaults - override with GEMINI_RATE_LIMIT in settings
+DEFAULT_GEMINI_RATE_LIMIT_CONFIG = {
+    'enabled': True,
+    'key_prefix': 'gemini_limiter',
+    'rpm': 60,                 # Token refill rate, requests per minute (whole fleet)
+    'burst': 10,               # Bucket capacity
+    'max_concurrency': 10,     # Calls in flight at once (whole fleet)
+    'slot_ttl': 180,           # Lease on a concurrency slot, in case a worker dies holding it
+    'max_wait': 0,             # Longest a worker waits for a token/slot before giving up -
+                               # 0 fails fast and the task is rescheduled instead
+    'retry_base_delay': 15,    # Task retry backoff: base * 2**attempt, jittered
+    'retry_max_delay': 300,
+    'max_retries': 8,          # Task retries for throttled jobs (~25 min of backoff)
+}
+
+# Take `requested` tokens if available. Returns 0 on success, otherwise the
+# milliseconds until enough tokens will have refilled.
+TOKEN_BUCKET_SCRIPT = """
+local key = KEYS[1]
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) * 1000 + math.floor(tonumber(now_parts[2]) / 1000)
+
+local state = redis.call('HMGET', key, 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+
+tokens = math.min(capacity, tokens + (now - ts) * rate)
+
+local wait_ms = 0
+if tokens >= requested then
+    tokens = tokens - requested
+else
+    wait_ms = math.ceil((requested - tokens) / rate)
+end
+
+redis.call('HSET', key, 'tokens', tokens, 'ts', now)
+redis.call('PEXPIRE', key, math.ceil(capacity / rate) + 1000)
+return wait_ms
+"""
+
+# Lease `count` slots if that keeps us under the limit, dropping expired
+# leases first. Returns 1 if the slots were taken, 0 otherwise.
+SEMAPHORE_ACQUIRE_SCRIPT = """
+local key = KEYS[1]
+local limit = tonumber(ARGV[1])
+local ttl_ms = tonumber(ARGV[2])
+local count = tonumber(ARGV[3])
+
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) * 1000 + math.floor(tonumber(now_parts[2]) / 1000)
+
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now)
+if redis.call('ZCARD', key) + count > limit then
+    return 0
+end
+
+for i = 4, 3 + count do
+    redis.call('ZADD', key, now + ttl_ms, ARGV[i])
+end
+redis.call('PEXPIRE', key, ttl_ms)
+return 1
+"""
+
+
+class GeminiRateLimited(Exception):
+    """Gave up waiting for a rate-limit token or concurrency slot"""
+
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def get_rate_limit_config():
+    """Merge settings overrides on top of the defaults"""
+    config = dict(DEFAULT_GEMINI_RATE_LIMIT_CONFIG)
+    config.update(getattr(settings, 'GEMINI_RATE_LIMIT', {}))
+    return config
+
+
+class GeminiRateLimiter:
+    """
+    Token bucket (RPM) plus a leased semaphore (concurrency ceiling), both in
+    Redis so every worker process shares the same budget.
+
+    A 429 with Retry-After pauses the whole fleet via a cooldown key rather
+    than letting each worker discover the quota on its own.
+
+    Fails open: if Redis is unavailable, calls go straight through.
+    """
+    _scripts = {}
+
+    @classmethod
+    def _key(cls, name):
+        return f"{get_rate_limit_config()['key_prefix']}:{name}"
+
+    @classmethod
+    def _script(cls, redis_client, name, source):
+        script = cls._scripts.get(name)
+        if script is None or script.registered_client is not redis_client:
+            script = redis_client.register_script(source)
+            cls._scripts[name] = script
+        return script
+
+    @staticmethod
+    def max_batch_size():
+        """Most calls one slot() may take - larger batches must be split"""
+        config = get_rate_limit_config()
+        return max(1, min(config['max_concurrency'], config['burst']))
+
+    @classmethod
+    @contextmanager
+    def slot(cls, count=1):
+        """
+        Wait (up to max_wait) until `count` calls may go out, hold their
+        concurrency slots for the duration of the block, then release them.
+
+        Raises:
+            GeminiRateLimited: if no capacity frees up within max_wait, with
+                retry_after set to when it should next be available
+            ValueError: if `count` exceeds max_batch_size()
+        """
+        config = get_rate_limit_config()
+        if not config['enabled']:
+            yield
+            return
+
+        if count > cls.max_batch_size():
+            raise ValueError(f"{count} Gemini calls exceed the limiter's batch size of {cls.max_batch_size()}")
+
+        try:
+            redis_client = RedisClient.get_client()
+            leases = cls._acquire(redis_client, config, count)
+        except GeminiRateLimited:
+            raise
+        except Exception as e:
+            logger.warning(f"Gemini rate limiter unavailable, proceeding without it: {str(e)}")
+            yield
+            return
+
+        try:
+            yield
+        finally:
+            try:
+                redis_client.zrem(cls._key('slots'), *leases)
+            except Exception as e:
+                logger.warning(f"Could not release Gemini concurrency slots: {str(e)}")
+
+    @classmethod
+    def _acquire(cls, redis_client, config, count):
+        deadline = time.monotonic() + config['max_wait']
+        rate_per_ms = config['rpm'] / 60000
+        capacity = config['burst']
+        limit = config['max_concurrency']
+        leases = [uuid.uuid4().hex for _ in range(count)]
+
+        # 1. Fleet-wide cooldown after a Retry-After
+        while True:
+            cooldown_ms = redis_client.pttl(cls._key('cooldown'))
+            if not cooldown_ms or cooldown_ms < 0:
+                break
+            cls._sleep_or_give_up(deadline, cooldown_ms / 1000, 'cooldown')
+
+        # 2. Rate tokens
+        bucket = cls._script(redis_client, 'bucket', TOKEN_BUCKET_SCRIPT)
+        while True:
+            wait_ms = int(bucket(keys=[cls._key('bucket')], args=[rate_per_ms, capacity, count]))
+            if wait_ms == 0:
+                break
+            cls._sleep_or_give_up(deadline, wait_ms / 1000, 'rate limit')
+
+        # 3. Concurrency slots
+        semaphore = cls._script(redis_client, 'semaphore', SEMAPHORE_ACQUIRE_SCRIPT)
+        delay = 0.05
+        while True:
+            acquired = semaphore(
+                keys=[cls._key('slots')],
+                args=[limit, int(config['slot_ttl'] * 1000), count, *leases],
+            )
+            if int(acquired):
+                return leases
+            cls._sleep_or_give_up(deadline, delay, 'concurrency limit')
+            delay = min(delay * 2, 1.0)
+
+    @staticmethod
+    def _sleep_or_give_up(deadline, seconds, reason):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise GeminiRateLimited(f"Timed out waiting for Gemini {reason}", retry_after=seconds)
+        # Jitter so waiting workers don't all wake on the same tick
+        time.sleep(min(remaining, seconds * random.uniform(1.0, 1.2)))
+
+    @classmethod
+    def pause(cls, seconds):
+        """Hold every worker's calls for `seconds` (e.g. from a Retry-After)"""
+        if not seconds or seconds <= 0:
+            return
+        try:
+            # Only ever extend an existing cooldown
+            redis_client = RedisClient.get_client()
+            key = cls._key('cooldown')
+            if redis_client.pttl(key) < seconds * 1000:
+                redis_client.set(key, '1', px=int(seconds * 1000))
+            logger.warning(f"Gemini calls paused for {seconds:.0f}s")
+        except Exception as e:
+            logger.warning(f"Could not set Gemini cooldown: {str(e)}")
+
+
+def get_status_code(exc):
+    """HTTP status of an API error (google-genai sets .code), or None"""
+    code = getattr(exc, 'code', None) or getattr(exc, 'status_code', None)
+    return code if isinstance(code, int) else None
+
+
+def get_retry_after(exc):
+    """
+    Seconds the API asked us to wait, or None if `exc` isn't a rate-limit /
+    overload error. Checks the Retry-After header, then the RetryInfo
+    retryDelay in the error body; rate limits without a hint return 0.
+    """
+    if isinstance(exc, GeminiRateLimited):
+        return exc.retry_after or 0
+
+    text = str(exc)
+    if get_status_code(exc) not in (429, 503) and 'RESOURCE_EXHAUSTED' not in text:
+        return None
+
+    response = getattr(exc, 'response', None)
+    headers = getattr(response, 'headers', None) or {}
+    try:
+        header = headers.get('Retry-After')
+        if header:
+            return float(header)
+    except (TypeError, ValueError):
+        pass
+
+    match = re.search(r"retryDelay['\"]?\s*:\s*['\"]?(\d+(?:\.\d+)?)s", text)
+    if match:
+        return float(match.group(1))
+    return 0
+
+
+def compute_retry_delay(attempt, retry_after=None):
+    """
+    Countdown before retrying a task: exponential in `attempt`, with full
+    jitter so failed jobs don't come back in lockstep, and never sooner
+    than the API's Retry-After.
+    """
+    config = get_rate_limit_config()
+    ceiling = min(config['retry_max_delay'], config['retry_base_delay'] * (2 ** attempt))
+    delay = random.uniform(ceiling / 2, ceiling)
+    if retry_after:
+        delay = max(delay, retry_after + random.uniform(0, config['retry_base_delay']))
+    return int(delay)
@@ -1,12 +1,348 @@
 # image_processing/services.py - Simple multi-image support for Gemini 2.5 Flash
 
 import logging
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
 from PIL import Image as PILImage
 from io import BytesIO
 from django.conf import settings
 
+from usage_limits.redis_client import RedisClient
+
+from .rate_limiter import GeminiRateLimited, GeminiRateLimiter, get_retry_after, get_status_code
+
 logger = logging.getLogger(__name__)
 
+# Defaults - override with GEMINI_CIRCUIT_BREAKER in settings
+DEFAULT_CIRCUIT_BREAKER_CONFIG = {
+    'enabled': True,
+    'key_prefix': 'gemini_breaker',
+    'window': 60,               # Rolling window (seconds) for error rate and latency
+    'bucket_seconds': 10,       # Window granularity
+    'min_calls': 10,            # Don't judge the API on fewer calls than this
+    'failure_rate': 0.5,        # Open when this share of calls error...
+    'slow_call_seconds': 30,    # ...or when calls slower than this...
+    'slow_call_rate': 0.8,      # ...make up this share of the window
+    'open_seconds': 60,         # How long to fail fast before probing again
+    'probe_timeout': 180,       # Half-open probe lease, in case the prober dies
+}
+
+
+def get_circuit_breaker_config():
+    """Merge settings overrides on top of the defaults"""
+    config = dict(DEFAULT_CIRCUIT_BREAKER_CONFIG)
+    config.update(getattr(settings, 'GEMINI_CIRCUIT_BREAKER', {}))
+    return config
+
+
+class GeminiCircuitOpen(GeminiRateLimited):
+    """Call refused without reaching Gemini because the circuit is open"""
+
+
+# Drop the half-open probe lease only if it is still ours
+RELEASE_PROBE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class GeminiCircuitBreaker:
+    """
+    Circuit breaker around Gemini calls, shared by every worker through Redis.
+    
+    - closed: calls go out; outcomes and latency land in per-bucket counters
+      covering the rolling window
+    - open: tripped by a high error rate or too many slow calls; calls (and
+      new submissions) are refused straight away for open_seconds
+    - half_open: one worker gets a probe call; success closes the circuit,
+      failure re-opens it. Outcomes of other calls still in flight (started
+      before the trip) are ignored - only the probe decides
+    
+    Fails open: if Redis is unavailable the circuit reports closed.
+    """
+    
+    @classmethod
+    def _key(cls, name):
+        return f"{get_circuit_breaker_config()['key_prefix']}:{name}"
+    
+    @classmethod
+    def _bucket_keys(cls, config):
+        current = int(time.time() // config['bucket_seconds'])
+        count = max(1, config['window'] // config['bucket_seconds'])
+        return [cls._key(f"window:{bucket}") for bucket in range(current - count + 1, current + 1)]
+    
+    @classmethod
+    def get_state(cls):
+        """
+        Returns:
+            tuple: (state, retry_after) - 'closed', 'open' or 'half_open', and
+            seconds until the circuit will next let a call through
+        """
+        config = get_circuit_breaker_config()
+        if not config['enabled']:
+            return 'closed', 0
+        
+        try:
+            with RedisClient.get_client().pipeline() as pipe:
+                pipe.pttl(cls._key('open'))
+                pipe.exists(cls._key('half_open'))
+                open_ms, half_open = pipe.execute()
+        except Exception as e:
+            logger.warning(f"Gemini circuit state unavailable: {str(e)}")
+            return 'closed', 0
+        
+        if open_ms and open_ms > 0:
+            return 'open', open_ms / 1000
+        if half_open:
+            return 'half_open', 0
+        return 'closed', 0
+    
+    @classmethod
+    def is_open(cls):
+        """True while calls are being refused - used to turn away new submissions"""
+        return cls.get_state()[0] == 'open'
+    
+    @classmethod
+    def allow_request(cls):
+        """
+        Returns:
+            tuple: (allowed, retry_after, probe) - probe is the lease token
+            when this call is the half-open probe, otherwise None
+        """
+        state, retry_after = cls.get_state()
+        if state == 'closed':
+            return True, 0, None
+        if state == 'open':
+            return False, retry_after, None
+        
+        # Half-open: a single probe at a time
+        config = get_circuit_breaker_config()
+        probe = uuid.uuid4().hex
+        try:
+            if RedisClient.get_client().set(cls._key('probe'), probe, nx=True, ex=config['probe_timeout']):
+                logger.info("Gemini circuit half-open - sending probe call")
+                return True, 0, probe
+        except Exception as e:
+            logger.warning(f"Could not take Gemini circuit probe: {str(e)}")
+            return True, 0, None
+        return False, config['bucket_seconds'], None
+    
+    @classmethod
+    def release_probe(cls, probe):
+        """
+        Give up a probe lease without an outcome - the call ended in something
+        that says nothing about Gemini's health (a 429, our own throttling),
+        so the next call should probe instead of waiting out probe_timeout.
+        """
+        if not probe:
+            return
+        try:
+            RedisClient.get_client().eval(RELEASE_PROBE_SCRIPT, 1, cls._key('probe'), probe)
+        except Exception as e:
+            logger.warning(f"Could not release Gemini circuit probe: {str(e)}")
+    
+    @classmethod
+    def record(cls, latency, failed, probe=None):
+        """
+        Record one call's outcome and trip/close the circuit as needed.
+        probe is the lease token from allow_request, if this call is the probe.
+        """
+        config = get_circuit_breaker_config()
+        if not config['enabled']:
+            return
+        
+        slow = latency >= config['slow_call_seconds']
+        try:
+            redis_client = RedisClient.get_client()
+            bucket_keys = cls._bucket_keys(config)
+            
+            with redis_client.pipeline() as pipe:
+                pipe.hincrby(bucket_keys[-1], 'calls', 1)
+                if failed:
+                    pipe.hincrby(bucket_keys[-1], 'failures', 1)
+                if slow:
+                    pipe.hincrby(bucket_keys[-1], 'slow', 1)
+                pipe.expire(bucket_keys[-1], config['window'] + config['bucket_seconds'])
+                pipe.exists(cls._key('half_open'))
+                pipe.get(cls._key('probe'))
+                half_open, probe_holder = pipe.execute()[-2:]
+            
+            if half_open:
+                if not probe or probe_holder != probe:
+                    return
+                if failed or slow:
+                    cls._trip(redis_client, config, 'probe call failed')
+                else:
+                    redis_client.delete(cls._key('half_open'), cls._key('probe'), *bucket_keys)
+                    logger.info("Gemini circuit closed - probe call succeeded")
+                return
+            
+            if failed or slow:
+                cls._evaluate(redis_client, config, bucket_keys)
+        except Exception as e:
+            logger.warning(f"Could not record Gemini circuit outcome: {str(e)}")
+    
+    @classmethod
+    def _evaluate(cls, redis_client, config, bucket_keys):
+        with redis_client.pipeline() as pipe:
+            for key in bucket_keys:
+                pipe.hmget(key, 'calls', 'failures', 'slow')
+            buckets = pipe.execute()
+        
+        calls = sum(int(bucket[0] or 0) for bucket in buckets)
+        failures = sum(int(bucket[1] or 0) for bucket in buckets)
+        slow = sum(int(bucket[2] or 0) for bucket in buckets)
+        if calls < config['min_calls']:
+            return
+        
+        if failures / calls >= config['failure_rate']:
+            cls._trip(redis_client, config, f"{failures}/{calls} calls failed")
+        elif slow / calls >= config['slow_call_rate']:
+            cls._trip(redis_client, config, f"{slow}/{calls} calls slower than {config['slow_call_seconds']}s")
+    
+    @classmethod
+    def _trip(cls, redis_client, config, reason):
+        with redis_client.pipeline() as pipe:
+            pipe.set(cls._key('open'), '1', ex=config['open_seconds'])
+            # Half-open once 'open' expires, until a probe closes it
+            pipe.set(cls._key('half_open'), '1', ex=config['open_seconds'] * 10)
+            pipe.delete(cls._key('probe'))
+            pipe.execute()
+        logger.error(f"Gemini circuit opened for {config['open_seconds']}s: {reason}")
+    
+    @staticmethod
+    def counts_as_failure(exc):
+        """Degradation, not quota - 429s are the rate limiter's job"""
+        if isinstance(exc, GeminiRateLimited):
+            return False
+        return get_status_code(exc) != 429 and 'RESOURCE_EXHAUSTED' not in str(exc)
+    
+    @classmethod
+    @contextmanager
+    def call(cls):
+        """
+        Guard a single Gemini call: refuse it while open, otherwise time it
+        and record the outcome.
+        
+        Raises:
+            GeminiCircuitOpen: if the circuit is refusing calls
+        """
+        allowed, retry_after, probe = cls.allow_request()
+        if not allowed:
+            raise GeminiCircuitOpen("Gemini circuit open - failing fast", retry_after=retry_after)
+        
+        started = time.monotonic()
+        try:
+            yield
+        except Exception as e:
+            if cls.counts_as_failure(e):
+                cls.record(time.monotonic() - started, failed=True, probe=probe)
+            else:
+                cls.release_probe(probe)
+            raise
+        else:
+            cls.record(time.monotonic() - started, failed=False, probe=probe)
+
+
+# Process-wide client registry - one genai.Client per worker process
+class GeminiClientPool:
+    """
+    Lazily builds a single genai.Client per process and reuses it across jobs,
+    so HTTP connections (and their TLS sessions) stay alive between tasks.
+    
+    The client is rebuilt when:
+    - the process has forked (Celery prefork children must not share sockets)
+    - it is older than GEMINI_API_CONFIG['client_max_age'] seconds
+    - GEMINI_API_CONFIG['client_max_failures'] calls in a row have failed
+    """
+    _client = None
+    _genai = None
+    _pid = None
+    _created_at = 0
+    _consecutive_failures = 0
+    _lock = threading.Lock()
+    
+    @classmethod
+    def get_genai(cls):
+        """Import google.genai once per process"""
+        if cls._genai is None:
+            try:
+                from google import genai
+            except ImportError as e:
+                raise ImportError("google-genai library not installed. Run: pip install google-genai") from e
+            cls._genai = genai
+        return cls._genai
+    
+    @classmethod
+    def get_client(cls):
+        if cls._is_healthy():
+            return cls._client
+        
+        with cls._lock:
+            if not cls._is_healthy():
+                cls._build_client()
+        return cls._client
+    
+    @classmethod
+    def _is_healthy(cls):
+        if cls._client is None or cls._pid != os.getpid():
+            return False
+        
+        config = getattr(settings, 'GEMINI_API_CONFIG', {})
+        if time.monotonic() - cls._created_at > config.get('client_max_age', 3600):
+            return False
+        if cls._consecutive_failures >= config.get('client_max_failures', 3):
+            return False
+        return True
+    
+    @classmethod
+    def _build_client(cls):
+        genai = cls.get_genai()
+        
+        api_key = getattr(settings, 'GEMINI_API_KEY', None)
+        if not api_key:
+            raise ValueError("GEMINI_API_KEY not configured in settings")
+        
+        config = getattr(settings, 'GEMINI_API_CONFIG', {})
+        http_options = genai.types.HttpOptions(timeout=int(config.get('timeout', 120) * 1000))
+        
+        # Swap, never close: other threads (threads pool, variant executor)
+        # may still be mid-call on the old client. It is garbage-collected,
+        # connections and all, once the last GeminiImageService holding it is done.
+        cls._client = genai.Client(api_key=api_key, http_options=http_options)
+        cls._pid = os.getpid()
+        cls._created_at = time.monotonic()
+        cls._consecutive_failures = 0
+        
+        logger.info(f"Gemini client created for process {cls._pid}")
+    
+    @classmethod
+    def report_success(cls):
+        cls._consecutive_failures = 0
+    
+    @classmethod
+    def report_failure(cls):
+        cls._consecutive_failures += 1
+    
+    @classmethod
+    def reset(cls):
+        """Drop the client without touching its sockets (used in forked children)"""
+        cls._client = None
+        cls._pid = None
+        cls._consecutive_failures = 0
+        cls._lock = threading.Lock()
+
+
+# Celery prefork children inherit the parent's client; make them build their own
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=GeminiClientPool.reset)
+
+
 class GeminiImageService:
     """
     Simple service for Gemini 2.5 Flash Image Preview.
@@ -14,114 +350,240 @@ class GeminiImageService:
     """
     
     def __init__(self):
-        """Initialize Gemini client"""
+        """Attach to the process-wide Gemini client"""
         try:
-            from google import genai
-            self.genai = genai
-            
-            api_key = getattr(settings, 'GEMINI_API_KEY', None)
-            if not api_key:
-                raise ValueError("GEMINI_API_KEY not configured in settings")
-            
-            self.client = genai.Client(api_key=api_key)
+            self.genai = GeminiClientPool.get_genai()
+            self.client = GeminiClientPool.get_client()
             self.model = getattr(settings, 'GEMINI_MODEL')
             
-            logger.info(f"Gemini service initialized with model: {self.model}")
-            
-        except ImportError as e:
-            raise ImportError("google-genai library not installed. Run: pip install google-genai") from e
+        except ImportError:
+            raise
         except Exception as e:
             logger.error(f"Failed to initialize Gemini service: {str(e)}")
             raise
     
-    def transform_with_multiple_images(self, image_data_list, prompt):
+    def transform_with_multiple_images(self, image_data_list, prompt, preprocessed=False, output_count=1):
         """
         Transform using 1-5 input images.
         
         Args:
             image_data_list: List of raw image bytes [image1_data, image2_data, ...]
             prompt: Text prompt for transformation
+            preprocessed: True if the bytes already went through get_model_input_bytes
+            output_count: Number of variations to generate from the same inputs
             
         Returns:
-            dict: {'success': bool, 'image_data': bytes, 'error': str}
+            dict: {'success': bool, 'image_data': bytes, 'images': [...], 'error': str}
         """
         try:
-            # Convert all images to PIL and ensure RGB
+            from .preprocessing import detect_mime_type, get_preprocessing_config, normalize_image_bytes
+            
+            config = get_preprocessing_config()
+            
+            # Send encoded bytes directly - avoids a PIL decode here and a re-encode inside the SDK
             input_images = []
             for idx, img_data in enumerate(image_data_list):
-                img = PILImage.open(BytesIO(img_data))
-                
-                # Convert to RGB if needed
-                if img.mode in ('RGBA', 'LA', 'P'):
-                    background = PILImage.new('RGB', img.size, (255, 255, 255))
-                    if img.mode == 'P':
-                        img = img.convert('RGBA')
-                    if img.mode == 'RGBA':
-                        background.paste(img, mask=img.split()[-1])
-                        img = background
-                    else:
-                        img = img.convert('RGB')
+                if not preprocessed and config['enabled']:
+                    img_data = normalize_image_bytes(img_data, config)
                 
-                input_images.append(img)
-                logger.info(f"Prepared input image {idx + 1}: {img.size}, mode: {img.mode}")
+                input_images.append(
+                    self.genai.types.Part.from_bytes(data=img_data, mime_type=detect_mime_type(img_data))
+                )
+                logger.info(f"Prepared input image {idx + 1}: {len(img_data) / 1024:.0f} KB")
             
-            logger.info(f"Generating with {len(input_images)} input image(s)")
+            logger.info(f"Generating {output_count} output(s) with {len(input_images)} input image(s)")
             logger.debug(f"Prompt: {prompt[:100]}...")
             
-            # Build contents: prompt + all images
+            # Build contents once: prompt + all images, shared by every variation
             contents = [prompt] + input_images
             
             # Generate content
-            response = self.client.models.generate_content(
-                model=self.model,
-                contents=contents,
-                config=self.genai.types.GenerateContentConfig(
+            responses = self._generate_variants(
+                contents,
+                self.genai.types.GenerateContentConfig(
                     candidate_count=1,
                     max_output_tokens=2048
-                )
+                ),
+                output_count
             )
             
-            # Extract generated image
-            image_parts = [
-                part.inline_data.data
-                for part in response.candidates[0].content.parts
-                if part.inline_data
-            ]
+            images = []
+            errors = []
+            api_failures = 0
+            throttled = 0
+            retry_after = None
+            for response in responses:
+                if isinstance(response, Exception):
+                    # Refused locally (rate limiter / open circuit) - the client never made the call
+                    if isinstance(response, GeminiRateLimited):
+                        throttled += 1
+                    else:
+                        api_failures += 1
+                    errors.append(f"Gemini API error: {str(response)}")
+                    hint = self._handle_rate_limit(response)
+                    if hint is not None:
+                        retry_after = max(retry_after or 0, hint)
+                    continue
+                
+                # Extract generated image
+                image_parts = [
+                    part.inline_data.data
+                    for part in response.candidates[0].content.parts
+                    if part.inline_data
+                ]
+                
+                if image_parts:
+                    images.append({
+                        'image_data': image_parts[0],
+                        'finish_reason': getattr(response.candidates[0], 'finish_reason', 'STOP')
+                    })
+                else:
+                    text_parts = [
+                        part.text
+                        for part in response.candidates[0].content.parts
+                        if part.text
+                    ]
+                    errors.append(f"No image generated. Response: {' '.join(text_parts[:2])}" if text_parts else "No image generated")
+            
+            # Only count it against the client if every call it made errored
+            attempted = len(responses) - throttled
+            if attempted and api_failures == attempted:
+                GeminiClientPool.report_failure()
+            elif attempted:
+                GeminiClientPool.report_success()
             
-            if image_parts:
-                generated_image_data = image_parts[0]
-                logger.info(f"Successfully generated image with {len(input_images)} inputs")
+            for error_msg in errors:
+                logger.error(error_msg)
+            
+            if images:
+                logger.info(f"Successfully generated {len(images)}/{output_count} image(s) with {len(input_images)} inputs")
                 
                 return {
                     'success': True,
-                    'image_data': generated_image_data,
+                    'image_data': images[0]['image_data'],
+                    'images': images,
                     'model': self.model,
-                    'finish_reason': getattr(response.candidates[0], 'finish_reason', 'STOP')
+                    'finish_reason': images[0]['finish_reason']
                 }
             else:
-                text_parts = [
-                    part.text
-                    for part in response.candidates[0].content.parts
-                    if part.text
-                ]
-                
-                error_msg = f"No image generated. Response: {' '.join(text_parts[:2])}" if text_parts else "No image generated"
-                logger.error(error_msg)
-                
                 return {
                     'success': False,
-                    'error': error_msg
+                    'error': errors[0] if errors else 'No image generated',
+                    # Quota/overload errors are worth retrying later
+                    'retryable': retry_after is not None,
+                    'retry_after': retry_after
                 }
                 
         except Exception as e:
+            if not isinstance(e, GeminiRateLimited):
+                GeminiClientPool.report_failure()
             error_msg = f"Gemini API error: {str(e)}"
             logger.error(f"Error in image generation: {error_msg}")
             
+            retry_after = self._handle_rate_limit(e)
             return {
                 'success': False,
-                'error': error_msg
+                'error': error_msg,
+                'retryable': retry_after is not None,
+                'retry_after': retry_after
             }
     
+    @staticmethod
+    def _handle_rate_limit(exc):
+        """
+        Seconds to back off if `exc` is a rate-limit/overload error, else None.
+        A Retry-After from the API pauses every worker, not just this one.
+        """
+        retry_after = get_retry_after(exc)
+        if retry_after and not isinstance(exc, GeminiRateLimited):
+            GeminiRateLimiter.pause(retry_after)
+        return retry_after
+    
+    def _generate_variants(self, contents, config, count):
+        """
+        Issue `count` generate_content calls for the same contents together.
+        
+        Image models return a single candidate per call, so variations are
+        parallel requests sharing the already-encoded input Parts.
+        Returns one response per call, or the exception that call raised.
+        """
+        if count <= 1:
+            return [self._generate_content(contents, config)]
+        
+        if getattr(settings, 'GEMINI_EXECUTION_MODE', 'sync') == 'async':
+            from .async_engine import GeminiAsyncEngine
+            allowed, retry_after, probe = GeminiCircuitBreaker.allow_request()
+            if not allowed:
+                return [GeminiCircuitOpen("Gemini circuit open - failing fast", retry_after=retry_after)] * count
+            
+            # Never more calls per slot than the limiter's ceiling allows
+            responses = []
+            recorded = False
+            batch_size = GeminiRateLimiter.max_batch_size()
+            while len(responses) < count:
+                batch = min(batch_size, count - len(responses))
+                try:
+                    with GeminiRateLimiter.slot(batch):
+                        started = time.monotonic()
+                        batch_responses = GeminiAsyncEngine.get_instance().generate_content_many(
+                            self.client, self.model, contents, config, batch
+                        )
+                        latency = time.monotonic() - started
+                except GeminiRateLimited as e:
+                    responses.extend([e] * (count - len(responses)))
+                    break
+                
+                # Quota errors say nothing about health - leave them out
+                for response in batch_responses:
+                    if isinstance(response, Exception) and not GeminiCircuitBreaker.counts_as_failure(response):
+                        continue
+                    GeminiCircuitBreaker.record(latency, failed=isinstance(response, Exception), probe=probe)
+                    recorded = True
+                responses.extend(batch_responses)
+            
+            # Hand back the probe if nothing was recorded against it
+            if not recorded:
+                GeminiCircuitBreaker.release_probe(probe)
+            return responses
+        
+        from concurrent.futures import ThreadPoolExecutor
+        
+        with ThreadPoolExecutor(max_workers=count, thread_name_prefix='gemini-variant') as pool:
+            futures = [pool.submit(self._generate_content, contents, config) for _ in range(count)]
+        
+        responses = []
+        for future in futures:
+            try:
+                responses.append(future.result())
+            except Exception as e:
+                responses.append(e)
+        return responses
+    
+    def _generate_content(self, contents, config):
+        """
+        Dispatch a generate_content call according to GEMINI_EXECUTION_MODE.
+        
+        'sync': blocking call on the calling thread (one call per worker slot)
+        'async': handed to the per-process GeminiAsyncEngine, which multiplexes
+                 many calls over the SDK's async client
+        
+        Either way the call is refused outright while the circuit is open
+        (GeminiCircuitBreaker.call raises GeminiCircuitOpen), then takes a
+        fleet-wide rate/concurrency slot (GeminiRateLimiter).
+        """
+        with GeminiCircuitBreaker.call(), GeminiRateLimiter.slot():
+            if getattr(settings, 'GEMINI_EXECUTION_MODE', 'sync') == 'async':
+                from .async_engine import GeminiAsyncEngine
+                return GeminiAsyncEngine.get_instance().generate_content(
+                    self.client, self.model, contents, config
+                )
+            
+            return self.client.models.generate_content(
+                model=self.model,
+                contents=contents,
+                config=config
+            )
+    
     def transform_venue_image(self, image_data, prompt):
         """
         Legacy single-image method (backward compatible).
@@ -1,10 +1,14 @@
 # image_processing/tasks.py - Updated for venue, wedding, and engagement modes
 
-from celery import shared_task
+from celery import chord, shared_task
+from celery.exceptions import Retry
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.db import transaction
 from django.utils import timezone
 from django.core.files.base import ContentFile
 import logging
+import os
 import time
 import re
 import random
@@ -13,16 +17,24 @@ from PIL import Image as PILImage
 from io import BytesIO
 
 from .models import (
-    ImageProcessingJob, ProcessedImage, UserImage,
-    WEDDING_THEMES, SPACE_TYPES,
-    ENGAGEMENT_SETTINGS, ENGAGEMENT_ACTIVITIES,
-    WEDDING_MOMENTS, WEDDING_SETTINGS
+    ImageProcessingBatch, ImageProcessingJob, ProcessedImage, UserImage, get_choice_label
 )
+from .generation_cache import build_cache_key, get_cached_result, store_result
+from .job_events import publish_job_status
+from .preprocessing import get_model_input_bytes
+from .rate_limiter import compute_retry_delay, get_rate_limit_config
+from .services import GeminiCircuitBreaker
 from usage_limits.usage_tracker import UsageTracker
 
 logger = logging.getLogger(__name__)
 User = get_user_model()
 
+# Generation tasks wait on Gemini calls of up to GEMINI_API_CONFIG['timeout']
+# seconds, plus preprocessing and saving outputs - the global 60s soft limit
+# would kill them mid-call
+GENERATION_SOFT_TIME_LIMIT = settings.GEMINI_API_CONFIG.get('timeout', 120) + 60
+GENERATION_TIME_LIMIT = GENERATION_SOFT_TIME_LIMIT + 60
+
 
 def generate_human_readable_filename(job, file_extension='png'):
     """
@@ -57,8 +69,8 @@ def generate_human_readable_filename(job, file_extension='png'):
             filename_parts = ['Custom', date_str, random_suffix]
         elif job.studio_mode == 'venue':
             # Venue mode
-            theme_display = dict(WEDDING_THEMES).get(job.wedding_theme, job.wedding_theme) if job.wedding_theme else 'Venue'
-            space_display = dict(SPACE_TYPES).get(job.space_type, job.space_type) if job.space_type else 'Space'
+            theme_display = get_choice_label('wedding_theme', job.wedding_theme) if job.wedding_theme else 'Venue'
+            space_display = get_choice_label('space_type', job.space_type) if job.space_type else 'Space'
             
             theme_clean = clean_for_filename(theme_display)
             space_clean = clean_for_filename(space_display)
@@ -66,8 +78,8 @@ def generate_human_readable_filename(job, file_extension='png'):
             filename_parts = [space_clean, theme_clean, date_str, random_suffix]
         elif job.studio_mode == 'portrait_engagement':
             # Engagement portrait mode
-            activity_display = dict(ENGAGEMENT_ACTIVITIES).get(job.engagement_activity, job.engagement_activity) if job.engagement_activity else 'Engagement'
-            setting_display = dict(ENGAGEMENT_SETTINGS).get(job.engagement_setting, job.engagement_setting) if job.engagement_setting else None
+            activity_display = get_choice_label('engagement_activity', job.engagement_activity) if job.engagement_activity else 'Engagement'
+            setting_display = get_choice_label('engagement_setting', job.engagement_setting) if job.engagement_setting else None
             
             activity_clean = clean_for_filename(activity_display)
             setting_clean = clean_for_filename(setting_display) if setting_display else None
@@ -81,8 +93,8 @@ def generate_human_readable_filename(job, file_extension='png'):
         
         elif job.studio_mode == 'portrait_wedding':
             # Wedding portrait mode
-            moment_display = dict(WEDDING_MOMENTS).get(job.wedding_moment, job.wedding_moment) if job.wedding_moment else 'Wedding'
-            setting_display = dict(WEDDING_SETTINGS).get(job.wedding_setting, job.wedding_setting) if job.wedding_setting else None
+            moment_display = get_choice_label('wedding_moment', job.wedding_moment) if job.wedding_moment else 'Wedding'
+            setting_display = get_choice_label('wedding_setting', job.wedding_setting) if job.wedding_setting else None
             
             moment_clean = clean_for_filename(moment_display)
             setting_clean = clean_for_filename(setting_display) if setting_display else None
@@ -118,40 +130,111 @@ def generate_human_readable_filename(job, file_extension='png'):
         return fallback_name
 
 
-@shared_task(bind=True, max_retries=2)
-def process_image_job(self, job_id):
+def charge_job_usage(job, user, count, reservation_id):
+    """Charge delivered outputs against the job's reservation (or directly if it had none)"""
+    if reservation_id:
+        charged = UsageTracker.commit_usage(user, reservation_id, count)
+    else:
+        charged = UsageTracker.increment_usage(user, count)
+    
+    if not charged:
+        logger.warning(f"Usage charge of {count} failed for user {user.id} after successful generation of job {job.id}")
+    return charged
+
+
+def complete_and_charge_job(job, user, count):
+    """
+    Mark a job completed and charge its outputs - exactly once.
+    
+    Completion and clearing the reservation are one conditional UPDATE made
+    before the charge, so a retried or redelivered task finds the job
+    completed and neither regenerates nor charges again. Dying between the
+    UPDATE and the charge undercharges (the reservation expires) rather
+    than double-bills.
+    
+    Returns:
+        bool: False if another run had already completed the job
+    """
+    reservation_id = job.usage_reservation
+    completed_at = timezone.now()
+    claimed = ImageProcessingJob.objects.filter(pk=job.pk).exclude(status='completed').update(
+        status='completed', completed_at=completed_at, usage_reservation=''
+    )
+    if not claimed:
+        logger.warning(f"Job {job.id} was already completed by another run - not charging again")
+        job.refresh_from_db(fields=['status', 'completed_at', 'usage_reservation'])
+        return False
+    
+    job.status = 'completed'
+    job.completed_at = completed_at
+    job.usage_reservation = ''
+    try:
+        charge_job_usage(job, user, count, reservation_id)
+    except Exception as e:
+        # Never let a charging hiccup fail (and retry) a delivered job
+        logger.error(f"Error charging usage for completed job {job.id}: {str(e)}")
+    return True
+
+
+def release_job_usage(job):
+    """Give a failed job's reserved credits back"""
+    if job.usage_reservation:
+        UsageTracker.release_usage(job.user_image.user_id, job.usage_reservation)
+
+
+@shared_task(bind=True, max_retries=2, soft_time_limit=GENERATION_SOFT_TIME_LIMIT, time_limit=GENERATION_TIME_LIMIT)
+def process_image_job(self, job_id, force_fresh=False):
     """
     Main task router for all studio modes.
     Routes to appropriate processing based on studio_mode.
+    
+    force_fresh skips the generation result cache and always calls Gemini.
     """
     try:
         job = ImageProcessingJob.objects.get(id=job_id)
         user = job.user_image.user
         
+        # Retry or redelivery after the job was delivered and charged
+        if job.status == 'completed':
+            logger.info(f"Job {job_id} already completed - skipping")
+            return {'success': True, 'job_id': job_id, 'already_completed': True}
+        
+        # Gemini is failing - don't hold a worker slot, park the job until the
+        # circuit half-opens (or fail it, retryable by the user, once out of retries)
+        circuit_state, circuit_retry_after = GeminiCircuitBreaker.get_state()
+        if circuit_state == 'open':
+            if self.request.retries < self.max_retries:
+                countdown = compute_retry_delay(self.request.retries, circuit_retry_after)
+                logger.warning(f"Gemini circuit open, parking job {job_id} for {countdown}s")
+                raise self.retry(countdown=countdown)
+            
+            job.status = 'failed'
+            job.error_message = 'Image generation is temporarily unavailable. Please try again in a few minutes.'
+            job.save(update_fields=['status', 'error_message'])
+            release_job_usage(job)
+            publish_job_status(job)
+            return {'success': False, 'job_id': job_id, 'error': job.error_message, 'retryable': True}
+        
         logger.info(f"Starting processing for job {job_id}, mode: {job.studio_mode}, user: {user.username}")
         
         # Update job status
         job.status = 'processing'
         job.started_at = timezone.now()
         job.save(update_fields=['status', 'started_at'])
+        publish_job_status(job)
         
         # Route to appropriate processor
         if job.studio_mode == 'venue':
-            result = process_venue_job(job)
+            result = process_venue_job(job, force_fresh=force_fresh)
         elif job.studio_mode in ['portrait_wedding', 'portrait_engagement']:
-            result = process_portrait_job(job)
+            result = process_portrait_job(job, force_fresh=force_fresh)
         else:
             raise ValueError(f"Unknown studio mode: {job.studio_mode}")
         
         if result['success']:
-            # Increment usage counter
-            if not UsageTracker.increment_usage(user, 1):
-                logger.warning(f"Usage increment failed for user {user.id} after successful generation")
-            
-            # Update job to completed
-            job.status = 'completed'
-            job.completed_at = timezone.now()
-            job.save(update_fields=['status', 'completed_at'])
+            # Completed and charged once for every output actually delivered
+            complete_and_charge_job(job, user, len(result['processed_image_ids']))
+            publish_job_status(job, result['processed_images'])
             
             processing_time = (job.completed_at - job.started_at).total_seconds()
             logger.info(f"Job {job_id} completed in {processing_time:.1f}s")
@@ -160,13 +243,27 @@ def process_image_job(self, job_id):
                 'success': True,
                 'job_id': job_id,
                 'processed_image_id': result['processed_image_id'],
+                'processed_image_ids': result['processed_image_ids'],
                 'processing_time': processing_time
             }
+        elif result.get('retryable') and self.request.retries < get_rate_limit_config()['max_retries']:
+            # Rate limited / overloaded - back off (jittered, Retry-After aware) and requeue.
+            # The limiter fails fast instead of holding the worker, so throttled
+            # jobs get a longer retry budget than errors do
+            countdown = compute_retry_delay(self.request.retries, result.get('retry_after'))
+            job.status = 'pending'
+            job.save(update_fields=['status'])
+            publish_job_status(job)
+            
+            logger.warning(f"Job {job_id} rate limited, retrying in {countdown}s (attempt {self.request.retries + 1})")
+            raise self.retry(countdown=countdown, max_retries=get_rate_limit_config()['max_retries'])
         else:
             # Failed
             job.status = 'failed'
             job.error_message = result.get('error', 'Unknown error')
             job.save(update_fields=['status', 'error_message'])
+            release_job_usage(job)
+            publish_job_status(job)
             
             logger.error(f"Job {job_id} failed: {job.error_message}")
             
@@ -179,91 +276,107 @@ def process_image_job(self, job_id):
     except ImageProcessingJob.DoesNotExist:
         logger.error(f"Job {job_id} not found")
         return {'success': False, 'error': f'Job {job_id} not found'}
+    
+    except Retry:
+        raise
         
     except Exception as e:
         logger.error(f"Unexpected error in job {job_id}: {str(e)}")
         
         try:
             job = ImageProcessingJob.objects.get(id=job_id)
+            if job.status == 'completed':
+                # Failed after delivery and charging - a retry would bill twice
+                return {'success': True, 'job_id': job_id}
             job.status = 'failed'
             job.error_message = f'System error: {str(e)}'
             job.save(update_fields=['status', 'error_message'])
+            publish_job_status(job)
         except:
             pass
         
         # Retry if we haven't exceeded max retries
         if self.request.retries < self.max_retries:
-            logger.info(f"Retrying job {job_id} (attempt {self.request.retries + 1})")
-            raise self.retry(countdown=30)
+            countdown = compute_retry_delay(self.request.retries)
+            logger.info(f"Retrying job {job_id} in {countdown}s (attempt {self.request.retries + 1})")
+            raise self.retry(countdown=countdown)
+        
+        # Out of retries - the reservation won't be used
+        try:
+            release_job_usage(ImageProcessingJob.objects.select_related('user_image').get(id=job_id))
+        except Exception:
+            pass
         
         return {'success': False, 'error': str(e)}
 
 
-def process_venue_job(job):
+def process_venue_job(job, force_fresh=False):
     """
     Process venue transformation job.
     Can use multiple input images for context.
     """
     try:
-        from .services import GeminiImageService
-        
-        service = GeminiImageService()
-        
         # Get all reference images (up to 5)
         reference_images = [job.user_image]  # Start with primary image
         
         # Add additional reference images if any
-        for ref in job.reference_images.all()[:4]:  # Max 4 additional (5 total)
+        for ref in job.reference_images.filter(reference_image__isnull=False).select_related('reference_image')[:4]:  # Max 4 additional (5 total)
             reference_images.append(ref.reference_image)
         
         logger.info(f"Processing venue job {job.id} with {len(reference_images)} image(s)")
         
-        # Read all images
-        image_data_list = []
-        for img in reference_images:
-            with img.image.open('rb') as image_file:
-                image_data_list.append(image_file.read())
-        
         # Get the generated prompt
         prompt = job.generated_prompt or "Transform this space into a beautiful wedding venue"
         
         logger.info(f"Venue prompt length: {len(prompt)} chars")
         
-        # Call Gemini API with multiple images - NO MODE PARAMETER
-        result = service.transform_with_multiple_images(
-            image_data_list=image_data_list,
-            prompt=prompt
-        )
+        # Identical inputs + prompt + model can reuse an earlier output
+        output_count = job.output_count or 1
+        cache_key = build_cache_key(reference_images, prompt, output_count=output_count)
+        result = None if force_fresh else get_cached_result(cache_key)
         
-        if result['success']:
-            # Save the generated image
-            processed_image = ProcessedImage(
-                processing_job=job,
-                gemini_model=result.get('model', 'gemini-2.5-flash-image-preview'),
-                finish_reason=result.get('finish_reason', 'STOP')
-            )
+        if result is None:
+            from .services import GeminiImageService
+            
+            service = GeminiImageService()
             
-            # Generate human-readable filename
-            readable_filename = generate_human_readable_filename(job, 'png')
+            # Downsampled, metadata-free copies (cached per UserImage)
+            image_data_list = [get_model_input_bytes(img) for img in reference_images]
+            
+            # Call Gemini API with multiple images - NO MODE PARAMETER
+            result = service.transform_with_multiple_images(
+                image_data_list=image_data_list,
+                prompt=prompt,
+                preprocessed=True,
+                output_count=output_count
+            )
+        
+        if result['success']:
+            # Save all generated variations together
+            processed_images = save_generated_images(job, result)
             
-            # Save the generated image
-            image_content = ContentFile(result['image_data'])
-            processed_image.processed_image.save(readable_filename, image_content, save=True)
+            if not result.get('cached'):
+                store_result(cache_key, processed_images)
             
-            logger.info(f"Successfully saved venue transformation: {readable_filename}")
+            filenames = [os.path.basename(p.processed_image.name) for p in processed_images]
+            logger.info(f"Successfully saved {len(processed_images)} venue transformation(s): {', '.join(filenames)}")
             
             return {
                 'success': True,
-                'processed_image_id': processed_image.id,
+                'processed_image_id': processed_images[0].id,
+                'processed_image_ids': [p.id for p in processed_images],
+                'processed_images': processed_images,
                 'model': result.get('model', 'gemini-2.5-flash-image-preview'),
                 'finish_reason': result.get('finish_reason', 'STOP'),
-                'filename': readable_filename
+                'filename': filenames[0]
             }
         else:
             logger.error(f"Venue transformation failed for job {job.id}: {result.get('error')}")
             return {
                 'success': False,
-                'error': result.get('error', 'Gemini API failed')
+                'error': result.get('error', 'Gemini API failed'),
+                'retryable': result.get('retryable', False),
+                'retry_after': result.get('retry_after')
             }
             
     except Exception as e:
@@ -274,71 +387,73 @@ def process_venue_job(job):
         }
 
 
-def process_portrait_job(job):
+def process_portrait_job(job, force_fresh=False):
     """
     Process portrait job (wedding or engagement).
     Uses multiple reference images (faces, clothing, pets, etc).
     """
     try:
-        from .services import GeminiImageService
-        
-        service = GeminiImageService()
-        
         # Get all reference images (up to 5)
         reference_images = [job.user_image]  # Start with primary image
         
         # Add additional reference images
-        for ref in job.reference_images.all()[:4]:  # Max 4 additional (5 total)
+        for ref in job.reference_images.filter(reference_image__isnull=False).select_related('reference_image')[:4]:  # Max 4 additional (5 total)
             reference_images.append(ref.reference_image)
         
         logger.info(f"Processing portrait job {job.id} with {len(reference_images)} reference image(s)")
         
-        # Read all images
-        image_data_list = []
-        for img in reference_images:
-            with img.image.open('rb') as image_file:
-                image_data_list.append(image_file.read())
-        
         # Get the generated prompt
         prompt = job.generated_prompt or "Generate a beautiful portrait photograph"
         
         logger.info(f"Portrait prompt length: {len(prompt)} chars")
         
-        # Call Gemini API with multiple reference images - NO MODE PARAMETER
-        result = service.transform_with_multiple_images(
-            image_data_list=image_data_list,
-            prompt=prompt
-        )
+        # Identical inputs + prompt + model can reuse an earlier output
+        output_count = job.output_count or 1
+        cache_key = build_cache_key(reference_images, prompt, output_count=output_count)
+        result = None if force_fresh else get_cached_result(cache_key)
         
-        if result['success']:
-            # Save the generated portrait
-            processed_image = ProcessedImage(
-                processing_job=job,
-                gemini_model=result.get('model', 'gemini-2.5-flash-image-preview'),
-                finish_reason=result.get('finish_reason', 'STOP')
-            )
+        if result is None:
+            from .services import GeminiImageService
             
-            # Generate human-readable filename
-            readable_filename = generate_human_readable_filename(job, 'png')
+            service = GeminiImageService()
             
-            # Save the generated image
-            image_content = ContentFile(result['image_data'])
-            processed_image.processed_image.save(readable_filename, image_content, save=True)
+            # Downsampled, metadata-free copies (cached per UserImage)
+            image_data_list = [get_model_input_bytes(img) for img in reference_images]
             
-            logger.info(f"Successfully saved portrait: {readable_filename}")
+            # Call Gemini API with multiple reference images - NO MODE PARAMETER
+            result = service.transform_with_multiple_images(
+                image_data_list=image_data_list,
+                prompt=prompt,
+                preprocessed=True,
+                output_count=output_count
+            )
+        
+        if result['success']:
+            # Save all generated variations together
+            processed_images = save_generated_images(job, result)
+            
+            if not result.get('cached'):
+                store_result(cache_key, processed_images)
+            
+            filenames = [os.path.basename(p.processed_image.name) for p in processed_images]
+            logger.info(f"Successfully saved {len(processed_images)} portrait(s): {', '.join(filenames)}")
             
             return {
                 'success': True,
-                'processed_image_id': processed_image.id,
+                'processed_image_id': processed_images[0].id,
+                'processed_image_ids': [p.id for p in processed_images],
+                'processed_images': processed_images,
                 'model': result.get('model', 'gemini-2.5-flash-image-preview'),
                 'finish_reason': result.get('finish_reason', 'STOP'),
-                'filename': readable_filename
+                'filename': filenames[0]
             }
         else:
             logger.error(f"Portrait generation failed for job {job.id}: {result.get('error')}")
             return {
                 'success': False,
-                'error': result.get('error', 'Gemini API failed')
+                'error': result.get('error', 'Gemini API failed'),
+                'retryable': result.get('retryable', False),
+                'retry_after': result.get('retry_after')
             }
             
     except Exception as e:
@@ -349,7 +464,45 @@ def process_portrait_job(job):
         }
 
 
-@shared_task
+def save_generated_images(job, result):
+    """
+    Save every generated variation for a job in one transaction.
+    
+    Returns:
+        list: ProcessedImage instances, in generation order
+    """
+    outputs = result.get('images') or [{
+        'image_data': result['image_data'],
+        'finish_reason': result.get('finish_reason', 'STOP')
+    }]
+    
+    processed_images = []
+    try:
+        with transaction.atomic():
+            for output in outputs:
+                processed_image = ProcessedImage(
+                    processing_job=job,
+                    gemini_model=result.get('model', 'gemini-2.5-flash-image-preview'),
+                    finish_reason=output.get('finish_reason', 'STOP')
+                )
+                
+                # Generate human-readable filename
+                readable_filename = generate_human_readable_filename(job, 'png')
+                
+                # Save the generated image
+                image_content = ContentFile(output['image_data'])
+                processed_image.processed_image.save(readable_filename, image_content, save=True)
+                processed_images.append(processed_image)
+    except Exception:
+        # Rows were rolled back - don't leave their files behind
+        for processed_image in processed_images:
+            processed_image.processed_image.delete(save=False)
+        raise
+    
+    return processed_images
+
+
+@shared_task(soft_time_limit=GENERATION_SOFT_TIME_LIMIT, time_limit=GENERATION_TIME_LIMIT)
 def process_realtime(job_id):
     """
     Synchronous processing for real-time results.
@@ -357,11 +510,15 @@ def process_realtime(job_id):
     """
     try:
         job = ImageProcessingJob.objects.get(id=job_id)
+        if job.status == 'completed':
+            logger.info(f"Job {job_id} already completed - skipping")
+            return {'success': True, 'job_id': job_id, 'already_completed': True}
         
         # Mark as processing
         job.status = 'processing'
         job.started_at = timezone.now()
         job.save(update_fields=['status', 'started_at'])
+        publish_job_status(job)
         
         # Process based on mode
         if job.studio_mode == 'venue':
@@ -372,19 +529,15 @@ def process_realtime(job_id):
             raise ValueError(f"Unknown studio mode: {job.studio_mode}")
         
         if result['success']:
-            # Increment usage
-            user = job.user_image.user
-            UsageTracker.increment_usage(user, 1)
-            
-            # Mark as completed
-            job.status = 'completed'
-            job.completed_at = timezone.now()
-            job.save(update_fields=['status', 'completed_at'])
+            # Completed and charged once for all outputs
+            complete_and_charge_job(job, job.user_image.user, len(result['processed_image_ids']))
+            publish_job_status(job, result['processed_images'])
             
             return {
                 'success': True,
                 'job_id': job_id,
                 'processed_image_id': result['processed_image_id'],
+                'processed_image_ids': result['processed_image_ids'],
                 'filename': result.get('filename', 'Output.png')
             }
         else:
@@ -392,6 +545,8 @@ def process_realtime(job_id):
             job.status = 'failed'
             job.error_message = result.get('error')
             job.save(update_fields=['status', 'error_message'])
+            release_job_usage(job)
+            publish_job_status(job)
             
             return {
                 'success': False,
@@ -401,9 +556,69 @@ def process_realtime(job_id):
             
     except Exception as e:
         logger.error(f"Error in real-time processing {job_id}: {str(e)}")
+        
+        # No retry here - fail the job and give its reserved credits back
+        try:
+            job = ImageProcessingJob.objects.select_related('user_image').get(id=job_id)
+            if job.status != 'completed':
+                job.status = 'failed'
+                job.error_message = f'System error: {str(e)}'
+                job.save(update_fields=['status', 'error_message'])
+                release_job_usage(job)
+                publish_job_status(job)
+        except Exception:
+            pass
+        
         return {'success': False, 'error': str(e)}
 
 
+def dispatch_image_batch(batch_id, job_ids, force_fresh=False, routing=None):
+    """
+    Fan a batch's jobs out as a chord: every job runs in parallel and
+    finalize_image_batch fires once after the last one finishes.
+    
+    routing (queue/priority from image_processing.queues) applies to the jobs;
+    the callback runs on the default queue.
+    """
+    header = [
+        process_image_job.s(job_id, force_fresh=force_fresh).set(**(routing or {}))
+        for job_id in job_ids
+    ]
+    result = chord(header)(finalize_image_batch.s(batch_id))
+    logger.info(f"Batch {batch_id} queued: {len(job_ids)} jobs, callback {result.id}")
+    return result
+
+
+@shared_task
+def finalize_image_batch(results, batch_id):
+    """
+    Chord callback - record the batch's final tally from the jobs themselves,
+    so retried or externally failed jobs are counted correctly.
+    """
+    try:
+        batch = ImageProcessingBatch.objects.get(id=batch_id)
+        counts = batch.job_counts()
+        
+        batch.completed_jobs = counts['completed']
+        batch.failed_jobs = counts['failed']
+        batch.status = 'completed' if counts['completed'] else 'failed'
+        batch.completed_at = timezone.now()
+        batch.save(update_fields=['completed_jobs', 'failed_jobs', 'status', 'completed_at'])
+        
+        logger.info(f"Batch {batch_id} finished: {counts['completed']} completed, {counts['failed']} failed")
+        
+        return {
+            'success': True,
+            'batch_id': batch_id,
+            'completed_jobs': counts['completed'],
+            'failed_jobs': counts['failed']
+        }
+        
+    except ImageProcessingBatch.DoesNotExist:
+        logger.error(f"Batch {batch_id} not found")
+        return {'success': False, 'error': f'Batch {batch_id} not found'}
+
+
 @shared_task(bind=True)
 def cleanup_old_jobs(self):
     """
@@ -418,7 +633,7 @@ def cleanup_old_jobs(self):
         stuck_jobs = ImageProcessingJob.objects.filter(
             status='processing',
             started_at__lt=cutoff_time
-        )
+        ).select_related('user_image')
         
         cleaned_count = 0
         for job in stuck_jobs:
@@ -426,6 +641,8 @@ def cleanup_old_jobs(self):
                 job.status = 'failed'
                 job.error_message = 'Processing timeout - job stuck for over 30 minutes'
                 job.save(update_fields=['status', 'error_message'])
+                release_job_usage(job)
+                publish_job_status(job)
                 
                 cleaned_count += 1
                 logger.info(f"Marked stuck job {job.id} as failed")
@@ -452,4 +669,34 @@ def cleanup_old_jobs(self):
         
     except Exception as e:
         logger.error(f"Error in cleanup_old_jobs: {str(e)}")
-        return {'error': str(e)}
\ No newline at end of file
+        return {'error': str(e)}
+
+@shared_task(bind=True, max_retries=2)
+def generate_user_image_thumbnails(self, user_image_id, force=False):
+    """
+    Build thumbnail/WebP derivatives for an uploaded image.
+    Queued after upload so the request never waits on resizing.
+    """
+    from .thumbnails import generate_derivatives
+    
+    try:
+        user_image = UserImage.objects.get(id=user_image_id)
+        derivatives = generate_derivatives(user_image, force=force)
+        
+        return {
+            'success': True,
+            'user_image_id': user_image_id,
+            'sizes': list(derivatives.keys())
+        }
+        
+    except UserImage.DoesNotExist:
+        logger.warning(f"UserImage {user_image_id} no longer exists, skipping thumbnails")
+        return {'success': False, 'error': f'UserImage {user_image_id} not found'}
+        
+    except Exception as e:
+        logger.error(f"Error generating thumbnails for image {user_image_id}: {str(e)}")
+        
+        if self.request.retries < self.max_retries:
+            raise self.retry(countdown=10)
+        
+        return {'success': False, 'error': str(e)}
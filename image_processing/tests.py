@@ -1,3 +1,157 @@
-from django.test import TestCase
+import fakeredis
+import pytest
 
-# Create your tests here.
+from image_processing import tasks
+from image_processing.models import ImageProcessingJob, UserImage
+from saas_base.users.tests.factories import UserFactory
+from usage_limits.redis_client import RedisClient
+from usage_limits.usage_tracker import UsageTracker
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def redis_client(monkeypatch):
+    """In-memory Redis (with Lua) in place of the shared client"""
+    client = fakeredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(RedisClient, "_instance", client)
+    return client
+
+
+@pytest.fixture
+def user(redis_client):
+    """A user whose cached plan allows 5 credits"""
+    user = UserFactory()
+    redis_client.set(UsageTracker._get_plan_key(user.id), UsageTracker._encode_plan(5, "active"))
+    return user
+
+
+@pytest.fixture
+def job(user):
+    """A queued venue job holding a 2-credit reservation"""
+    user_image = UserImage.objects.create(
+        user=user,
+        image="user_images/venue.png",
+        original_filename="venue.png",
+        file_size=1024,
+        width=800,
+        height=600,
+    )
+    return ImageProcessingJob.objects.create(
+        user_image=user_image,
+        studio_mode="venue",
+        output_count=2,
+        usage_reservation=UsageTracker.reserve_usage(user, 2),
+    )
+
+
+@pytest.fixture
+def generate(monkeypatch, job):
+    """Stub out generation with a successful 2-output result, counting calls"""
+    calls = []
+
+    def process_venue_job(job, force_fresh=False):
+        calls.append(job.pk)
+        return {
+            "success": True,
+            "processed_image_id": 1,
+            "processed_image_ids": [1, 2],
+            "processed_images": [],
+        }
+
+    monkeypatch.setattr(tasks, "process_venue_job", process_venue_job)
+    return calls
+
+
+def test_complete_and_charge_job_charges_once(user, job):
+    assert tasks.complete_and_charge_job(job, user, 2)
+    assert not tasks.complete_and_charge_job(ImageProcessingJob.objects.get(pk=job.pk), user, 2)
+
+    job.refresh_from_db()
+    assert job.status == "completed"
+    assert job.usage_reservation == ""
+    assert UsageTracker.get_current_usage(user) == 2
+    assert UsageTracker.get_reserved_usage(user) == 0
+
+
+def test_process_image_job_charges_delivered_outputs(settings, user, job, generate):
+    settings.CELERY_TASK_ALWAYS_EAGER = True
+
+    result = tasks.process_image_job.delay(job.pk).result
+
+    assert result["success"]
+    assert generate == [job.pk]
+    assert UsageTracker.get_current_usage(user) == 2
+    assert UsageTracker.get_reserved_usage(user) == 0
+
+
+def test_rerun_of_completed_job_skips_generation_and_charge(settings, user, job, generate):
+    settings.CELERY_TASK_ALWAYS_EAGER = True
+    tasks.process_image_job.delay(job.pk)
+
+    result = tasks.process_image_job.delay(job.pk).result
+
+    assert result["already_completed"]
+    assert generate == [job.pk]
+    assert UsageTracker.get_current_usage(user) == 2
+
+
+def test_error_after_completion_is_not_retried(settings, monkeypatch, user, job, generate):
+    settings.CELERY_TASK_ALWAYS_EAGER = True
+    publish_job_status = tasks.publish_job_status
+
+    def failing_publish(job, processed_images=None):
+        if job.status == "completed":
+            raise RuntimeError("broker went away")
+        publish_job_status(job, processed_images)
+
+    monkeypatch.setattr(tasks, "publish_job_status", failing_publish)
+
+    result = tasks.process_image_job.delay(job.pk).result
+
+    assert result["success"]
+    assert generate == [job.pk]
+    assert ImageProcessingJob.objects.get(pk=job.pk).status == "completed"
+    assert UsageTracker.get_current_usage(user) == 2
+
+
+def test_realtime_failure_releases_reservation(settings, monkeypatch, user, job):
+    settings.CELERY_TASK_ALWAYS_EAGER = True
+
+    def process_venue_job(job, force_fresh=False):
+        raise RuntimeError("storage unavailable")
+
+    monkeypatch.setattr(tasks, "process_venue_job", process_venue_job)
+
+    result = tasks.process_realtime.delay(job.pk).result
+
+    assert not result["success"]
+    assert ImageProcessingJob.objects.get(pk=job.pk).status == "failed"
+    assert UsageTracker.get_reserved_usage(user) == 0
+    assert UsageTracker.get_current_usage(user) == 0
+
+
+def test_merge_derivatives_reports_only_superseded_paths():
+    user_image = UserImage.objects.create(
+        user=UserFactory(),
+        image="user_images/venue.png",
+        thumbnail="thumbnails/venue_medium.webp",
+        derivatives={
+            "small": {"webp": "thumbnails/venue_small.webp"},
+            "medium": {"webp": "thumbnails/venue_medium.webp"},
+        },
+        original_filename="venue.png",
+        file_size=1024,
+        width=800,
+        height=600,
+    )
+
+    replaced = user_image.merge_derivatives(
+        {"medium": {"webp": "thumbnails/venue_medium_x1.webp"}},
+        thumbnail="thumbnails/venue_medium_x1.webp",
+    )
+
+    assert replaced == {"thumbnails/venue_medium.webp"}
+    user_image.refresh_from_db()
+    assert user_image.thumbnail.name == "thumbnails/venue_medium_x1.webp"
+    assert user_image.derivatives["small"] == {"webp": "thumbnails/venue_small.webp"}
@@ -0,0 +1,152 @@
+# image_processing/thumbnails.py - Derivative generation for uploaded images
+
+import logging
+import os
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image as PILImage, ImageOps
+
+logger = logging.getLogger(__name__)
+
+# Defaults - override with IMAGE_THUMBNAIL_CONFIG in settings
+DEFAULT_THUMBNAIL_CONFIG = {
+    'sizes': {
+        'small': 256,    # Favorites strip, admin previews
+        'medium': 512,   # Studio / gallery grids
+        'large': 1024,   # Detail pages, lightbox
+    },
+    'grid_size': 'medium',  # Size written to UserImage.thumbnail
+    'formats': ['webp', 'jpeg'],
+    'webp_quality': 80,
+    'jpeg_quality': 82,
+}
+
+FORMAT_EXTENSIONS = {
+    'webp': 'webp',
+    'jpeg': 'jpg',
+}
+
+
+def get_thumbnail_config():
+    """Merge settings overrides on top of the defaults"""
+    config = dict(DEFAULT_THUMBNAIL_CONFIG)
+    config.update(getattr(settings, 'IMAGE_THUMBNAIL_CONFIG', {}))
+    return config
+
+
+def _prepare_source(image_file, max_edge):
+    """
+    Open the original once, cheaply.
+    For JPEGs, draft() lets libjpeg decode at 1/2, 1/4 or 1/8 scale, which
+    skips most of the work on a 4000x3000 phone photo.
+    """
+    img = PILImage.open(image_file)
+    if img.format == 'JPEG':
+        img.draft('RGB', (max_edge, max_edge))
+
+    img = ImageOps.exif_transpose(img)
+
+    # Flatten transparency onto white - derivatives are always opaque
+    if img.mode in ('RGBA', 'LA', 'P'):
+        if img.mode == 'P':
+            img = img.convert('RGBA')
+        background = PILImage.new('RGB', img.size, (255, 255, 255))
+        background.paste(img, mask=img.split()[-1])
+        img = background
+    elif img.mode != 'RGB':
+        img = img.convert('RGB')
+
+    return img
+
+
+def _encode(img, image_format, config):
+    """Encode a PIL image to bytes in the requested format"""
+    buffer = BytesIO()
+    if image_format == 'webp':
+        img.save(buffer, format='WEBP', quality=config['webp_quality'], method=4)
+    else:
+        img.save(buffer, format='JPEG', quality=config['jpeg_quality'], optimize=True, progressive=True)
+    return buffer.getvalue()
+
+
+def derivative_path(user_image, size_name, image_format):
+    """Storage path for a derivative: thumbnails/<user_id>/<stem>_<size>.<ext>"""
+    stem = os.path.splitext(os.path.basename(user_image.image.name))[0]
+    ext = FORMAT_EXTENSIONS[image_format]
+    return f"thumbnails/{user_image.user_id}/{stem}_{size_name}.{ext}"
+
+
+def delete_unreferenced(user_image, paths):
+    """
+    Delete superseded derivative files once the row no longer points at them.
+    Rows created by UserImage.reuse_stored_upload share the same files, so
+    anything another upload of the same content still references is kept.
+    """
+    paths = set(paths)
+    if paths and user_image.content_hash:
+        siblings = type(user_image).objects.filter(
+            user_id=user_image.user_id,
+            content_hash=user_image.content_hash
+        ).exclude(pk=user_image.pk).values_list('thumbnail', 'derivatives')
+
+        for thumbnail, derivatives in siblings:
+            paths.discard(thumbnail)
+            for entry in (derivatives or {}).values():
+                paths.difference_update(entry.values())
+
+    for path in paths:
+        try:
+            default_storage.delete(path)
+        except Exception as e:
+            logger.warning(f"Could not delete superseded derivative {path}: {str(e)}")
+
+
+def generate_derivatives(user_image, force=False):
+    """
+    Generate all configured sizes/formats for a UserImage and store them.
+
+    Sizes are produced largest-first from a single decode, each one
+    downsampled from the previous, so the original is only read once.
+
+    Args:
+        user_image: UserImage instance
+        force: Regenerate even if derivatives already exist
+
+    Returns:
+        dict: {size_name: {format: storage_path}}
+    """
+    config = get_thumbnail_config()
+    sizes = sorted(config['sizes'].items(), key=lambda item: item[1], reverse=True)
+
+    existing = user_image.derivatives or {}
+    if user_image.thumbnail and all(name in existing for name, _ in sizes) and not force:
+        return {size_name: existing[size_name] for size_name, _ in sizes}
+
+    with user_image.image.open('rb') as image_file:
+        working = _prepare_source(image_file, sizes[0][1])
+        working.load()
+
+    derivatives = {}
+    for size_name, max_edge in sizes:
+        # thumbnail() never upscales, so small originals are kept as-is
+        working.thumbnail((max_edge, max_edge), PILImage.LANCZOS)
+
+        derivatives[size_name] = {}
+        for image_format in config['formats']:
+            # Storage picks a fresh name if the path is taken, so the files the
+            # row currently points at stay readable until the swap below
+            path = derivative_path(user_image, size_name, image_format)
+            saved_path = default_storage.save(path, ContentFile(_encode(working, image_format, config)))
+            derivatives[size_name][image_format] = saved_path
+
+    grid = derivatives.get(config['grid_size']) or derivatives[sizes[-1][0]]
+    # Merged under a row lock - keeps entries written by other stages (e.g. cached model inputs)
+    replaced = user_image.merge_derivatives(derivatives, thumbnail=grid.get('webp') or next(iter(grid.values())))
+    delete_unreferenced(user_image, replaced)
+
+    logger.info(f"Generated {len(sizes)} derivative size(s) for image {user_image.id}")
+    return {size_name: derivatives[size_name] for size_name, _ in sizes}
+
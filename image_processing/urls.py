@@ -19,6 +19,8 @@ urlpatterns = [
     # Image Processing
     path('image/<int:pk>/', views.image_detail, name='image_detail'),
     path('image/<int:pk>/process/', views.process_wedding_image, name='process_wedding_image'),
+    path('batch/', views.process_batch, name='process_batch'),
+    path('batch/<int:batch_id>/status/', views.batch_status, name='batch_status'),
     
     # Gallery and History
     path('history/', views.image_gallery, name='image_gallery'),
@@ -26,6 +28,7 @@ urlpatterns = [
     
     # Job Status
     path('job/<int:job_id>/status/', views.job_status, name='job_status'),
+    path('job/<int:job_id>/state/', views.job_state, name='job_state'),
     
     # Processed Images
     path('processed/<int:pk>/', views.processed_image_detail, name='processed_image_detail'),
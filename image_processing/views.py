@@ -1,6 +1,7 @@
 import json
 import logging
-import io
+import tempfile
+from django.conf import settings
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
@@ -12,25 +13,27 @@ from urllib.parse import urlencode
 from django.utils import timezone
 from django.core.paginator import Paginator
 from django.db.models import Q
-from django.core.files.base import ContentFile
-from PIL import Image, ImageOps
+from django.core.files.base import File
+from PIL import ExifTags, Image, ImageOps
 
 from usage_limits.decorators import usage_limit_required
 from .models import (
-    UserImage, ImageProcessingJob, ProcessedImage, Collection, CollectionItem, 
-    Favorite, FavoriteUpload, JobReferenceImage,
-    WEDDING_THEMES, SPACE_TYPES, COLOR_SCHEMES,
-    ENGAGEMENT_SETTINGS, ENGAGEMENT_ACTIVITIES,
-    WEDDING_MOMENTS, WEDDING_SETTINGS, ATTIRE_STYLES,
-    COMPOSITION_CHOICES, EMOTIONAL_TONE_CHOICES
+    UserImage, ImageProcessingJob, ImageProcessingBatch, ProcessedImage, Collection, CollectionItem, 
+    Favorite, FavoriteUpload, JobReferenceImage, compute_content_hash,
+    SPACE_TYPES, ATTIRE_STYLES, COMPOSITION_CHOICES, EMOTIONAL_TONE_CHOICES,
+    SORTED_CHOICES, get_choice_label
 )
 from .forms import ImageUploadForm
-from .tasks import process_image_job
+from .tasks import process_image_job, dispatch_image_batch, generate_user_image_thumbnails
+from .job_events import get_job_event, publish_job_status
+from .queues import get_generation_routing
+from .services import GeminiCircuitBreaker
 
 logger = logging.getLogger(__name__)
 
 ALLOWED_IMAGE_FORMATS = ['jpg', 'jpeg', 'png', 'webp']
 ALLOWED_MIME_TYPES = ['image/jpeg', 'image/png', 'image/webp']
+MAX_BATCH_JOBS = 25
 
 
 # ============================================================================
@@ -38,46 +41,95 @@ ALLOWED_MIME_TYPES = ['image/jpeg', 'image/png', 'image/webp']
 # ============================================================================
 
 def apply_exif_correction(uploaded_file):
-    """Apply EXIF orientation correction to uploaded image file"""
+    """
+    Apply EXIF orientation correction to uploaded image file.
+    
+    Only the header is read to get the size and orientation tag; pixels are
+    decoded and re-encoded only when the photo actually needs rotating. The
+    rotated copy is spooled to a temp file once it outgrows
+    FILE_UPLOAD_MAX_MEMORY_SIZE instead of being held in memory.
+    
+    Returns:
+        tuple: (file to store, (width, height) or None if unreadable)
+    """
     try:
         image = Image.open(uploaded_file)
-        
-        if hasattr(image, '_getexif') and image._getexif() is not None:
-            corrected_image = ImageOps.exif_transpose(image)
+        dimensions = image.size
+        orientation = image.getexif().get(ExifTags.Base.Orientation, 1)
+        
+        if orientation in (None, 1):
+            logger.info(f"No EXIF correction needed for {uploaded_file.name}")
+            uploaded_file.seek(0)
+            return uploaded_file, dimensions
+        
+        image_format = image.format or 'JPEG'
+        corrected_image = ImageOps.exif_transpose(image)
+        del image
+        logger.info(f"Applied EXIF orientation correction to {uploaded_file.name}")
+        
+        output = tempfile.SpooledTemporaryFile(max_size=settings.FILE_UPLOAD_MAX_MEMORY_SIZE)
+        
+        if image_format.upper() == 'JPEG':
+            if corrected_image.mode in ('RGBA', 'LA', 'P'):
+                background = Image.new('RGB', corrected_image.size, (255, 255, 255))
+                if corrected_image.mode == 'P':
+                    corrected_image = corrected_image.convert('RGBA')
+                background.paste(corrected_image, mask=corrected_image.split()[-1] if corrected_image.mode == 'RGBA' else None)
+                corrected_image = background
             
-            if corrected_image is not image:
-                logger.info(f"Applied EXIF orientation correction to {uploaded_file.name}")
-                
-                output = io.BytesIO()
-                image_format = image.format or 'JPEG'
-                
-                if image_format.upper() == 'JPEG':
-                    if corrected_image.mode in ('RGBA', 'LA', 'P'):
-                        background = Image.new('RGB', corrected_image.size, (255, 255, 255))
-                        if corrected_image.mode == 'P':
-                            corrected_image = corrected_image.convert('RGBA')
-                        background.paste(corrected_image, mask=corrected_image.split()[-1] if corrected_image.mode == 'RGBA' else None)
-                        corrected_image = background
-                    
-                    corrected_image.save(output, format='JPEG', quality=95, optimize=True)
-                else:
-                    corrected_image.save(output, format=image_format)
-                
-                output.seek(0)
-                corrected_file = ContentFile(output.getvalue(), name=uploaded_file.name)
-                corrected_file.content_type = uploaded_file.content_type
-                
-                return corrected_file
-            else:
-                logger.info(f"No EXIF correction needed for {uploaded_file.name}")
-                return uploaded_file
+            corrected_image.save(output, format='JPEG', quality=95, optimize=True)
         else:
-            logger.info(f"No EXIF data found in {uploaded_file.name}")
-            return uploaded_file
+            corrected_image.save(output, format=image_format)
+        
+        dimensions = corrected_image.size
+        corrected_image.close()
+        
+        output.seek(0)
+        corrected_file = File(output, name=uploaded_file.name)
+        corrected_file.content_type = uploaded_file.content_type
+        
+        return corrected_file, dimensions
             
     except Exception as e:
         logger.warning(f"Error applying EXIF correction to {uploaded_file.name}: {str(e)}")
-        return uploaded_file
+        uploaded_file.seek(0)
+        return uploaded_file, None
+
+
+def queue_thumbnail_generation(user_image):
+    """Generate derivatives off the request path once the upload is committed"""
+    image_id = user_image.id
+    transaction.on_commit(lambda: generate_user_image_thumbnails.delay(image_id))
+
+
+def store_user_upload(user_image, uploaded_file):
+    """
+    EXIF-correct, hash and save an upload on an unsaved UserImage.
+    
+    If the same user already uploaded identical content, the new row reuses
+    that stored file, its dimensions and derivatives instead of writing a
+    second copy.
+    """
+    corrected_file, dimensions = apply_exif_correction(uploaded_file)
+    
+    user_image.original_filename = uploaded_file.name
+    user_image.content_hash = compute_content_hash(corrected_file)
+    
+    if user_image.reuse_stored_upload():
+        logger.info(f"Reusing stored upload for {uploaded_file.name} (hash {user_image.content_hash[:12]})")
+    else:
+        user_image.image = corrected_file
+        if dimensions:
+            # Already known from the header - save() won't reopen the file
+            user_image.width, user_image.height = dimensions
+            user_image.file_size = corrected_file.size
+    
+    user_image.save()
+    
+    if not user_image.thumbnail:
+        queue_thumbnail_generation(user_image)
+    
+    return user_image
 
 
 def validate_image_format(uploaded_file):
@@ -179,6 +231,128 @@ def generate_prompt_for_job(studio_mode, **params):
         return "Generate a beautiful image"
 
 
+def circuit_open_response():
+    """503 for new submissions while the Gemini circuit is open, else None"""
+    state, retry_after = GeminiCircuitBreaker.get_state()
+    if state != 'open':
+        return None
+    
+    retry_after = max(1, int(retry_after))
+    response = JsonResponse({
+        'success': False,
+        'error': 'Image generation is temporarily unavailable. Please try again in a minute.',
+        'retryable': True,
+        'retry_after': retry_after
+    }, status=503)
+    response['Retry-After'] = str(retry_after)
+    return response
+
+
+def parse_job_spec(data):
+    """
+    Validate one job request and collect its ImageProcessingJob fields.
+    Shared by the single-image and batch studio endpoints.
+    
+    Args:
+        data: Decoded JSON job request
+        
+    Returns:
+        dict: studio_mode, job_params, output_count, reference_image_ids
+        
+    Raises:
+        ValueError: With a user-facing message if the request is invalid
+    """
+    studio_mode = data.get('studio_mode', 'venue')
+    if studio_mode not in ['venue', 'portrait_wedding', 'portrait_engagement']:
+        raise ValueError('Invalid studio mode')
+    
+    user_instructions = data.get('user_instructions', '').strip()
+    custom_prompt = data.get('custom_prompt', '').strip()
+    
+    # Number of variations - each one costs a credit
+    try:
+        output_count = int(data.get('output_count', 1) or 1)
+    except (TypeError, ValueError):
+        output_count = 0
+    if output_count < 1 or output_count > 5:
+        raise ValueError('Output count must be between 1 and 5')
+    
+    if custom_prompt and len(custom_prompt) < 10:
+        raise ValueError('Custom prompt is too short')
+    
+    # Collect all job parameters
+    job_params = {
+        'user_instructions': user_instructions if user_instructions else None,
+        'custom_prompt': custom_prompt if custom_prompt else None
+    }
+    
+    # Mode-specific validation and parameters
+    if studio_mode == 'venue':
+        wedding_theme = data.get('wedding_theme', '').strip()
+        space_type = data.get('space_type', '').strip()
+        
+        if not custom_prompt and not wedding_theme:
+            raise ValueError('Wedding style is required for venue mode')
+        
+        job_params.update({
+            'wedding_theme': wedding_theme,
+            'space_type': space_type if space_type else '',
+        })
+        
+    elif studio_mode == 'portrait_engagement':
+        # Engagement portrait mode
+        engagement_setting = data.get('engagement_setting', '').strip()
+        engagement_activity = data.get('engagement_activity', '').strip()
+        
+        if not custom_prompt and not engagement_activity:
+            raise ValueError('Activity/pose is required for engagement mode')
+        
+        job_params.update({
+            'engagement_setting': engagement_setting if engagement_setting else '',
+            'engagement_activity': engagement_activity,
+            'attire_style': data.get('attire_style', ''),
+            'composition': data.get('composition', ''),
+            'emotional_tone': data.get('emotional_tone', ''),
+        })
+        
+    elif studio_mode == 'portrait_wedding':
+        # Wedding portrait mode
+        wedding_setting = data.get('wedding_setting', '').strip()
+        wedding_moment = data.get('wedding_moment', '').strip()
+        
+        if not custom_prompt and not wedding_moment:
+            raise ValueError('Moment/scene is required for wedding portrait mode')
+        
+        job_params.update({
+            'wedding_setting': wedding_setting if wedding_setting else '',
+            'wedding_moment': wedding_moment,
+            'attire_style': data.get('attire_style', ''),
+            'composition': data.get('composition', ''),
+            'emotional_tone': data.get('emotional_tone', ''),
+        })
+    
+    # Optional fields
+    optional_fields = ['season', 'lighting_mood', 'color_scheme']
+    for field in optional_fields:
+        value = data.get(field, '').strip()
+        if value:
+            job_params[field] = value
+    
+    # Get reference image IDs - Max 2 additional images (3 total including primary)
+    reference_image_ids = data.get('reference_image_ids', [])
+    if reference_image_ids and isinstance(reference_image_ids, list):
+        reference_image_ids = reference_image_ids[:2]
+    else:
+        reference_image_ids = []
+    
+    return {
+        'studio_mode': studio_mode,
+        'job_params': job_params,
+        'output_count': output_count,
+        'reference_image_ids': reference_image_ids,
+    }
+
+
 # ============================================================================
 # MAIN VIEWS
 # ============================================================================
@@ -192,17 +366,14 @@ def wedding_studio(request):
         if form.is_valid():
             try:
                 original_file = form.cleaned_data['image']
-                corrected_file = apply_exif_correction(original_file)
                 
                 user_image = form.save(commit=False)
                 user_image.user = request.user
-                user_image.original_filename = original_file.name
-                user_image.image = corrected_file
                 
                 if not user_image.image_type:
                     user_image.image_type = 'venue'
                 
-                user_image.save()
+                store_user_upload(user_image, original_file)
                 
                 if request.headers.get('x-requested-with') == 'XMLHttpRequest':
                     return JsonResponse({
@@ -210,7 +381,7 @@ def wedding_studio(request):
                         'message': f'"{user_image.original_filename}" uploaded successfully!',
                         'image_id': user_image.id,
                         'image_url': user_image.image.url,
-                        'thumbnail_url': user_image.thumbnail.url if user_image.thumbnail else user_image.image.url,
+                        'thumbnail_url': user_image.thumbnail_url,
                         'image_name': user_image.original_filename,
                         'image_type': user_image.image_type,
                         'width': user_image.width,
@@ -271,13 +442,6 @@ def wedding_studio(request):
         for processed_image in job.processed_images.all():
             processed_image.is_favorited = processed_image.id in favorite_ids
     
-    sorted_wedding_themes = sorted(WEDDING_THEMES, key=lambda x: x[1])
-    sorted_color_schemes = sorted(COLOR_SCHEMES, key=lambda x: x[1])
-    sorted_engagement_activities = sorted(ENGAGEMENT_ACTIVITIES, key=lambda x: x[1])
-    sorted_engagement_settings = sorted(ENGAGEMENT_SETTINGS, key=lambda x: x[1])
-    sorted_wedding_moments = sorted(WEDDING_MOMENTS, key=lambda x: x[1])
-    sorted_wedding_settings = sorted(WEDDING_SETTINGS, key=lambda x: x[1])
-
     from .forms import SEASON_CHOICES, LIGHTING_CHOICES
 
     context = {
@@ -285,16 +449,16 @@ def wedding_studio(request):
         'preselected_image': preselected_image,
         'usage_data': usage_data,
         'recent_jobs': recent_jobs,
-        'wedding_themes': sorted_wedding_themes,
+        'wedding_themes': SORTED_CHOICES['wedding_theme'],
         'space_types': SPACE_TYPES,
-        'engagement_activities': sorted_engagement_activities,
-        'engagement_settings': sorted_engagement_settings,
-        'wedding_moments': sorted_wedding_moments,
-        'wedding_settings': sorted_wedding_settings,
+        'engagement_activities': SORTED_CHOICES['engagement_activity'],
+        'engagement_settings': SORTED_CHOICES['engagement_setting'],
+        'wedding_moments': SORTED_CHOICES['wedding_moment'],
+        'wedding_settings': SORTED_CHOICES['wedding_setting'],
         'attire_styles': ATTIRE_STYLES,
         'composition_choices': COMPOSITION_CHOICES,
         'emotional_tone_choices': EMOTIONAL_TONE_CHOICES,
-        'color_schemes': sorted_color_schemes,
+        'color_schemes': SORTED_CHOICES['color_scheme'],
         'season_choices': SEASON_CHOICES,
         'lighting_choices': LIGHTING_CHOICES,
         'upload_form': ImageUploadForm(),
@@ -332,17 +496,14 @@ def ajax_upload_image(request):
     if form.is_valid():
         try:
             original_file = form.cleaned_data['image']
-            corrected_file = apply_exif_correction(original_file)
             
             user_image = form.save(commit=False)
             user_image.user = request.user
-            user_image.original_filename = original_file.name
-            user_image.image = corrected_file
             
             if not user_image.image_type:
                 user_image.image_type = 'venue'
             
-            user_image.save()
+            store_user_upload(user_image, original_file)
             
             logger.info(f"Image uploaded successfully: {user_image.original_filename} (type: {user_image.image_type}, size: {user_image.file_size} bytes)")
             
@@ -350,7 +511,7 @@ def ajax_upload_image(request):
                 'success': True,
                 'image_id': user_image.id,
                 'image_url': user_image.image.url,
-                'thumbnail_url': user_image.thumbnail.url if user_image.thumbnail else user_image.image.url,
+                'thumbnail_url': user_image.thumbnail_url,
                 'image_name': user_image.original_filename,
                 'image_type': user_image.image_type,
                 'width': user_image.width,
@@ -404,6 +565,11 @@ def process_wedding_image(request, pk):
                 'needs_upgrade': True
             }, status=429)
         
+        # Refuse early rather than queue work Gemini can't take right now
+        unavailable = circuit_open_response()
+        if unavailable:
+            return unavailable
+        
         try:
             data = json.loads(request.body)
         except json.JSONDecodeError:
@@ -412,107 +578,26 @@ def process_wedding_image(request, pk):
                 'error': 'Invalid request data'
             }, status=400)
         
-        studio_mode = data.get('studio_mode', 'venue')
-        if studio_mode not in ['venue', 'portrait_wedding', 'portrait_engagement']:
+        try:
+            job_spec = parse_job_spec(data)
+        except ValueError as e:
             return JsonResponse({
                 'success': False,
-                'error': 'Invalid studio mode'
+                'error': str(e)
             }, status=400)
         
-        user_instructions = data.get('user_instructions', '').strip()
-        custom_prompt = data.get('custom_prompt', '').strip()
+        studio_mode = job_spec['studio_mode']
+        job_params = job_spec['job_params']
+        output_count = job_spec['output_count']
+        reference_image_ids = job_spec['reference_image_ids']
+        user_instructions = job_params['user_instructions']
         
-        if custom_prompt and len(custom_prompt) < 10:
-            return JsonResponse({
-                'success': False,
-                'error': 'Custom prompt is too short'
-            }, status=400)
-        
-        # Collect all job parameters
-        job_params = {
-            'user_instructions': user_instructions if user_instructions else None,
-            'custom_prompt': custom_prompt if custom_prompt else None
-        }
-        
-        # Mode-specific validation and parameters
-        if studio_mode == 'venue':
-            wedding_theme = data.get('wedding_theme', '').strip()
-            space_type = data.get('space_type', '').strip()
-            
-            if not custom_prompt and not wedding_theme:
-                return JsonResponse({
-                    'success': False,
-                    'error': 'Wedding style is required for venue mode'
-                }, status=400)
-            
-            job_params.update({
-                'wedding_theme': wedding_theme,
-                'space_type': space_type if space_type else '',
-            })
-            
-        elif studio_mode == 'portrait_engagement':
-            # Engagement portrait mode
-            engagement_setting = data.get('engagement_setting', '').strip()
-            engagement_activity = data.get('engagement_activity', '').strip()
-            
-            if not custom_prompt and not engagement_activity:
-                return JsonResponse({
-                    'success': False,
-                    'error': 'Activity/pose is required for engagement mode'
-                }, status=400)
-            
-            job_params.update({
-                'engagement_setting': engagement_setting if engagement_setting else '',
-                'engagement_activity': engagement_activity,
-                'attire_style': data.get('attire_style', ''),
-                'composition': data.get('composition', ''),
-                'emotional_tone': data.get('emotional_tone', ''),
-            })
-            
-        elif studio_mode == 'portrait_wedding':
-            # Wedding portrait mode
-            wedding_setting = data.get('wedding_setting', '').strip()
-            wedding_moment = data.get('wedding_moment', '').strip()
-            
-            if not custom_prompt and not wedding_moment:
-                return JsonResponse({
-                    'success': False,
-                    'error': 'Moment/scene is required for wedding portrait mode'
-                }, status=400)
-            
-            job_params.update({
-                'wedding_setting': wedding_setting if wedding_setting else '',
-                'wedding_moment': wedding_moment,
-                'attire_style': data.get('attire_style', ''),
-                'composition': data.get('composition', ''),
-                'emotional_tone': data.get('emotional_tone', ''),
-            })
-        
-        # Optional fields
-        optional_fields = ['season', 'lighting_mood', 'color_scheme']
-        for field in optional_fields:
-            value = data.get(field, '').strip()
-            if value:
-                job_params[field] = value
-        
-        # Get reference image IDs - Max 2 additional images (3 total including primary)
-        reference_image_ids = data.get('reference_image_ids', [])
-        if reference_image_ids and isinstance(reference_image_ids, list):
-            # Enforce max 3 images total (primary + up to 2 references)
-            reference_image_ids = reference_image_ids[:2]
-        else:
-            reference_image_ids = []
+        # Skip the generation result cache (e.g. "give me a different take")
+        force_fresh = bool(data.get('force_fresh', False))
         
         # Calculate total image count
         total_image_count = 1 + len(reference_image_ids)
         
-        # Validate max 3 images
-        if total_image_count > 3:
-            return JsonResponse({
-                'success': False,
-                'error': 'Maximum 3 images allowed per transformation'
-            }, status=400)
-        
         # CRITICAL: Generate prompt BEFORE creating job
         generated_prompt = generate_prompt_for_job(
             studio_mode=studio_mode,
@@ -521,35 +606,60 @@ def process_wedding_image(request, pk):
         
         logger.info(f"Generated prompt for {studio_mode} with {total_image_count} images, length: {len(generated_prompt)} chars")
         
+        # Hold the credits now so concurrent submissions can't overspend;
+        # the task commits what it delivers or releases them on failure
+        reservation_id = UsageTracker.reserve_usage(request.user, output_count)
+        if reservation_id is None:
+            usage_data = UsageTracker.get_usage_data(request.user)
+            return JsonResponse({
+                'success': False,
+                'error': f"Not enough credits for {output_count} photos ({usage_data['remaining']} remaining).",
+                'usage_data': usage_data,
+                'needs_upgrade': True
+            }, status=429)
+        
         # Now create job with pre-generated prompt
-        with transaction.atomic():
-            job = ImageProcessingJob.objects.create(
-                user_image=user_image,
-                studio_mode=studio_mode,
-                generated_prompt=generated_prompt,  # Already generated!
-                **job_params
-            )
-            
-            # Attach reference images
-            for order, ref_id in enumerate(reference_image_ids):
-                try:
-                    ref_image = UserImage.objects.get(id=ref_id, user=request.user)
-                    JobReferenceImage.objects.create(
-                        job=job,
-                        reference_image=ref_image,
-                        order=order
-                    )
-                    logger.info(f"Added reference image {ref_id} to job {job.id}")
-                except UserImage.DoesNotExist:
-                    logger.warning(f"Reference image {ref_id} not found")
-                    continue
-            
-            logger.info(f"Created {studio_mode} job {job.id} with prompt pre-generated, {len(reference_image_ids)} reference images")
+        try:
+            with transaction.atomic():
+                job = ImageProcessingJob.objects.create(
+                    user_image=user_image,
+                    studio_mode=studio_mode,
+                    generated_prompt=generated_prompt,  # Already generated!
+                    output_count=output_count,
+                    usage_reservation=reservation_id,
+                    **job_params
+                )
+                
+                # Attach reference images
+                for order, ref_id in enumerate(reference_image_ids):
+                    try:
+                        ref_image = UserImage.objects.get(id=ref_id, user=request.user)
+                        JobReferenceImage.objects.create(
+                            job=job,
+                            reference_image=ref_image,
+                            order=order
+                        )
+                        logger.info(f"Added reference image {ref_id} to job {job.id}")
+                    except UserImage.DoesNotExist:
+                        logger.warning(f"Reference image {ref_id} not found")
+                        continue
+                
+                logger.info(f"Created {studio_mode} job {job.id} with prompt pre-generated, {len(reference_image_ids)} reference images")
+        except Exception:
+            UsageTracker.release_usage(request.user.id, reservation_id)
+            raise
+        
+        # Queue the task - paid tiers go to their own queue, ahead of free users
+        routing = get_generation_routing(request.user)
         
-        # Queue the task
         def queue_transformation():
-            task_result = process_image_job.apply_async(args=[job.id])
-            logger.info(f"Task queued: {task_result.id} for job {job.id}")
+            publish_job_status(job)
+            task_result = process_image_job.apply_async(
+                args=[job.id],
+                kwargs={'force_fresh': force_fresh},
+                **routing
+            )
+            logger.info(f"Task queued: {task_result.id} for job {job.id} on {routing['queue']} (priority {routing['priority']})")
             return task_result
         
         transaction.on_commit(queue_transformation)
@@ -564,6 +674,7 @@ def process_wedding_image(request, pk):
                 'mode': studio_mode,
                 'model': 'gemini-2.5-flash-image-preview',
                 'image_count': total_image_count,
+                'output_count': output_count,
                 'has_user_instructions': bool(user_instructions),
                 'prompt_length': len(generated_prompt)
             }
@@ -577,6 +688,228 @@ def process_wedding_image(request, pk):
         }, status=500)
 
 
+@login_required
+@require_http_methods(["POST"])
+def process_batch(request):
+    """
+    Batch studio: submit many jobs in one request, e.g. one venue photo in
+    20 themes. Every spec is validated and the quota checked once for the
+    whole batch before anything is created; jobs are bulk-created and fanned
+    out as a Celery chord that records the batch's final tally. Credits
+    for every job are reserved in one atomic step.
+    
+    Body: {"defaults": {...}, "jobs": [{...}, ...], "force_fresh": false}
+    Each job takes the same fields as process_wedding_image plus image_id;
+    keys in "defaults" apply to every job unless the job overrides them.
+    """
+    try:
+        unavailable = circuit_open_response()
+        if unavailable:
+            return unavailable
+        
+        try:
+            data = json.loads(request.body)
+        except json.JSONDecodeError:
+            return JsonResponse({
+                'success': False,
+                'error': 'Invalid request data'
+            }, status=400)
+        
+        defaults = data.get('defaults') or {}
+        specs = data.get('jobs')
+        if not isinstance(defaults, dict) or not isinstance(specs, list) or not all(isinstance(spec, dict) for spec in specs):
+            return JsonResponse({
+                'success': False,
+                'error': 'Invalid request data'
+            }, status=400)
+        
+        if not specs:
+            return JsonResponse({
+                'success': False,
+                'error': 'At least one job is required'
+            }, status=400)
+        
+        if len(specs) > MAX_BATCH_JOBS:
+            return JsonResponse({
+                'success': False,
+                'error': f'A batch can contain at most {MAX_BATCH_JOBS} jobs'
+            }, status=400)
+        
+        force_fresh = bool(data.get('force_fresh', False))
+        
+        # Validate every spec before touching the database
+        job_specs = []
+        for index, spec in enumerate(specs, start=1):
+            merged = {**defaults, **spec}
+            try:
+                job_spec = parse_job_spec(merged)
+            except ValueError as e:
+                return JsonResponse({
+                    'success': False,
+                    'error': f'Job {index}: {str(e)}',
+                    'job_index': index
+                }, status=400)
+            
+            try:
+                job_spec['image_id'] = int(merged.get('image_id'))
+                job_spec['reference_image_ids'] = list(dict.fromkeys(
+                    int(ref_id) for ref_id in job_spec['reference_image_ids']
+                ))
+            except (TypeError, ValueError):
+                return JsonResponse({
+                    'success': False,
+                    'error': f'Job {index}: Invalid image ID',
+                    'job_index': index
+                }, status=400)
+            
+            job_specs.append(job_spec)
+        
+        total_outputs = sum(job_spec['output_count'] for job_spec in job_specs)
+        
+        # One query for every primary and reference image in the batch
+        image_ids = set()
+        for job_spec in job_specs:
+            image_ids.add(job_spec['image_id'])
+            image_ids.update(job_spec['reference_image_ids'])
+        user_images = UserImage.objects.filter(user=request.user).in_bulk(image_ids)
+        
+        for index, job_spec in enumerate(job_specs, start=1):
+            if job_spec['image_id'] not in user_images:
+                return JsonResponse({
+                    'success': False,
+                    'error': f'Job {index}: Image not found',
+                    'job_index': index
+                }, status=404)
+        
+        # One atomic reservation for the whole batch - all jobs or none
+        from usage_limits.usage_tracker import UsageTracker
+        reservation_ids = UsageTracker.reserve_usage_many(
+            request.user, [job_spec['output_count'] for job_spec in job_specs]
+        )
+        if reservation_ids is None:
+            usage_data = UsageTracker.get_usage_data(request.user)
+            return JsonResponse({
+                'success': False,
+                'error': f"Not enough credits for {total_outputs} photos ({usage_data['remaining']} remaining).",
+                'usage_data': usage_data,
+                'needs_upgrade': True
+            }, status=429)
+        
+        try:
+            with transaction.atomic():
+                batch = ImageProcessingBatch.objects.create(
+                    user=request.user,
+                    total_jobs=len(job_specs)
+                )
+                
+                jobs = ImageProcessingJob.objects.bulk_create([
+                    ImageProcessingJob(
+                        batch=batch,
+                        user_image=user_images[job_spec['image_id']],
+                        studio_mode=job_spec['studio_mode'],
+                        generated_prompt=generate_prompt_for_job(
+                            studio_mode=job_spec['studio_mode'],
+                            **job_spec['job_params']
+                        ),
+                        output_count=job_spec['output_count'],
+                        usage_reservation=reservation_id,
+                        **job_spec['job_params']
+                    )
+                    for job_spec, reservation_id in zip(job_specs, reservation_ids)
+                ])
+                
+                JobReferenceImage.objects.bulk_create([
+                    JobReferenceImage(
+                        job=job,
+                        reference_image=user_images[ref_id],
+                        order=order
+                    )
+                    for job, job_spec in zip(jobs, job_specs)
+                    for order, ref_id in enumerate(
+                        ref_id for ref_id in job_spec['reference_image_ids'] if ref_id in user_images
+                    )
+                ])
+                
+                logger.info(f"Created batch {batch.id} with {len(jobs)} jobs ({total_outputs} outputs) for user {request.user.id}")
+        except Exception:
+            for reservation_id in reservation_ids:
+                UsageTracker.release_usage(request.user.id, reservation_id)
+            raise
+        
+        routing = get_generation_routing(request.user, batch=True)
+        
+        def queue_batch():
+            for job in jobs:
+                publish_job_status(job)
+            dispatch_image_batch(batch.id, [job.id for job in jobs], force_fresh=force_fresh, routing=routing)
+        
+        transaction.on_commit(queue_batch)
+        
+        return JsonResponse({
+            'success': True,
+            'batch_id': batch.id,
+            'job_ids': [job.id for job in jobs],
+            'status': batch.status,
+            'total_jobs': batch.total_jobs,
+            'total_outputs': total_outputs,
+            'status_url': reverse('image_processing:batch_status', args=[batch.id]),
+        })
+        
+    except Exception as e:
+        logger.error(f"Error in process_batch: {str(e)}", exc_info=True)
+        return JsonResponse({
+            'success': False,
+            'error': 'An unexpected error occurred. Please try again.'
+        }, status=500)
+
+
+@login_required
+def batch_status(request, batch_id):
+    """Aggregated progress of a batch, plus each job's status and outputs"""
+    batch = get_object_or_404(ImageProcessingBatch, id=batch_id, user=request.user)
+    
+    try:
+        jobs = list(batch.jobs.order_by('id').prefetch_related('processed_images'))
+        
+        counts = {status: 0 for status, _ in ImageProcessingJob.STATUS_CHOICES}
+        job_data = []
+        for job in jobs:
+            counts[job.status] += 1
+            entry = {
+                'job_id': job.id,
+                'status': job.status,
+                'mode': job.studio_mode,
+            }
+            if job.status == 'completed':
+                entry['results'] = [
+                    {'id': processed_img.id, 'image_url': processed_img.processed_image.url}
+                    for processed_img in job.processed_images.all()
+                ]
+            elif job.status == 'failed':
+                entry['error_message'] = job.error_message
+            job_data.append(entry)
+        
+        finished = counts['completed'] + counts['failed']
+        
+        return JsonResponse({
+            'batch_id': batch.id,
+            'status': batch.status,
+            'total_jobs': batch.total_jobs,
+            'counts': counts,
+            'progress': round(finished * 100 / batch.total_jobs) if batch.total_jobs else 100,
+            'created_at': batch.created_at.isoformat(),
+            'completed_at': batch.completed_at.isoformat() if batch.completed_at else None,
+            'jobs': job_data,
+        })
+        
+    except Exception as e:
+        logger.error(f"Error getting batch status for batch {batch_id}: {str(e)}")
+        return JsonResponse({
+            'success': False,
+            'error': 'Unable to get batch status'
+        }, status=500)
+
+
 @login_required
 def job_status(request, job_id):
     """Get real-time status of a job"""
@@ -600,25 +933,25 @@ def job_status(request, job_id):
                 data['wedding_theme'] = job.wedding_theme
                 data['space_type'] = job.space_type
                 if job.wedding_theme:
-                    data['theme_display'] = dict(WEDDING_THEMES).get(job.wedding_theme, job.wedding_theme)
+                    data['theme_display'] = get_choice_label('wedding_theme', job.wedding_theme)
                 if job.space_type:
-                    data['space_display'] = dict(SPACE_TYPES).get(job.space_type, job.space_type)
+                    data['space_display'] = get_choice_label('space_type', job.space_type)
             elif job.studio_mode == 'portrait_engagement':
                 # Engagement portrait mode
                 data['engagement_activity'] = job.engagement_activity
                 data['engagement_setting'] = job.engagement_setting
                 if job.engagement_activity:
-                    data['activity_display'] = dict(ENGAGEMENT_ACTIVITIES).get(job.engagement_activity, job.engagement_activity)
+                    data['activity_display'] = get_choice_label('engagement_activity', job.engagement_activity)
                 if job.engagement_setting:
-                    data['setting_display'] = dict(ENGAGEMENT_SETTINGS).get(job.engagement_setting, job.engagement_setting)
+                    data['setting_display'] = get_choice_label('engagement_setting', job.engagement_setting)
             elif job.studio_mode == 'portrait_wedding':
                 # Wedding portrait mode
                 data['wedding_moment'] = job.wedding_moment
                 data['wedding_setting'] = job.wedding_setting
                 if job.wedding_moment:
-                    data['moment_display'] = dict(WEDDING_MOMENTS).get(job.wedding_moment, job.wedding_moment)
+                    data['moment_display'] = get_choice_label('wedding_moment', job.wedding_moment)
                 if job.wedding_setting:
-                    data['setting_display'] = dict(WEDDING_SETTINGS).get(job.wedding_setting, job.wedding_setting)
+                    data['setting_display'] = get_choice_label('wedding_setting', job.wedding_setting)
             
             if job.season:
                 data['season'] = job.season
@@ -632,21 +965,27 @@ def job_status(request, job_id):
         
         if job.status == 'completed':
             data['completed_at'] = job.completed_at.isoformat() if job.completed_at else None
-            processed_images = job.processed_images.all()
+            processed_images = list(job.processed_images.order_by('id'))
             if processed_images:
-                processed_img = processed_images.first()
-                data['result'] = {
-                    'id': processed_img.id,
-                    'image_url': processed_img.processed_image.url,
-                    'width': processed_img.width,
-                    'height': processed_img.height,
-                    'file_size': processed_img.file_size,
-                    'gemini_model': processed_img.gemini_model,
-                }
-                data['result']['is_favorited'] = Favorite.objects.filter(
+                favorited_ids = set(Favorite.objects.filter(
                     user=request.user,
-                    processed_image=processed_img
-                ).exists()
+                    processed_image__in=processed_images
+                ).values_list('processed_image_id', flat=True))
+                
+                data['results'] = [
+                    {
+                        'id': processed_img.id,
+                        'image_url': processed_img.processed_image.url,
+                        'width': processed_img.width,
+                        'height': processed_img.height,
+                        'file_size': processed_img.file_size,
+                        'gemini_model': processed_img.gemini_model,
+                        'is_favorited': processed_img.id in favorited_ids,
+                    }
+                    for processed_img in processed_images
+                ]
+                # First output kept under 'result' for single-output clients
+                data['result'] = data['results'][0]
         elif job.status == 'failed':
             data['error_message'] = job.error_message
         elif job.status == 'processing':
@@ -662,6 +1001,27 @@ def job_status(request, job_id):
         }, status=500)
 
 
+@login_required
+def job_state(request, job_id):
+    """
+    Cheap variant of job_status for pollers: answers straight from the
+    status the worker last recorded in Redis, with no database queries
+    beyond auth and no waiting. Falls back to job_status when Redis has no
+    record of the job.
+    """
+    event = get_job_event(job_id)
+    if event is None:
+        return job_status(request, job_id)
+    
+    if event.get('user_id') != request.user.id:
+        return JsonResponse({
+            'success': False,
+            'error': 'Job not found'
+        }, status=404)
+    
+    return JsonResponse({key: value for key, value in event.items() if key != 'user_id'})
+
+
 # ============================================================================
 # FAVORITE UPLOAD VIEWS (STAR SYSTEM)
 # ============================================================================
@@ -723,7 +1083,7 @@ def get_favorite_uploads(request):
                     'id': fav.image.id,
                     'name': fav.image.original_filename,
                     'url': fav.image.image.url,
-                    'thumbnail_url': fav.image.thumbnail.url if fav.image.thumbnail else fav.image.image.url,
+                    'thumbnail_url': fav.image.thumbnail_url,
                 },
                 # REMOVED: 'label' field - doesn't exist in model
                 'times_used': fav.times_used,
@@ -839,16 +1199,16 @@ def favorites_list(request):
             job.theme_display = "Custom Design"
             job.space_display = "Custom"
         elif job.studio_mode == 'venue':
-            job.theme_display = dict(WEDDING_THEMES).get(job.wedding_theme, '') if job.wedding_theme else ''
-            job.space_display = dict(SPACE_TYPES).get(job.space_type, '') if job.space_type else ''
+            job.theme_display = get_choice_label('wedding_theme', job.wedding_theme, '')
+            job.space_display = get_choice_label('space_type', job.space_type, '')
         elif job.studio_mode == 'portrait_engagement':
             # Engagement portrait mode
-            job.theme_display = dict(ENGAGEMENT_ACTIVITIES).get(job.engagement_activity, '') if job.engagement_activity else ''
-            job.space_display = dict(ENGAGEMENT_SETTINGS).get(job.engagement_setting, '') if job.engagement_setting else ''
+            job.theme_display = get_choice_label('engagement_activity', job.engagement_activity, '')
+            job.space_display = get_choice_label('engagement_setting', job.engagement_setting, '')
         elif job.studio_mode == 'portrait_wedding':
             # Wedding portrait mode
-            job.theme_display = dict(WEDDING_MOMENTS).get(job.wedding_moment, '') if job.wedding_moment else ''
-            job.space_display = dict(WEDDING_SETTINGS).get(job.wedding_setting, '') if job.wedding_setting else ''
+            job.theme_display = get_choice_label('wedding_moment', job.wedding_moment, '')
+            job.space_display = get_choice_label('wedding_setting', job.wedding_setting, '')
         
         # Mark as favorited
         favorite.processed_image.is_favorited = True
@@ -903,7 +1263,7 @@ def get_job_details(request, job_id):
                         'id': job.user_image.id,
                         'name': job.user_image.original_filename,
                         'url': job.user_image.image.url,
-                        'thumbnailUrl': job.user_image.thumbnail.url if job.user_image.thumbnail else job.user_image.image.url,
+                        'thumbnailUrl': job.user_image.thumbnail_url,
                         'width': job.user_image.width,
                         'height': job.user_image.height,
                         'file_size': job.user_image.file_size,
@@ -929,7 +1289,7 @@ def get_job_details(request, job_id):
                         'id': ref.reference_image.id,
                         'name': ref.reference_image.original_filename,
                         'url': ref.reference_image.image.url,
-                        'thumbnailUrl': ref.reference_image.thumbnail.url if ref.reference_image.thumbnail else ref.reference_image.image.url,
+                        'thumbnailUrl': ref.reference_image.thumbnail_url,
                         'width': ref.reference_image.width,
                         'height': ref.reference_image.height,
                         'file_size': ref.reference_image.file_size,
@@ -1047,18 +1407,18 @@ def processing_history(request):
         elif job.studio_mode == 'venue':
             job.mode_display_text = 'Venue Design'
             # Build theme display manually - don't show if not set
-            job.theme_display = dict(WEDDING_THEMES).get(job.wedding_theme, '') if job.wedding_theme else ''
-            job.space_display = dict(SPACE_TYPES).get(job.space_type, '') if job.space_type else ''
+            job.theme_display = get_choice_label('wedding_theme', job.wedding_theme, '')
+            job.space_display = get_choice_label('space_type', job.space_type, '')
         elif job.studio_mode == 'portrait_engagement':
             # Engagement portrait mode
             job.mode_display_text = 'Engagement Portrait'
-            job.theme_display = dict(ENGAGEMENT_ACTIVITIES).get(job.engagement_activity, '') if job.engagement_activity else ''
-            job.space_display = dict(ENGAGEMENT_SETTINGS).get(job.engagement_setting, '') if job.engagement_setting else ''
+            job.theme_display = get_choice_label('engagement_activity', job.engagement_activity, '')
+            job.space_display = get_choice_label('engagement_setting', job.engagement_setting, '')
         elif job.studio_mode == 'portrait_wedding':
             # Wedding portrait mode
             job.mode_display_text = 'Wedding Portrait'
-            job.theme_display = dict(WEDDING_MOMENTS).get(job.wedding_moment, '') if job.wedding_moment else ''
-            job.space_display = dict(WEDDING_SETTINGS).get(job.wedding_setting, '') if job.wedding_setting else ''
+            job.theme_display = get_choice_label('wedding_moment', job.wedding_moment, '')
+            job.space_display = get_choice_label('wedding_setting', job.wedding_setting, '')
         
         # Add favorite status
         for processed_image in job.processed_images.all():
@@ -1188,14 +1548,14 @@ def processed_image_detail(request, pk):
         theme_display = "Custom Design"
         space_display = "Custom"
     elif job.studio_mode == 'venue':
-        theme_display = dict(WEDDING_THEMES).get(job.wedding_theme, '') if job.wedding_theme else ''
-        space_display = dict(SPACE_TYPES).get(job.space_type, '') if job.space_type else ''
+        theme_display = get_choice_label('wedding_theme', job.wedding_theme, '')
+        space_display = get_choice_label('space_type', job.space_type, '')
     elif job.studio_mode == 'portrait_engagement':
-        theme_display = dict(ENGAGEMENT_ACTIVITIES).get(job.engagement_activity, '') if job.engagement_activity else ''
-        space_display = dict(ENGAGEMENT_SETTINGS).get(job.engagement_setting, '') if job.engagement_setting else ''
+        theme_display = get_choice_label('engagement_activity', job.engagement_activity, '')
+        space_display = get_choice_label('engagement_setting', job.engagement_setting, '')
     elif job.studio_mode == 'portrait_wedding':
-        theme_display = dict(WEDDING_MOMENTS).get(job.wedding_moment, '') if job.wedding_moment else ''
-        space_display = dict(WEDDING_SETTINGS).get(job.wedding_setting, '') if job.wedding_setting else ''
+        theme_display = get_choice_label('wedding_moment', job.wedding_moment, '')
+        space_display = get_choice_label('wedding_setting', job.wedding_setting, '')
     else:
         theme_display = ''
         space_display = ''
@@ -1253,11 +1613,11 @@ def collection_detail(request, collection_id):
             # Add theme and space display names
             job = item.processed_image.processing_job
             if job.wedding_theme:
-                item.theme_display = dict(WEDDING_THEMES).get(job.wedding_theme, job.wedding_theme)
+                item.theme_display = get_choice_label('wedding_theme', job.wedding_theme)
             if job.space_type:
-                item.space_display = dict(SPACE_TYPES).get(job.space_type, job.space_type)
+                item.space_display = get_choice_label('space_type', job.space_type)
         elif item.user_image:
-            item.image_url = item.user_image.thumbnail.url if item.user_image.thumbnail else item.user_image.image.url
+            item.image_url = item.user_image.thumbnail_url
             item.image_title = item.user_image.original_filename
     
     context = {
@@ -3,7 +3,8 @@ from django.utils.html import format_html
 from django.urls import reverse
 from django.utils.safestring import mark_safe
 from django_summernote.admin import SummernoteModelAdmin
-from .models import NewsletterSubscription, BlogPost, BlogComment
+from saas_base.utils.counters import BufferedCounter
+from .models import NewsletterSubscription, BlogPost, BlogComment, NewsletterSend, NewsletterSendChunk
 
 
 @admin.register(NewsletterSubscription)
@@ -77,6 +78,12 @@ class BlogPostAdmin(SummernoteModelAdmin):
     def get_queryset(self, request):
         return super().get_queryset(request).prefetch_related('tags')
     
+    def get_changelist_instance(self, request):
+        """Include views still buffered in Redis - one lookup for the page"""
+        changelist = super().get_changelist_instance(request)
+        BufferedCounter.merge_pending(changelist.result_list)
+        return changelist
+    
     def tag_list(self, obj):
         return ', '.join([tag.name for tag in obj.tags.all()]) if obj.tags.exists() else '-'
     tag_list.short_description = 'Tags'
@@ -159,4 +166,33 @@ class BlogCommentAdmin(admin.ModelAdmin):
     def feature_comments(self, request, queryset):
         updated = queryset.update(is_featured=True)
         self.message_user(request, f'{updated} comments featured.')
-    feature_comments.short_description = "Feature selected comments"
\ No newline at end of file
+    feature_comments.short_description = "Feature selected comments"
+
+
+class NewsletterSendChunkInline(admin.TabularInline):
+    model = NewsletterSendChunk
+    fields = ['first_subscriber_id', 'last_subscriber_id', 'status', 'sent_count', 'failed_count', 'completed_at']
+    readonly_fields = fields
+    extra = 0
+    can_delete = False
+
+
+@admin.register(NewsletterSend)
+class NewsletterSendAdmin(admin.ModelAdmin):
+    """Read-only view of newsletter delivery progress"""
+    list_display = ['post', 'status', 'progress', 'sent_count', 'failed_count', 'created_at', 'completed_at']
+    list_filter = ['status']
+    search_fields = ['post__title']
+    readonly_fields = ['post', 'status', 'locked_until', 'total_chunks', 'sent_count', 'failed_count', 'created_at', 'completed_at']
+    inlines = [NewsletterSendChunkInline]
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('post')
+    
+    def progress(self, obj):
+        completed = obj.chunks.filter(status='completed').count()
+        return f"{completed}/{obj.total_chunks} chunks"
+    progress.short_description = 'Progress'
+    
+    def has_add_permission(self, request):
+        return False
@@ -4,4 +4,8 @@ from django.apps import AppConfig
 class NewsletterConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'newsletter'
-    verbose_name = 'Newsletter'
\ No newline at end of file
+    verbose_name = 'Newsletter'
+
+    def ready(self):
+        # Search vector, tag count and page cache maintenance
+        from . import signals  # noqa: F401
\ No newline at end of file
@@ -0,0 +1,58 @@
+# Generated by Django 5.1.8 on 2026-10-17 01:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('newsletter', '0003_remove_blogpost_featured_image_webp_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NewsletterSend',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('sending', 'Sending'), ('completed', 'Completed')], default='sending', max_length=20)),
+                ('locked_until', models.DateTimeField(blank=True, null=True)),
+                ('total_chunks', models.PositiveIntegerField(default=0)),
+                ('sent_count', models.PositiveIntegerField(default=0)),
+                ('failed_count', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('post', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='newsletter_send', to='newsletter.blogpost')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='NewsletterSendChunk',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('first_subscriber_id', models.PositiveBigIntegerField()),
+                ('last_subscriber_id', models.PositiveBigIntegerField()),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('completed', 'Completed')], default='pending', max_length=20)),
+                ('sent_count', models.PositiveIntegerField(default=0)),
+                ('failed_count', models.PositiveIntegerField(default=0)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('send', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='chunks', to='newsletter.newslettersend')),
+            ],
+            options={
+                'ordering': ['first_subscriber_id'],
+                'unique_together': {('send', 'first_subscriber_id')},
+            },
+        ),
+        migrations.CreateModel(
+            name='NewsletterDelivery',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('email', models.EmailField(max_length=254)),
+                ('status', models.CharField(choices=[('sent', 'Sent'), ('failed', 'Failed')], max_length=20)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('chunk', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='deliveries', to='newsletter.newslettersendchunk')),
+            ],
+            options={
+                'unique_together': {('chunk', 'email')},
+            },
+        ),
+    ]
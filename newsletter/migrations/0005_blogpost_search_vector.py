@@ -0,0 +1,64 @@
+# Generated by Django 5.1.8 on 2026-10-17 02:10
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+# Same weighting as newsletter.search.build_search_vector
+BACKFILL_SQL = """
+UPDATE newsletter_blogpost p SET search_vector =
+    setweight(to_tsvector('english', coalesce(p.title, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(p.excerpt, '')), 'B') ||
+    setweight(to_tsvector('english', coalesce((
+        SELECT string_agg(t.name, ' ')
+        FROM taggit_taggeditem ti
+        JOIN taggit_tag t ON t.id = ti.tag_id
+        JOIN django_content_type ct ON ct.id = ti.content_type_id
+        WHERE ct.app_label = 'newsletter' AND ct.model = 'blogpost' AND ti.object_id = p.id
+    ), '')), 'B') ||
+    setweight(to_tsvector('english', coalesce(p.content, '')), 'C')
+"""
+
+
+def create_search_index(apps, schema_editor):
+    """GIN index and backfill on Postgres only - other backends (SQLite in tests) skip full-text search"""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'CREATE INDEX "blogpost_search_vector_gin" ON "newsletter_blogpost" USING gin ("search_vector")'
+    )
+    schema_editor.execute(BACKFILL_SQL)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS "blogpost_search_vector_gin"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('newsletter', '0004_newslettersend_newslettersendchunk_newsletterdelivery'),
+        ('taggit', '0006_rename_taggeditem_content_type_object_id_taggit_tagg_content_8fc721_idx'),
+        ('contenttypes', '0002_remove_content_type_name'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blogpost',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(
+                    model_name='blogpost',
+                    index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='blogpost_search_vector_gin'),
+                ),
+            ],
+            database_operations=[
+                migrations.RunPython(create_search_index, drop_search_index),
+            ],
+        ),
+    ]
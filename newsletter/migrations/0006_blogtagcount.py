@@ -0,0 +1,46 @@
+# Generated by Django 5.1.8 on 2026-10-17 02:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+from django.utils import timezone
+
+
+def backfill_tag_counts(apps, schema_editor):
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+    BlogPost = apps.get_model('newsletter', 'BlogPost')
+    BlogTagCount = apps.get_model('newsletter', 'BlogTagCount')
+    TaggedItem = apps.get_model('taggit', 'TaggedItem')
+
+    content_type = ContentType.objects.filter(app_label='newsletter', model='blogpost').first()
+    if content_type is None:
+        return
+
+    published = BlogPost.objects.filter(status='published', published_at__lte=timezone.now()).values('id')
+    counts = TaggedItem.objects.filter(
+        content_type=content_type, object_id__in=published
+    ).values('tag_id').annotate(count=Count('id')).values_list('tag_id', 'count')
+    BlogTagCount.objects.bulk_create([BlogTagCount(tag_id=tag_id, post_count=count) for tag_id, count in counts])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('newsletter', '0005_blogpost_search_vector'),
+        ('taggit', '0006_rename_taggeditem_content_type_object_id_taggit_tagg_content_8fc721_idx'),
+        ('contenttypes', '0002_remove_content_type_name'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BlogTagCount',
+            fields=[
+                ('tag', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='blog_post_count', serialize=False, to='taggit.tag')),
+                ('post_count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['-post_count'], name='newsletter__post_co_d3bfb2_idx')],
+            },
+        ),
+        migrations.RunPython(backfill_tag_counts, migrations.RunPython.noop),
+    ]
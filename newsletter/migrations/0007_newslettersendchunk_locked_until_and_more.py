@@ -0,0 +1,23 @@
+# Generated by Django 5.1.8 on 2026-10-17 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('newsletter', '0006_blogtagcount'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='newslettersendchunk',
+            name='locked_until',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='newsletterdelivery',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('sent', 'Sent'), ('failed', 'Failed')], max_length=20),
+        ),
+    ]
@@ -1,11 +1,19 @@
-from django.db import models
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.contrib.contenttypes.models import ContentType
+from django.db import models, transaction
+from django.db.models import Count, Q
 from django.utils import timezone
 from django.utils.text import slugify
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 from taggit.managers import TaggableManager
+from taggit.models import Tag, TaggedItem
+from datetime import timedelta
 import uuid
 
+from saas_base.utils.counters import BufferedCounter
+
 User = get_user_model()
 
 
@@ -71,12 +79,16 @@ class BlogPost(models.Model):
     email_sent = models.BooleanField(default=False, help_text="Newsletter email has been sent for this post")
     email_sent_at = models.DateTimeField(null=True, blank=True)
     
+    # Full-text search (Postgres only) - kept current by newsletter.signals
+    search_vector = SearchVectorField(null=True, editable=False)
+    
     class Meta:
         ordering = ['-published_at', '-created_at']
         indexes = [
             models.Index(fields=['-published_at']),
             models.Index(fields=['slug']),
             models.Index(fields=['status']),
+            GinIndex(fields=['search_vector'], name='blogpost_search_vector_gin'),
         ]
     
     def __str__(self):
@@ -118,10 +130,12 @@ class BlogPost(models.Model):
         
         super().save(*args, **kwargs)
         
-        # Trigger newsletter email if newly published
+        # Trigger newsletter email if newly published (the send ledger makes
+        # duplicate triggers harmless; on_commit so the task sees the post)
         if is_newly_published and not self.email_sent:
             from .tasks import send_blog_post_email
-            send_blog_post_email.delay(self.pk)
+            post_id = self.pk
+            transaction.on_commit(lambda: send_blog_post_email.delay(post_id))
     
     def get_absolute_url(self):
         return reverse('newsletter:resource_detail', kwargs={'slug': self.slug})
@@ -137,9 +151,11 @@ class BlogPost(models.Model):
         return max(1, word_count // 200)
     
     def increment_views(self):
-        """Increment view count"""
-        self.view_count += 1
-        self.save(update_fields=['view_count'])
+        """
+        Count a view. Buffered in Redis and flushed to the DB periodically;
+        view_count on this instance includes the not-yet-flushed views.
+        """
+        self.view_count += BufferedCounter.increment(self)
     
     @classmethod
     def published_posts(cls):
@@ -216,4 +232,181 @@ class BlogComment(models.Model):
     
     @property
     def is_reply(self):
-        return self.parent is not None
\ No newline at end of file
+        return self.parent is not None
+
+
+class NewsletterSend(models.Model):
+    """
+    Delivery ledger for one post's newsletter. Recipients are split into
+    chunks that are checkpointed as they finish, so a crashed or retried
+    send resumes instead of starting over. A lease on this row makes sure
+    only one send per post is active at a time.
+    """
+    STATUS_CHOICES = [
+        ('sending', 'Sending'),
+        ('completed', 'Completed'),
+    ]
+    
+    # Longest a send may hold the lease without finishing (a crashed worker's
+    # lease expires after this and the next trigger resumes the send)
+    LEASE_DURATION = timedelta(hours=2)
+    
+    post = models.OneToOneField(BlogPost, on_delete=models.CASCADE, related_name='newsletter_send')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='sending')
+    locked_until = models.DateTimeField(null=True, blank=True)
+    
+    total_chunks = models.PositiveIntegerField(default=0)
+    sent_count = models.PositiveIntegerField(default=0)
+    failed_count = models.PositiveIntegerField(default=0)
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+    
+    def __str__(self):
+        return f"Newsletter for {self.post.title} ({self.status})"
+    
+    def acquire_lease(self):
+        """Atomically claim this send - False if another worker holds it"""
+        now = timezone.now()
+        claimed = NewsletterSend.objects.filter(
+            Q(locked_until__isnull=True) | Q(locked_until__lt=now),
+            pk=self.pk,
+            status='sending'
+        ).update(locked_until=now + self.LEASE_DURATION)
+        return bool(claimed)
+    
+    def release_lease(self):
+        NewsletterSend.objects.filter(pk=self.pk).update(locked_until=None)
+
+
+class NewsletterSendChunk(models.Model):
+    """
+    One checkpointed range of subscribers (by ID) within a newsletter send.
+    A worker claims the chunk with a lease before sending, so a resumed or
+    duplicated dispatch never runs the same chunk twice at once.
+    """
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('completed', 'Completed'),
+    ]
+    
+    # Outlives send_newsletter_chunk's hard time limit, so a killed worker's
+    # chunk is claimable again afterwards
+    LEASE_DURATION = timedelta(minutes=10)
+    
+    send = models.ForeignKey(NewsletterSend, on_delete=models.CASCADE, related_name='chunks')
+    first_subscriber_id = models.PositiveBigIntegerField()
+    last_subscriber_id = models.PositiveBigIntegerField()
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    locked_until = models.DateTimeField(null=True, blank=True)
+    sent_count = models.PositiveIntegerField(default=0)
+    failed_count = models.PositiveIntegerField(default=0)
+    completed_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        ordering = ['first_subscriber_id']
+        unique_together = ['send', 'first_subscriber_id']
+    
+    def __str__(self):
+        return f"Subscribers {self.first_subscriber_id}-{self.last_subscriber_id} ({self.status})"
+    
+    def acquire_lease(self):
+        """Atomically claim this pending chunk - False if another worker holds it or it's done"""
+        now = timezone.now()
+        claimed = NewsletterSendChunk.objects.filter(
+            Q(locked_until__isnull=True) | Q(locked_until__lt=now),
+            pk=self.pk,
+            status='pending'
+        ).update(locked_until=now + self.LEASE_DURATION)
+        return bool(claimed)
+    
+    def release_lease(self):
+        NewsletterSendChunk.objects.filter(pk=self.pk).update(locked_until=None)
+
+
+class NewsletterDelivery(models.Model):
+    """
+    Per-recipient record, so a retried chunk never emails anyone twice. The
+    row is inserted (pending) before the email goes out; one still pending
+    means the worker died mid-send, and it is not retried.
+    """
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('sent', 'Sent'),
+        ('failed', 'Failed'),
+    ]
+    
+    chunk = models.ForeignKey(NewsletterSendChunk, on_delete=models.CASCADE, related_name='deliveries')
+    email = models.EmailField()
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES)
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        unique_together = ['chunk', 'email']
+    
+    def __str__(self):
+        return f"{self.email} ({self.status})"
+
+
+class BlogTagCount(models.Model):
+    """
+    Published-post count per tag, kept current by newsletter.signals (tag
+    changes, saves, deletes) and rebuilt hourly to catch scheduled posts
+    going live, so the popular-tags sidebars are one small indexed read.
+    """
+    tag = models.OneToOneField(Tag, on_delete=models.CASCADE, primary_key=True, related_name='blog_post_count')
+    post_count = models.PositiveIntegerField(default=0)
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['-post_count']),
+        ]
+    
+    def __str__(self):
+        return f"{self.tag.name}: {self.post_count}"
+    
+    @classmethod
+    def _live_counts(cls, tag_ids=None):
+        """{tag_id: published post count} straight from the tagged items"""
+        items = TaggedItem.objects.filter(
+            content_type=ContentType.objects.get_for_model(BlogPost),
+            object_id__in=BlogPost.published_posts().values('id')
+        )
+        if tag_ids is not None:
+            items = items.filter(tag_id__in=tag_ids)
+        return dict(items.values('tag_id').annotate(count=Count('id')).values_list('tag_id', 'count'))
+    
+    @classmethod
+    def _store(cls, counts, stale):
+        with transaction.atomic():
+            cls.objects.filter(stale).delete()
+            cls.objects.bulk_create(
+                [cls(tag_id=tag_id, post_count=count) for tag_id, count in counts.items()],
+                update_conflicts=True,
+                unique_fields=['tag'],
+                update_fields=['post_count'],
+            )
+    
+    @classmethod
+    def refresh(cls, tag_ids):
+        """Recount just `tag_ids` - one aggregate query and one upsert"""
+        tag_ids = set(tag_ids)
+        if not tag_ids:
+            return
+        counts = cls._live_counts(tag_ids)
+        cls._store(counts, Q(tag_id__in=tag_ids - set(counts)))
+    
+    @classmethod
+    def rebuild(cls):
+        """Recount every tag"""
+        counts = cls._live_counts()
+        cls._store(counts, ~Q(tag_id__in=list(counts)))
+    
+    @classmethod
+    def popular_tags(cls, limit):
+        """The `limit` most used tags, each with a post_count attribute"""
+        tags = []
+        for row in cls.objects.select_related('tag').order_by('-post_count', 'tag__name')[:limit]:
+            row.tag.post_count = row.post_count
+            tags.append(row.tag)
+        return tags
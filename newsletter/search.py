@@ -0,0 +1,72 @@
+# newsletter/search.py - Postgres full-text search for blog posts
+
+from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank, SearchVector
+from django.db import connection
+from django.db.models import F, Func, Q, Value
+
+# Text search configuration for the vector, the query and the headline - they must match
+SEARCH_CONFIG = 'english'
+
+# Marks around matched terms in search_headline (see the highlight_snippet filter)
+HIGHLIGHT_START = '<mark>'
+HIGHLIGHT_STOP = '</mark>'
+
+
+def is_full_text_search_available():
+    """Full-text search needs Postgres; anything else (SQLite in tests) falls back to icontains"""
+    return connection.vendor == 'postgresql'
+
+
+def build_search_vector(tag_names):
+    """
+    Weighted vector for one post: title (A), excerpt and tags (B), body (C).
+    Tags live in another table, so their names are passed in as text.
+    """
+    return (
+        SearchVector('title', config=SEARCH_CONFIG, weight='A')
+        + SearchVector('excerpt', config=SEARCH_CONFIG, weight='B')
+        + SearchVector(Value(' '.join(tag_names)), config=SEARCH_CONFIG, weight='B')
+        + SearchVector('content', config=SEARCH_CONFIG, weight='C')
+    )
+
+
+def update_search_vector(post):
+    """Recompute `post`'s stored vector - a single UPDATE, so updated_at and post_save are untouched"""
+    if not is_full_text_search_available():
+        return
+    type(post).objects.filter(pk=post.pk).update(
+        search_vector=build_search_vector(sorted(post.tags.names()))
+    )
+
+
+def search_posts(queryset, query):
+    """
+    Filter `queryset` to posts matching `query`, best matches first.
+
+    On Postgres each post also gets search_rank and search_headline (a
+    snippet of the body with matches wrapped in <mark>). Elsewhere this is
+    the old substring match, unranked and without headlines.
+    """
+    if not is_full_text_search_available():
+        return queryset.filter(
+            Q(title__icontains=query) |
+            Q(excerpt__icontains=query) |
+            Q(content__icontains=query) |
+            Q(tags__name__icontains=query)
+        ).distinct()
+
+    search_query = SearchQuery(query, config=SEARCH_CONFIG, search_type='websearch')
+    # Summernote HTML - headline the text, not the markup
+    body_text = Func(F('content'), Value('<[^>]+>'), Value(' '), Value('g'), function='regexp_replace')
+    return queryset.filter(search_vector=search_query).annotate(
+        search_rank=SearchRank(F('search_vector'), search_query),
+        search_headline=SearchHeadline(
+            body_text,
+            search_query,
+            config=SEARCH_CONFIG,
+            start_sel=HIGHLIGHT_START,
+            stop_sel=HIGHLIGHT_STOP,
+            max_words=35,
+            min_words=15,
+        ),
+    ).order_by('-search_rank', '-published_at')
@@ -1,31 +1,62 @@
 # newsletter/signals.py
-from django.db.models.signals import post_save
+#
+# Newsletter emails are triggered from BlogPost.save() when a post is first
+# published - there is deliberately no post_save receiver here as well, so a
+# publish enqueues the send exactly once (see NewsletterSend for the ledger
+# that guards against duplicate and resumed sends).
+
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
 from django.dispatch import receiver
-from .models import BlogPost
-from .tasks import send_blog_post_email
-import logging
 
-logger = logging.getLogger(__name__)
+from saas_base.utils.page_cache import bump_cache_version
+from .models import BlogComment, BlogPost, BlogTagCount
+from .search import update_search_vector
+
+
+def _tag_ids(post):
+    return set(post.tags.values_list('id', flat=True))
 
 
 @receiver(post_save, sender=BlogPost)
-def trigger_newsletter_email(sender, instance, created, **kwargs):
-    """
-    Automatically send newsletter email when a blog post is published
-    """
-    # Check if post is being published for the first time
-    if instance.status == 'published' and instance.published_at and not instance.email_sent:
-        # Check if this is a real publish (not draft save)
-        if not created:  # Only for updates, not initial creation
-            try:
-                old_instance = BlogPost.objects.get(pk=instance.pk)
-                # Check if status changed from draft/archived to published
-                was_published = old_instance.status == 'published'
-                is_published = instance.status == 'published'
-                
-                if not was_published and is_published:
-                    # Schedule email task
-                    logger.info(f"Scheduling newsletter email for post: {instance.title}")
-                    send_blog_post_email.delay(instance.pk)
-            except BlogPost.DoesNotExist:
-                pass
\ No newline at end of file
+def refresh_post_indexes_on_save(sender, instance, raw=False, **kwargs):
+    """Keep the full-text vector, tag counts (publish/unpublish) and page cache in step"""
+    if raw:
+        return
+    update_search_vector(instance)
+    BlogTagCount.refresh(_tag_ids(instance))
+    bump_cache_version('blog')
+
+
+@receiver(m2m_changed, sender=BlogPost.tags.through)
+def refresh_post_indexes_on_tags(sender, instance, action, pk_set=None, **kwargs):
+    """Tags are saved after the post (e.g. admin save_related), so re-index on change"""
+    if not isinstance(instance, BlogPost):
+        return
+    if action == 'pre_clear':
+        # pk_set is None for clears - remember what is about to go
+        instance._cleared_tag_ids = _tag_ids(instance)
+    elif action in ('post_add', 'post_remove', 'post_clear'):
+        update_search_vector(instance)
+        changed = pk_set if action != 'post_clear' else getattr(instance, '_cleared_tag_ids', set())
+        BlogTagCount.refresh(changed or ())
+        bump_cache_version('blog')
+
+
+@receiver(pre_delete, sender=BlogPost)
+def remember_tags_on_delete(sender, instance, **kwargs):
+    instance._deleted_tag_ids = _tag_ids(instance)
+
+
+@receiver(post_delete, sender=BlogPost)
+def refresh_tag_counts_on_delete(sender, instance, **kwargs):
+    BlogTagCount.refresh(getattr(instance, '_deleted_tag_ids', ()))
+    bump_cache_version('blog')
+
+
+@receiver(post_save, sender=BlogComment)
+@receiver(post_delete, sender=BlogComment)
+def invalidate_blog_pages_for_comment(sender, raw=False, **kwargs):
+    """Comments render on the cached post page"""
+    if raw:
+        return
+    bump_cache_version('blog')
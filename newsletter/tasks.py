@@ -1,20 +1,104 @@
-from celery import shared_task
-from django.core.mail import EmailMultiAlternatives
+from celery import chord, shared_task
+from celery.exceptions import SoftTimeLimitExceeded
+from django.core.mail import EmailMultiAlternatives, get_connection
 from django.template.loader import render_to_string
 from django.conf import settings
 from django.utils import timezone
-from django.utils.html import strip_tags
+from django.utils.html import escape, strip_tags
 from django.contrib.sites.models import Site
+from django.db.models import Count, Q, Sum
 import logging
 
-from .models import NewsletterSubscription, BlogPost
+from .models import (
+    BlogPost, BlogTagCount, NewsletterDelivery, NewsletterSend, NewsletterSendChunk, NewsletterSubscription
+)
 
 logger = logging.getLogger(__name__)
 
 
+# Subscribers per delivery subtask - each subtask renders once and sends
+# its whole batch over a single mail backend connection
+NEWSLETTER_BATCH_SIZE = 500
+
+# Rendered in place of the per-subscriber unsubscribe URL, then substituted
+UNSUBSCRIBE_TOKEN = '%%UNSUBSCRIBE_URL%%'
+
+
+def get_email_domain():
+    """Domain used for links in newsletter emails"""
+    try:
+        site = Site.objects.get_current()
+        return site.domain
+    except:
+        return settings.SITE_DOMAIN if hasattr(settings, 'SITE_DOMAIN') else 'dreamwedai.com'
+
+
+def render_blog_post_email(post, domain):
+    """
+    Render the notification once for every recipient - (text, html) with
+    UNSUBSCRIBE_TOKEN where each subscriber's unsubscribe URL goes.
+    """
+    context = {
+        'post': post,
+        'domain': domain,
+        'post_url': f"https://{domain}{post.get_absolute_url()}",
+        'site_name': settings.SITE_NAME if hasattr(settings, 'SITE_NAME') else 'DreamWedAI',
+        'excerpt_words': 50,  # Number of words to show in preview
+        'current_year': timezone.now().year,
+        'unsubscribe_url': UNSUBSCRIBE_TOKEN,
+    }
+    
+    html_content = render_to_string('newsletter/emails/blog_post_notification.html', context)
+    text_content = strip_tags(render_to_string('newsletter/emails/blog_post_notification.txt', context))
+    return text_content, html_content
+
+
+def build_subscriber_message(email, subject, text_content, html_content, domain):
+    """Personalise the pre-rendered email for one subscriber"""
+    unsubscribe_url = f"https://{domain}/newsletter/unsubscribe/{email}/"
+    
+    msg = EmailMultiAlternatives(
+        subject=subject,
+        body=text_content.replace(UNSUBSCRIBE_TOKEN, unsubscribe_url),
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[email],
+        headers={
+            'List-Unsubscribe': f'<{unsubscribe_url}>',
+            'List-Unsubscribe-Post': 'List-Unsubscribe=One-Click'
+        }
+    )
+    msg.attach_alternative(html_content.replace(UNSUBSCRIBE_TOKEN, escape(unsubscribe_url)), "text/html")
+    return msg
+
+
+def iter_subscriber_batches(batch_size=NEWSLETTER_BATCH_SIZE):
+    """
+    (first_id, last_id) bounds covering every active subscriber in batches,
+    walked with a server-side cursor rather than OFFSET pagination.
+    """
+    ids = NewsletterSubscription.objects.filter(is_active=True).order_by('pk').values_list('pk', flat=True)
+    
+    batch = []
+    for subscriber_id in ids.iterator(chunk_size=batch_size * 4):
+        batch.append(subscriber_id)
+        if len(batch) == batch_size:
+            yield batch[0], batch[-1]
+            batch = []
+    if batch:
+        yield batch[0], batch[-1]
+
+
 @shared_task(bind=True, max_retries=3)
 def send_blog_post_email(self, post_id):
-    """Send blog post notification to all active subscribers"""
+    """
+    Send blog post notification to all active subscribers.
+    
+    The send is recorded in a NewsletterSend ledger: subscribers are split
+    into ID-range chunks, fanned out as parallel send_newsletter_chunk
+    subtasks, and checkpointed as each finishes. Triggering again (a retry,
+    a duplicate enqueue, or resume_stalled_newsletter_sends) only dispatches
+    the chunks still pending, and only one send per post runs at a time.
+    """
     try:
         post = BlogPost.objects.get(pk=post_id)
         
@@ -23,114 +107,204 @@ def send_blog_post_email(self, post_id):
             logger.info(f"Email already sent for post {post.title}")
             return f"Email already sent for post {post.title}"
         
-        # Get active subscribers
-        subscribers = NewsletterSubscription.objects.filter(is_active=True)
-        total = subscribers.count()
-        
-        if total == 0:
-            logger.info("No active subscribers to notify")
-            return "No active subscribers"
-        
-        # Get site domain
-        try:
-            site = Site.objects.get_current()
-            domain = site.domain
-        except:
-            domain = settings.SITE_DOMAIN if hasattr(settings, 'SITE_DOMAIN') else 'dreamwedai.com'
-        
-        # Prepare email context
-        context = {
-            'post': post,
-            'domain': domain,
-            'post_url': f"https://{domain}{post.get_absolute_url()}",
-            'site_name': settings.SITE_NAME if hasattr(settings, 'SITE_NAME') else 'DreamWedAI',
-            'excerpt_words': 50,  # Number of words to show in preview
-            'current_year': timezone.now().year,
-        }
-        
-        # Generate email content
-        html_content = render_to_string('newsletter/emails/blog_post_notification.html', context)
-        text_content = strip_tags(render_to_string('newsletter/emails/blog_post_notification.txt', context))
-        
-        # Email subject
-        subject = f"New Post: {post.title}"
-        from_email = settings.DEFAULT_FROM_EMAIL
+        send, created = NewsletterSend.objects.get_or_create(post=post)
+        if not send.acquire_lease():
+            logger.info(f"Newsletter for post {post.title} is already being sent")
+            return f"Newsletter for post {post.title} already in progress"
         
-        # Batch send to subscribers
-        batch_size = 50  # Send in batches to avoid overwhelming the mail server
-        sent_count = 0
-        failed_count = 0
-        
-        for i in range(0, total, batch_size):
-            batch = subscribers[i:i+batch_size]
+    except BlogPost.DoesNotExist:
+        logger.error(f"BlogPost with id {post_id} not found")
+        raise
+    except Exception as e:
+        logger.error(f"Error starting blog post email: {e}")
+        raise self.retry(exc=e, countdown=60)  # Retry after 1 minute
+    
+    try:
+        # Plan the chunks once; resumed sends reuse them
+        if not send.chunks.exists():
+            chunks = NewsletterSendChunk.objects.bulk_create([
+                NewsletterSendChunk(send=send, first_subscriber_id=first_id, last_subscriber_id=last_id)
+                for first_id, last_id in iter_subscriber_batches()
+            ])
+            if not chunks:
+                send.delete()
+                logger.info("No active subscribers to notify")
+                return "No active subscribers"
             
-            for subscriber in batch:
-                try:
-                    # Add unsubscribe link for this subscriber
-                    subscriber_context = context.copy()
-                    subscriber_context['unsubscribe_url'] = f"https://{domain}/newsletter/unsubscribe/{subscriber.email}/"
-                    
-                    # Re-render with subscriber-specific context
-                    html_with_unsubscribe = render_to_string(
-                        'newsletter/emails/blog_post_notification.html', 
-                        subscriber_context
-                    )
-                    text_with_unsubscribe = strip_tags(
-                        render_to_string(
-                            'newsletter/emails/blog_post_notification.txt', 
-                            subscriber_context
-                        )
-                    )
-                    
-                    # Create email
-                    msg = EmailMultiAlternatives(
-                        subject=subject,
-                        body=text_with_unsubscribe,
-                        from_email=from_email,
-                        to=[subscriber.email],
-                        headers={
-                            'List-Unsubscribe': f'<https://{domain}/newsletter/unsubscribe/{subscriber.email}/>',
-                            'List-Unsubscribe-Post': 'List-Unsubscribe=One-Click'
-                        }
-                    )
-                    msg.attach_alternative(html_with_unsubscribe, "text/html")
-                    msg.send(fail_silently=False)
-                    sent_count += 1
-                    
-                except Exception as e:
-                    logger.error(f"Failed to send email to {subscriber.email}: {e}")
-                    failed_count += 1
+            send.total_chunks = len(chunks)
+            send.save(update_fields=['total_chunks'])
+        
+        pending = list(send.chunks.filter(status='pending').values_list('pk', flat=True))
+        if not pending:
+            return finalize_blog_post_email([], send.pk)
         
-        # Mark post as sent
-        post.email_sent = True
-        post.email_sent_at = timezone.now()
-        post.save(update_fields=['email_sent', 'email_sent_at'])
+        header = [send_newsletter_chunk.s(chunk_id) for chunk_id in pending]
+        chord(header)(finalize_blog_post_email.s(send.pk))
         
-        result_msg = f"Newsletter sent: {sent_count} successful, {failed_count} failed out of {total} subscribers"
+        result_msg = (
+            f"Newsletter for post {post.title} queued: {len(pending)} of {send.total_chunks} chunks"
+            f"{'' if created else ' (resumed)'}"
+        )
         logger.info(result_msg)
         return result_msg
         
-    except BlogPost.DoesNotExist:
-        logger.error(f"BlogPost with id {post_id} not found")
-        raise
     except Exception as e:
         logger.error(f"Error sending blog post email: {e}")
+        send.release_lease()
         # Retry the task
         raise self.retry(exc=e, countdown=60)  # Retry after 1 minute
 
 
+@shared_task(bind=True, max_retries=5, soft_time_limit=4 * 60, time_limit=5 * 60)
+def send_newsletter_chunk(self, chunk_id):
+    """
+    Deliver one chunk of the newsletter: render once, personalise per
+    subscriber, and send everything over one backend connection. The chunk
+    is claimed with a lease first, and every recipient is recorded before
+    their email goes out, so a retry or a duplicate dispatch skips anyone
+    already done.
+    """
+    chunk = NewsletterSendChunk.objects.select_related('send__post').get(pk=chunk_id)
+    if chunk.status == 'completed':
+        return {'sent': chunk.sent_count, 'failed': chunk.failed_count}
+    
+    if not chunk.acquire_lease():
+        logger.info(f"Newsletter chunk {chunk_id} is already being sent")
+        return {'sent': 0, 'failed': 0}
+    
+    post = chunk.send.post
+    domain = get_email_domain()
+    subject = f"New Post: {post.title}"
+    
+    try:
+        text_content, html_content = render_blog_post_email(post, domain)
+        
+        delivered = set(chunk.deliveries.values_list('email', flat=True))
+        emails = NewsletterSubscription.objects.filter(
+            is_active=True,
+            pk__gte=chunk.first_subscriber_id,
+            pk__lte=chunk.last_subscriber_id
+        ).order_by('pk').values_list('email', flat=True)
+        
+        connection = get_connection(fail_silently=False)
+        connection.open()
+        try:
+            for email in emails.iterator():
+                if email in delivered:
+                    continue
+                
+                delivery, created = NewsletterDelivery.objects.get_or_create(
+                    chunk=chunk, email=email, defaults={'status': 'pending'}
+                )
+                if not created:
+                    continue
+                
+                try:
+                    msg = build_subscriber_message(email, subject, text_content, html_content, domain)
+                    connection.send_messages([msg])
+                    status = 'sent'
+                except SoftTimeLimitExceeded:
+                    raise
+                except Exception as e:
+                    logger.error(f"Failed to send email to {email}: {e}")
+                    status = 'failed'
+                
+                NewsletterDelivery.objects.filter(pk=delivery.pk).update(status=status)
+        finally:
+            connection.close()
+        
+    except Exception as e:
+        # Connection failure or out of time - pick up after the last recorded recipient
+        logger.warning(f"Newsletter chunk {chunk_id} interrupted, retrying: {e}")
+        chunk.release_lease()
+        raise self.retry(exc=e, countdown=60)
+    
+    counts = chunk.deliveries.aggregate(
+        sent=Count('pk', filter=Q(status='sent')),
+        failed=Count('pk', filter=Q(status='failed')),
+    )
+    chunk.status = 'completed'
+    chunk.sent_count = counts['sent']
+    chunk.failed_count = counts['failed']
+    chunk.completed_at = timezone.now()
+    chunk.locked_until = None
+    chunk.save(update_fields=['status', 'sent_count', 'failed_count', 'completed_at', 'locked_until'])
+    
+    # Progress - keep the send's lease alive so it isn't taken for stalled
+    NewsletterSend.objects.filter(pk=chunk.send_id, status='sending').update(
+        locked_until=timezone.now() + NewsletterSend.LEASE_DURATION
+    )
+    
+    logger.info(
+        f"Newsletter chunk {chunk.first_subscriber_id}-{chunk.last_subscriber_id} for post {post.pk}: "
+        f"{counts['sent']} sent, {counts['failed']} failed"
+    )
+    return counts
+
+
+@shared_task
+def finalize_blog_post_email(results, send_id):
+    """Chord callback - close the ledger, mark the post as sent and log the totals"""
+    send = NewsletterSend.objects.get(pk=send_id)
+    if send.chunks.filter(status='pending').exists():
+        # A chunk was skipped because another worker holds it - that run (or
+        # the next resume) closes the ledger
+        logger.info(f"Newsletter send {send_id} still has chunks in flight")
+        return f"Newsletter send {send_id} not finished"
+    
+    totals = send.chunks.aggregate(sent=Sum('sent_count'), failed=Sum('failed_count'))
+    now = timezone.now()
+    
+    send.status = 'completed'
+    send.sent_count = totals['sent'] or 0
+    send.failed_count = totals['failed'] or 0
+    send.completed_at = now
+    send.locked_until = None
+    send.save(update_fields=['status', 'sent_count', 'failed_count', 'completed_at', 'locked_until'])
+    
+    BlogPost.objects.filter(pk=send.post_id).update(email_sent=True, email_sent_at=now)
+    
+    result_msg = (
+        f"Newsletter sent: {send.sent_count} successful, {send.failed_count} failed "
+        f"out of {send.sent_count + send.failed_count} subscribers"
+    )
+    logger.info(result_msg)
+    return result_msg
+
+
+@shared_task
+def resume_stalled_newsletter_sends():
+    """Re-trigger sends whose lease expired before finishing (e.g. a worker died mid-chunk)"""
+    stalled = NewsletterSend.objects.filter(
+        status='sending',
+        locked_until__lt=timezone.now()
+    ).values_list('post_id', flat=True)
+    
+    count = 0
+    for post_id in stalled:
+        send_blog_post_email.delay(post_id)
+        count += 1
+    
+    if count:
+        logger.info(f"Resuming {count} stalled newsletter send(s)")
+    return count
+
+
+@shared_task
+def rebuild_blog_tag_counts():
+    """
+    Full recount of BlogTagCount. Signals keep it current on edits; this
+    catches posts whose scheduled published_at has since passed.
+    """
+    BlogTagCount.rebuild()
+
+
 @shared_task
 def send_test_blog_email(post_id, test_email):
     """Send a test email for a blog post to a specific address"""
     try:
         post = BlogPost.objects.get(pk=post_id)
-        
-        # Get site domain
-        try:
-            site = Site.objects.get_current()
-            domain = site.domain
-        except:
-            domain = settings.SITE_DOMAIN if hasattr(settings, 'SITE_DOMAIN') else 'dreamwedai.com'
+        domain = get_email_domain()
         
         context = {
             'post': post,
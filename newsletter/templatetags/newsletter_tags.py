@@ -1,5 +1,12 @@
+import html
+import re
+
 from django import template
 from django.urls import reverse
+from django.utils.html import escape
+from django.utils.safestring import mark_safe
+
+from newsletter.search import HIGHLIGHT_START, HIGHLIGHT_STOP
 
 register = template.Library()
 
@@ -7,4 +14,16 @@ register = template.Library()
 @register.simple_tag
 def tag_url(tag):
     """Generate URL for a tag"""
-    return reverse('newsletter:tag_posts', kwargs={'slug': tag.slug})
\ No newline at end of file
+    return reverse('newsletter:tag_posts', kwargs={'slug': tag.slug})
+
+@register.filter
+def highlight_snippet(headline):
+    """
+    Render a search_headline safely: escape the text around the <mark>
+    highlights Postgres inserted, keep the marks themselves.
+    """
+    pieces = re.split(f'({re.escape(HIGHLIGHT_START)}|{re.escape(HIGHLIGHT_STOP)})', headline or '')
+    return mark_safe(''.join(
+        piece if piece in (HIGHLIGHT_START, HIGHLIGHT_STOP) else escape(html.unescape(piece))
+        for piece in pieces
+    ))
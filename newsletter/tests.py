@@ -1,3 +1,133 @@
-from django.test import TestCase
+from datetime import timedelta
 
-# Create your tests here.
+import pytest
+from django.core import mail
+from django.utils import timezone
+
+from newsletter import tasks
+from newsletter.models import (
+    BlogPost, NewsletterDelivery, NewsletterSend, NewsletterSendChunk, NewsletterSubscription
+)
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def eager_celery(settings):
+    settings.CELERY_TASK_ALWAYS_EAGER = True
+
+
+@pytest.fixture
+def post():
+    return BlogPost.objects.create(title="Spring venues", excerpt="Excerpt", content="<p>Content</p>")
+
+
+@pytest.fixture
+def subscribers():
+    return [
+        NewsletterSubscription.objects.create(email=f"guest{i}@example.com")
+        for i in range(3)
+    ]
+
+
+@pytest.fixture
+def stalled_send(post, subscribers):
+    """A send whose worker died: lease expired, its single chunk still pending"""
+    send = NewsletterSend.objects.create(
+        post=post,
+        total_chunks=1,
+        locked_until=timezone.now() - timedelta(minutes=1),
+    )
+    NewsletterSendChunk.objects.create(
+        send=send,
+        first_subscriber_id=subscribers[0].pk,
+        last_subscriber_id=subscribers[-1].pk,
+    )
+    return send
+
+
+def recipients():
+    return sorted(address for message in mail.outbox for address in message.to)
+
+
+def test_send_emails_every_subscriber_once(post, subscribers):
+    tasks.send_blog_post_email.delay(post.pk)
+
+    assert recipients() == sorted(subscriber.email for subscriber in subscribers)
+    send = NewsletterSend.objects.get(post=post)
+    assert send.status == "completed"
+    assert send.sent_count == 3
+    post.refresh_from_db()
+    assert post.email_sent
+
+
+def test_resend_after_completion_sends_nothing(post, subscribers):
+    tasks.send_blog_post_email.delay(post.pk)
+    mail.outbox.clear()
+
+    tasks.send_blog_post_email.delay(post.pk)
+
+    assert mail.outbox == []
+
+
+def test_resume_skips_recipients_already_recorded(stalled_send, subscribers):
+    chunk = stalled_send.chunks.get()
+    NewsletterDelivery.objects.create(chunk=chunk, email=subscribers[0].email, status="sent")
+    # Recorded right before the worker died - sent or not, it isn't sent again
+    NewsletterDelivery.objects.create(chunk=chunk, email=subscribers[1].email, status="pending")
+
+    assert tasks.resume_stalled_newsletter_sends.delay().result == 1
+
+    assert recipients() == [subscribers[2].email]
+    chunk.refresh_from_db()
+    assert chunk.status == "completed"
+    assert chunk.sent_count == 2
+    stalled_send.refresh_from_db()
+    assert stalled_send.status == "completed"
+
+
+def test_chunk_retry_skips_recipients_already_sent(stalled_send, subscribers):
+    chunk = stalled_send.chunks.get()
+    NewsletterDelivery.objects.create(chunk=chunk, email=subscribers[0].email, status="sent")
+
+    tasks.send_newsletter_chunk.delay(chunk.pk)
+
+    assert recipients() == [subscribers[1].email, subscribers[2].email]
+    assert NewsletterDelivery.objects.filter(chunk=chunk, status="sent").count() == 3
+
+
+def test_chunk_leased_by_another_worker_is_not_sent(stalled_send):
+    chunk = stalled_send.chunks.get()
+    assert chunk.acquire_lease()
+
+    tasks.send_newsletter_chunk.delay(chunk.pk)
+
+    assert mail.outbox == []
+    assert not chunk.acquire_lease()
+    chunk.refresh_from_db()
+    assert chunk.status == "pending"
+
+
+def test_expired_chunk_lease_can_be_reclaimed(stalled_send):
+    chunk = stalled_send.chunks.get()
+    NewsletterSendChunk.objects.filter(pk=chunk.pk).update(
+        locked_until=timezone.now() - timedelta(seconds=1)
+    )
+
+    assert chunk.acquire_lease()
+
+
+def test_resume_leaves_ledger_open_while_a_chunk_is_in_flight(stalled_send, subscribers):
+    in_flight = NewsletterSendChunk.objects.create(
+        send=stalled_send,
+        first_subscriber_id=subscribers[-1].pk + 1,
+        last_subscriber_id=subscribers[-1].pk + 10,
+    )
+    assert in_flight.acquire_lease()
+
+    tasks.resume_stalled_newsletter_sends.delay()
+
+    assert len(mail.outbox) == 3
+    stalled_send.refresh_from_db()
+    assert stalled_send.status == "sending"
+    assert not BlogPost.objects.get(pk=stalled_send.post_id).email_sent
@@ -10,16 +10,20 @@ from django.shortcuts import render, get_object_or_404, redirect
 from django.views.generic import ListView, DetailView
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from django.db.models import Count, Q
 from django.utils import timezone
 from django.core.paginator import Paginator
 from django.urls import reverse
+from django.db.models import Max
+from saas_base.utils.page_cache import (
+    cache_public_page, conditional_page, fragment_cache_context, get_page_etag, serve_cached_page
+)
 from saas_base.utils.social_sharing import generate_social_share_urls
 from taggit.models import Tag
 
 from .forms import NewsletterSignupForm
+from .search import search_posts
 from .models import (
-    NewsletterSubscription, BlogPost, BlogComment
+    NewsletterSubscription, BlogPost, BlogComment, BlogTagCount
 )
 
 logger = logging.getLogger(__name__)
@@ -173,6 +177,7 @@ def general_unsubscribe(request):
 
 
 # Blog Views
+@method_decorator(cache_public_page('blog'), name='dispatch')
 class BlogListView(ListView):
     """Main blog listing page with django-taggit tags"""
     model = BlogPost
@@ -183,29 +188,18 @@ class BlogListView(ListView):
     def get_queryset(self):
         queryset = BlogPost.published_posts().select_related('author').prefetch_related('tags')
         
-        # Search functionality
-        search_query = self.request.GET.get('q')
+        # Search functionality - ranked full-text search on Postgres
+        search_query = self.request.GET.get('q', '').strip()
         if search_query:
-            queryset = queryset.filter(
-                Q(title__icontains=search_query) |
-                Q(excerpt__icontains=search_query) |
-                Q(content__icontains=search_query) |
-                Q(tags__name__icontains=search_query)
-            ).distinct()
+            queryset = search_posts(queryset, search_query)
         
         return queryset
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         
-        # Get popular tags using django-taggit
-        context['popular_tags'] = Tag.objects.filter(
-            taggit_taggeditem_items__content_type__app_label='newsletter',
-            taggit_taggeditem_items__content_type__model='blogpost',
-            taggit_taggeditem_items__object_id__in=BlogPost.published_posts().values_list('id', flat=True)
-        ).annotate(
-            post_count=Count('taggit_taggeditem_items')
-        ).filter(post_count__gt=0).order_by('-post_count')[:15]
+        # Popular tags from the maintained per-tag counts
+        context['popular_tags'] = BlogTagCount.popular_tags(15)
         
         # Recent posts for sidebar/recommendations
         context['recent_posts'] = BlogPost.published_posts()[:5]
@@ -228,14 +222,34 @@ class BlogDetailView(DetailView):
     
     def get_object(self, queryset=None):
         obj = super().get_object(queryset)
-        # Increment view count
-        obj.view_count += 1
-        obj.save(update_fields=['view_count'])
+        # Buffered in Redis - no row UPDATE per page view
+        obj.increment_views()
         return obj
     
+    def get(self, request, *args, **kwargs):
+        # Loaded (and the view counted) before any cache or 304 shortcut
+        self.object = post = self.get_object()
+        
+        last_modified = post.updated_at
+        if post.allow_comments:
+            latest_comment = post.comments.filter(is_approved=True).aggregate(latest=Max('created_at'))['latest']
+            last_modified = max(last_modified, latest_comment or last_modified)
+        
+        return conditional_page(
+            request,
+            lambda: serve_cached_page(
+                'blog',
+                lambda: self.render_to_response(self.get_context_data(object=post)),
+                request
+            ),
+            etag=get_page_etag(request, 'blog', post.pk, last_modified.isoformat()),
+            last_modified=last_modified,
+        )
+    
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         post = self.object
+        context.update(fragment_cache_context('blog'))
         
         # Get related posts (same tags, exclude current post)
         related_posts = BlogPost.published_posts().filter(
@@ -264,6 +278,7 @@ class BlogDetailView(DetailView):
         
         return context
 
+@method_decorator(cache_public_page('blog'), name='dispatch')
 class TagPostsView(ListView):
     """Posts filtered by tag using django-taggit"""
     model = BlogPost
@@ -282,13 +297,7 @@ class TagPostsView(ListView):
         context['tag'] = self.tag
         
         # Get other popular tags for discovery
-        context['popular_tags'] = Tag.objects.filter(
-            taggit_taggeditem_items__content_type__app_label='newsletter',
-            taggit_taggeditem_items__content_type__model='blogpost',
-            taggit_taggeditem_items__object_id__in=BlogPost.published_posts().values_list('id', flat=True)
-        ).annotate(
-            post_count=Count('taggit_taggeditem_items')
-        ).filter(post_count__gt=0).order_by('-post_count')[:10]
+        context['popular_tags'] = BlogTagCount.popular_tags(10)
         
         return context
 
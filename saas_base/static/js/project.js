@@ -2166,11 +2166,8 @@ function initializeImageGallery() {
         });
     });
     
-    // Auto-refresh processing jobs every 30 seconds
-    const processingJobs = document.querySelectorAll('[data-job-id] .processing-status');
-    if (processingJobs.length > 0) {
-        setInterval(checkAllProcessingJobs, 30000);
-    }
+    // Auto-refresh processing jobs until they finish
+    checkAllProcessingJobs();
 }
 
 async function toggleFavorite(button) {
@@ -2471,28 +2468,84 @@ async function executeProcessedImageDelete(imageId, modal) {
     }
 }
 
+// Job status polling - short polls against the Redis-backed /state/
+// endpoint, backing off while the status stays the same
+const JOB_POLL_INITIAL_MS = 5000;
+const JOB_POLL_MAX_MS = 30000;
+const JOB_POLL_BACKOFF = 1.5;
+const polledJobs = new Set();
+
+async function fetchJobState(jobId) {
+    const response = await fetch(`/studio/job/${jobId}/state/`);
+    const data = await response.json();
+    
+    if (!response.ok || !data.status) {
+        throw new Error(data.error || `HTTP ${response.status}`);
+    }
+    return data;
+}
+
+/**
+ * Poll a job until it completes or fails, calling onUpdate(data) whenever
+ * its status changes. Waits 5s, then 1.5x longer after each unchanged poll
+ * (up to 30s); a status change resets the wait. One poller per job - a
+ * second call for a job already being polled returns null straight away,
+ * as does stopping early (deadline passed or isActive() false).
+ */
+async function pollJobState(jobId, onUpdate, { deadline = Infinity, isActive = () => true } = {}) {
+    if (polledJobs.has(jobId)) return null;
+    polledJobs.add(jobId);
+    
+    let delay = JOB_POLL_INITIAL_MS;
+    let lastStatus = null;
+    try {
+        while (Date.now() < deadline) {
+            await new Promise(resolve => setTimeout(resolve, delay));
+            if (!isActive()) return null;
+            
+            try {
+                const data = await fetchJobState(jobId);
+                if (data.status !== lastStatus) {
+                    lastStatus = data.status;
+                    delay = JOB_POLL_INITIAL_MS;
+                    onUpdate(data);
+                    if (data.status === 'completed' || data.status === 'failed') return data;
+                    continue;
+                }
+            } catch (error) {
+                console.error(`❌ Status check error for job ${jobId}:`, error);
+            }
+            delay = Math.min(delay * JOB_POLL_BACKOFF, JOB_POLL_MAX_MS);
+        }
+        return null;
+    } finally {
+        polledJobs.delete(jobId);
+    }
+}
+
+function handleJobState(jobId, data) {
+    // Update the UI based on status
+    const jobElement = document.querySelector(`[data-job-id="${jobId}"]`);
+    if (jobElement) {
+        updateJobUI(jobElement, data);
+    }
+    
+    // If completed, reload the page to show results
+    if (data.status === 'completed') {
+        showToast('✨ Transformation completed!', 'success');
+        setTimeout(() => {
+            location.reload();
+        }, 2000);
+    } else if (data.status === 'failed') {
+        showToast('❌ Transformation failed: ' + (data.error_message || 'Unknown error'), 'error');
+    }
+}
+
 async function checkJobStatus(jobId) {
     console.log(`📊 Checking status for job ${jobId}...`);
     
     try {
-        const response = await fetch(`/studio/job/${jobId}/status/`);
-        const data = await response.json();
-        
-        // Update the UI based on status
-        const jobElement = document.querySelector(`[data-job-id="${jobId}"]`);
-        if (jobElement) {
-            updateJobUI(jobElement, data);
-        }
-        
-        // If completed, reload the page to show results
-        if (data.status === 'completed') {
-            showToast('✨ Transformation completed!', 'success');
-            setTimeout(() => {
-                location.reload();
-            }, 2000);
-        } else if (data.status === 'failed') {
-            showToast('❌ Transformation failed: ' + (data.error_message || 'Unknown error'), 'error');
-        }
+        handleJobState(jobId, await fetchJobState(jobId));
     } catch (error) {
         console.error('❌ Status check error:', error);
     }
@@ -2537,7 +2590,7 @@ function checkAllProcessingJobs() {
         const jobElement = status.closest('[data-job-id]');
         if (jobElement) {
             const jobId = jobElement.dataset.jobId;
-            checkJobStatus(jobId);
+            pollJobState(jobId, data => handleJobState(jobId, data));
         }
     });
 }
@@ -2871,38 +2924,23 @@ function startSimpleDynamicPolling() {
     
     if (processingJobs.length === 0) return;
     
-    console.log(`Found ${processingJobs.length} processing jobs - starting simple polling`);
+    console.log(`Found ${processingJobs.length} processing jobs - waiting for status changes`);
     
-    let checks = 0;
-    const maxChecks = 120; // 10 minutes
+    const deadline = Date.now() + 10 * 60 * 1000; // 10 minutes
     
-    const interval = setInterval(async () => {
-        checks++;
-        let stillProcessing = false;
-        
-        for (const job of processingJobs) {
-            try {
-                const response = await fetch(`/studio/job/${job.id}/status/`);
-                const data = await response.json();
-                
-                if (data.status === 'completed') {
-                    updateJobToCompleted(job.element, job.id);
-                } else if (data.status === 'failed') {
-                    updateJobToFailed(job.element, data.error_message);
-                } else if (data.status === 'processing') {
-                    stillProcessing = true;
-                }
-            } catch (error) {
-                console.error(`Error checking job ${job.id}:`, error);
+    processingJobs.forEach(async job => {
+        const data = await pollJobState(job.id, data => {
+            if (data.status === 'completed') {
+                updateJobToCompleted(job.element, job.id);
+            } else if (data.status === 'failed') {
+                updateJobToFailed(job.element, data.error_message);
             }
-        }
+        }, { deadline });
         
-        // Stop polling if no jobs are processing or max time reached
-        if (!stillProcessing || checks >= maxChecks) {
-            clearInterval(interval);
-            console.log('✅ Polling stopped - all jobs completed or timeout reached');
+        if (!data) {
+            console.log(`✅ Stopped checking job ${job.id}`);
         }
-    }, 5000); // Check every 5 seconds
+    });
 }
 
 function updateJobToCompleted(jobElement, jobId) {
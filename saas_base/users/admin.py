@@ -82,6 +82,16 @@ class UserAdmin(auth_admin.UserAdmin):
     
     actions = ["reset_to_full", "add_50_tokens", "add_100_tokens", "set_to_zero"]
     
+    def get_changelist_instance(self, request):
+        """Fetch token usage for the whole page at once rather than per row"""
+        from usage_limits.usage_tracker import UsageTracker
+        
+        changelist = super().get_changelist_instance(request)
+        usage_data = UsageTracker.get_usage_data_many(changelist.result_list)
+        for user in changelist.result_list:
+            user.usage_data = usage_data.get(user.id)
+        return changelist
+    
     def display_token_info(self, obj):
         """Display current token usage information"""
         from usage_limits.usage_tracker import UsageTracker
@@ -134,7 +144,8 @@ class UserAdmin(auth_admin.UserAdmin):
         """Compact display for list view"""
         from usage_limits.usage_tracker import UsageTracker
         
-        usage_data = UsageTracker.get_usage_data(obj)
+        # Prefetched for the page in get_changelist_instance
+        usage_data = getattr(obj, 'usage_data', None) or UsageTracker.get_usage_data(obj)
         
         # Color code based on remaining tokens
         if usage_data['remaining'] == 0:
@@ -208,24 +219,40 @@ class UserAdmin(auth_admin.UserAdmin):
                     )
     
     # Admin actions
-    def reset_to_full(self, request, queryset):
-        """Give users their full subscription limit"""
+    def _set_usage_many(self, request, users, command, error_label):
+        """
+        Apply `command(pipe, usage_key, user)` to every user in one pipelined
+        round trip, reporting failures per user. Returns the number updated.
+        """
         from usage_limits.redis_client import RedisClient
         
-        redis_client = RedisClient.get_client()
-        count = 0
+        try:
+            pipe = RedisClient.get_client().pipeline(transaction=False)
+            for user in users:
+                command(pipe, f"usage:{user.id}", user)
+            results = pipe.execute(raise_on_error=False)
+        except Exception as e:
+            self.message_user(request, f"Failed to {error_label}: {str(e)}", level=messages.ERROR)
+            return 0
         
-        for user in queryset:
-            usage_key = f"usage:{user.id}"  # FIXED: Use new key pattern
-            try:
-                redis_client.set(usage_key, 0)  # Set used to 0 = full limit available
-                count += 1
-            except Exception as e:
+        count = 0
+        for user, result in zip(users, results):
+            if isinstance(result, Exception):
                 self.message_user(
                     request,
-                    f"Failed to reset {user.username}: {str(e)}",
+                    f"Failed to {error_label} {user.username}: {str(result)}",
                     level=messages.ERROR
                 )
+            else:
+                count += 1
+        return count
+    
+    def reset_to_full(self, request, queryset):
+        """Give users their full subscription limit"""
+        # Set used to 0 = full limit available
+        count = self._set_usage_many(
+            request, list(queryset), lambda pipe, key, user: pipe.set(key, 0), 'reset'
+        )
         
         self.message_user(
             request,
@@ -250,23 +277,16 @@ class UserAdmin(auth_admin.UserAdmin):
     def set_to_zero(self, request, queryset):
         """Set users to 0 remaining tokens"""
         from usage_limits.usage_tracker import UsageTracker
-        from usage_limits.redis_client import RedisClient
         
-        redis_client = RedisClient.get_client()
-        count = 0
+        users = list(queryset)
+        usage_data = UsageTracker.get_usage_data_many(users)
         
-        for user in queryset:
-            usage_key = f"usage:{user.id}"  # FIXED: Use new key pattern
-            try:
-                limit = UsageTracker.get_user_limit(user)
-                redis_client.set(usage_key, limit)  # Set used = limit, so remaining = 0
-                count += 1
-            except Exception as e:
-                self.message_user(
-                    request,
-                    f"Failed to set {user.username} to zero: {str(e)}",
-                    level=messages.ERROR
-                )
+        # Set used = limit, so remaining = 0
+        count = self._set_usage_many(
+            request, users,
+            lambda pipe, key, user: pipe.set(key, usage_data[user.id]['limit']),
+            'set to zero for'
+        )
         
         self.message_user(
             request,
@@ -278,35 +298,17 @@ class UserAdmin(auth_admin.UserAdmin):
     
     def _add_tokens(self, request, queryset, amount):
         """Helper method to add tokens to users"""
-        from usage_limits.usage_tracker import UsageTracker
-        from usage_limits.redis_client import RedisClient
-        
-        redis_client = RedisClient.get_client()
-        count = 0
-        
-        for user in queryset:
-            usage_key = f"usage:{user.id}"  # FIXED: Use new key pattern
-            try:
-                usage_data = UsageTracker.get_usage_data(user)
-                current_used = usage_data['current']
-                
-                # FIXED: To add tokens, we reduce the "used" count
-                # Allow negative values for bonus tokens beyond subscription limit
-                # Example: used=97, add 50 tokens → new_used=47 (gives 53 more tokens if limit=100)
-                # Example: used=10, add 50 tokens → new_used=-40 (40 bonus beyond limit)
-                new_used = current_used - amount
-                
-                redis_client.set(usage_key, new_used)
-                count += 1
-            except Exception as e:
-                self.message_user(
-                    request,
-                    f"Failed to add tokens for {user.username}: {str(e)}",
-                    level=messages.ERROR
-                )
+        # To add tokens, we reduce the "used" count - atomically, so a job
+        # finishing meanwhile isn't overwritten. Negative values are bonus
+        # tokens beyond the subscription limit.
+        # Example: used=97, add 50 tokens → used=47 (gives 53 more tokens if limit=100)
+        # Example: used=10, add 50 tokens → used=-40 (40 bonus beyond limit)
+        count = self._set_usage_many(
+            request, list(queryset), lambda pipe, key, user: pipe.decrby(key, amount), 'add tokens for'
+        )
         
         self.message_user(
             request,
             f"✅ Added {amount} tokens to {count} user(s)",
             level=messages.SUCCESS
-        )
\ No newline at end of file
+        )
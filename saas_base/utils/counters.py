@@ -0,0 +1,184 @@
+# saas_base/utils/counters.py - Redis-buffered hit counters flushed to the DB in bulk
+
+import logging
+import uuid
+
+from celery import shared_task
+from django.apps import apps
+from django.db import transaction
+from django.db.models import F
+
+from usage_limits.redis_client import RedisClient
+
+logger = logging.getLogger(__name__)
+
+# Counters that may be buffered, as "app_label.Model": field. The flush task
+# walks exactly these, so a model has to be listed here to be buffered.
+BUFFERED_COUNTERS = {
+    'newsletter.BlogPost': 'view_count',
+    'wedding_shopping.WeddingLink': 'click_count',
+}
+
+# A flush holds its model's lock for at most this long; comfortably more
+# than one flush takes, so a crashed run's lock just expires
+FLUSH_LOCK_TIMEOUT = 5 * 60
+
+RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class BufferedCounter:
+    """
+    Page-view style counters that are bumped with HINCRBY on a per-model hash
+    (pk -> pending delta) instead of a row UPDATE per hit, and written back
+    periodically by flush_buffered_counters with one F() update per row.
+
+    Fails open: if Redis is unavailable the increment goes straight to the
+    database as an F() update, so hits are never dropped.
+    """
+
+    KEY_PREFIX = 'counter'
+
+    @classmethod
+    def _label(cls, model):
+        return model._meta.label
+
+    @classmethod
+    def _get_key(cls, model):
+        return f"{cls.KEY_PREFIX}:{cls._label(model)}:{BUFFERED_COUNTERS[cls._label(model)]}"
+
+    @classmethod
+    def _get_flushing_key(cls, model):
+        return f"{cls._get_key(model)}:flushing"
+    
+    @classmethod
+    def _get_lock_key(cls, model):
+        return f"{cls._get_key(model)}:flush_lock"
+
+    @classmethod
+    def increment(cls, obj, amount=1):
+        """
+        Count `amount` hits against `obj`. Returns the delta now pending for
+        it (including this hit), which callers can add to the value they
+        loaded to show an up-to-date count.
+        """
+        model = type(obj)
+        try:
+            redis_client = RedisClient.get_client()
+            return int(redis_client.hincrby(cls._get_key(model), obj.pk, amount))
+        except Exception as e:
+            logger.warning(f"Counter buffer unavailable, writing {cls._label(model)} {obj.pk} directly: {str(e)}")
+            field = BUFFERED_COUNTERS[cls._label(model)]
+            model.objects.filter(pk=obj.pk).update(**{field: F(field) + amount})
+            return amount
+
+    @classmethod
+    def get_pending(cls, model, pks):
+        """Unflushed deltas for `pks` as {pk: delta}, counting any flush in progress"""
+        pks = list(pks)
+        if not pks:
+            return {}
+        try:
+            redis_client = RedisClient.get_client()
+            pipe = redis_client.pipeline(transaction=False)
+            pipe.hmget(cls._get_key(model), pks)
+            pipe.hmget(cls._get_flushing_key(model), pks)
+            buffered, flushing = pipe.execute()
+        except Exception as e:
+            logger.warning(f"Could not read buffered {cls._label(model)} counters: {str(e)}")
+            return {}
+
+        return {
+            pk: int(pending or 0) + int(in_flight or 0)
+            for pk, pending, in_flight in zip(pks, buffered, flushing)
+        }
+
+    @classmethod
+    def merge_pending(cls, objects):
+        """Add unflushed deltas onto the counter field of already-loaded objects"""
+        objects = list(objects)
+        if not objects:
+            return objects
+        model = type(objects[0])
+        field = BUFFERED_COUNTERS[cls._label(model)]
+        pending = cls.get_pending(model, [obj.pk for obj in objects])
+        for obj in objects:
+            setattr(obj, field, getattr(obj, field) + pending.get(obj.pk, 0))
+        return objects
+
+    @classmethod
+    def flush(cls, model):
+        """
+        Move the buffered deltas for `model` into the database. Returns the
+        number of rows updated.
+
+        The hash is RENAMEd aside before it is read so hits arriving during
+        the flush start a fresh buffer. A flushing hash left behind by a
+        crashed run is applied first; the worst case there is a batch counted
+        twice, never one lost.
+
+        Overlapping flushes would apply the same flushing hash twice, so each
+        model's flush runs under a SET NX lock; a flush that finds it taken
+        returns 0 and leaves the buffer to the holder.
+        """
+        redis_client = RedisClient.get_client()
+        lock_key = cls._get_lock_key(model)
+        token = uuid.uuid4().hex
+        if not redis_client.set(lock_key, token, nx=True, ex=FLUSH_LOCK_TIMEOUT):
+            logger.info(f"Buffered {cls._label(model)} counters are already being flushed")
+            return 0
+
+        try:
+            return cls._flush_locked(redis_client, model)
+        finally:
+            redis_client.eval(RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+
+    @classmethod
+    def _flush_locked(cls, redis_client, model):
+        key = cls._get_key(model)
+        flushing_key = cls._get_flushing_key(model)
+
+        if not redis_client.exists(flushing_key):
+            if not redis_client.exists(key):
+                return 0
+            redis_client.rename(key, flushing_key)
+
+        deltas = {int(pk): int(delta) for pk, delta in redis_client.hgetall(flushing_key).items() if int(delta)}
+        field = BUFFERED_COUNTERS[cls._label(model)]
+
+        with transaction.atomic():
+            # Rows deleted since the hit simply match nothing
+            for pk in sorted(deltas):
+                model.objects.filter(pk=pk).update(**{field: F(field) + deltas[pk]})
+
+        redis_client.delete(flushing_key)
+        return len(deltas)
+
+
+def get_buffered_models():
+    """The models listed in BUFFERED_COUNTERS"""
+    return [apps.get_model(label) for label in BUFFERED_COUNTERS]
+
+
+@shared_task
+def flush_buffered_counters():
+    """
+    Write buffered view/click counters back to the database - one F()
+    update per touched row.
+    """
+    flushed = {}
+    for model in get_buffered_models():
+        try:
+            flushed[model._meta.label] = BufferedCounter.flush(model)
+        except Exception as e:
+            # Left in Redis; the next run picks it up
+            logger.error(f"Error flushing buffered {model._meta.label} counters: {str(e)}")
+            flushed[model._meta.label] = None
+
+    if any(flushed.values()):
+        logger.info(f"Flushed buffered counters: {flushed}")
+    return flushed
@@ -0,0 +1,182 @@
+# saas_base/utils/page_cache.py
+"""
+Page caching for public, anonymous-heavy pages (blog, wedding pages)
+
+Cache keys carry a per-namespace version number that model signals bump on
+save/delete, so every cached page and fragment in the namespace is
+invalidated at once without deleting keys.
+"""
+import functools
+import hashlib
+import logging
+import re
+
+from django.contrib.messages import get_messages
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+
+logger = logging.getLogger(__name__)
+
+PAGE_CACHE_TIMEOUT = 60 * 15
+
+# Every page renders a CSRF token (base.html meta tag and newsletter form).
+# Cached copies hold this placeholder instead, swapped for the visitor's own
+# token when served.
+CSRF_PLACEHOLDER = '__PAGE_CACHE_CSRF_TOKEN__'
+CSRF_META_RE = re.compile(r'<meta name="csrf-token" content="([^"]+)"')
+
+
+def _version_key(namespace):
+    return f"page_cache:version:{namespace}"
+
+
+def get_cache_version(namespace):
+    """Current version number for `namespace` (starts at 1)"""
+    version = cache.get(_version_key(namespace))
+    if version is None:
+        cache.add(_version_key(namespace), 1, timeout=None)
+        version = cache.get(_version_key(namespace)) or 1
+    return version
+
+
+def bump_cache_version(*namespaces):
+    """Invalidate every cached page and fragment in `namespaces`"""
+    for namespace in namespaces:
+        try:
+            cache.incr(_version_key(namespace))
+        except ValueError:
+            # Not set yet (or evicted) - anything cached under it is unreachable anyway
+            cache.set(_version_key(namespace), 2, timeout=None)
+        except Exception as e:
+            logger.warning(f"Could not bump page cache version for {namespace}: {str(e)}")
+
+
+def is_page_cacheable(request):
+    """Full-page caching only for anonymous GET/HEAD requests with no flash messages to show"""
+    return (
+        request.method in ('GET', 'HEAD')
+        and not request.user.is_authenticated
+        and not len(get_messages(request))
+    )
+
+
+def _page_key(request, namespace):
+    url_hash = hashlib.md5(request.build_absolute_uri().encode(), usedforsecurity=False).hexdigest()
+    return f"page_cache:{namespace}:v{get_cache_version(namespace)}:{url_hash}"
+
+
+def get_cached_page(request, namespace):
+    """Cached response for this URL, with the visitor's CSRF token filled in, or None"""
+    entry = cache.get(_page_key(request, namespace))
+    if entry is None:
+        return None
+
+    content = entry['content']
+    if entry['csrf']:
+        content = content.replace(CSRF_PLACEHOLDER, get_token(request))
+    response = HttpResponse(content, content_type=entry['content_type'])
+    for header, value in entry['headers'].items():
+        response[header] = value
+    return response
+
+
+def cache_page_response(request, response, namespace, timeout=PAGE_CACHE_TIMEOUT):
+    """Store a successful anonymous response for this URL"""
+    if response.status_code != 200 or response.streaming or response.cookies:
+        return response
+    if hasattr(response, 'render') and not response.is_rendered:
+        response.render()
+
+    content = response.content.decode(response.charset)
+    csrf_used = bool(request.META.get('CSRF_COOKIE_NEEDS_UPDATE'))
+    if csrf_used:
+        match = CSRF_META_RE.search(content)
+        if not match:
+            # Token rendered somewhere we can't find - caching it would break POSTs
+            return response
+        content = content.replace(match.group(1), CSRF_PLACEHOLDER)
+
+    cache.set(_page_key(request, namespace), {
+        'content': content,
+        'content_type': response['Content-Type'],
+        'csrf': csrf_used,
+        'headers': {
+            header: response[header]
+            for header in ('ETag', 'Last-Modified')
+            if response.has_header(header)
+        },
+    }, timeout)
+    return response
+
+
+def serve_cached_page(namespace, render, request, timeout=PAGE_CACHE_TIMEOUT):
+    """
+    Return the cached page for an anonymous visitor, or call render() and
+    cache what it returns. Everyone else just gets render().
+    """
+    if not is_page_cacheable(request):
+        return render()
+
+    response = get_cached_page(request, namespace)
+    if response is None:
+        response = cache_page_response(request, render(), namespace, timeout)
+    patch_vary_headers(response, ['Cookie'])
+    return response
+
+
+def cache_public_page(namespace, timeout=PAGE_CACHE_TIMEOUT):
+    """View decorator: full-page cache for anonymous visitors (see serve_cached_page)"""
+    def decorator(view_func):
+        @functools.wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            return serve_cached_page(
+                namespace, lambda: view_func(request, *args, **kwargs), request, timeout
+            )
+        return wrapper
+    return decorator
+
+
+def fragment_cache_context(namespace):
+    """Template context for {% cache %} fragments: vary on page_cache_version"""
+    return {
+        'page_cache_version': get_cache_version(namespace),
+        'page_cache_timeout': PAGE_CACHE_TIMEOUT,
+    }
+
+
+def get_page_etag(request, namespace, *parts):
+    """
+    Strong ETag over the namespace version, the page's own timestamps and
+    whether the viewer is signed in (their page differs from the anonymous one)
+    """
+    viewer = request.user.pk if request.user.is_authenticated else 'anon'
+    data = ':'.join(str(part) for part in (namespace, get_cache_version(namespace), viewer, *parts))
+    return quote_etag(hashlib.md5(data.encode(), usedforsecurity=False).hexdigest())
+
+
+def conditional_page(request, render, etag, last_modified):
+    """
+    304 if the client's copy is current, otherwise render() with ETag and
+    Last-Modified set so crawlers and shared links can revalidate next time.
+    Pending flash messages always render, without validators - neither a
+    304 nor a later revalidation may hand back a copy with the wrong messages.
+    """
+    if len(get_messages(request)):
+        response = render()
+        patch_vary_headers(response, ['Cookie'])
+        return response
+
+    last_modified = last_modified.replace(microsecond=0) if last_modified else None
+    last_modified_ts = int(last_modified.timestamp()) if last_modified else None
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified_ts)
+    if response is None:
+        response = render()
+    if request.method in ('GET', 'HEAD') and response.status_code in (200, 304):
+        response.setdefault('ETag', etag)
+        if last_modified_ts:
+            response.setdefault('Last-Modified', http_date(last_modified_ts))
+    patch_vary_headers(response, ['Cookie'])
+    return response
@@ -0,0 +1,61 @@
+# subscriptions/management/commands/sync_subscription_billing.py
+import stripe
+from django.core.management.base import BaseCommand
+from django.conf import settings
+from subscriptions.models import CustomerSubscription
+
+class Command(BaseCommand):
+    help = 'Backfill mirrored billing interval and period dates from Stripe (webhooks keep them current afterwards)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--missing-only',
+            action='store_true',
+            help='Only sync subscriptions with no billing interval recorded yet',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Show what would be synced without saving',
+        )
+
+    def handle(self, *args, **options):
+        stripe.api_key = settings.STRIPE_SECRET_KEY
+
+        subscriptions = CustomerSubscription.objects.filter(
+            stripe_subscription_id__isnull=False
+        ).exclude(stripe_subscription_id='').select_related('user')
+        if options['missing_only']:
+            subscriptions = subscriptions.filter(billing_interval__isnull=True)
+
+        self.stdout.write(f"Syncing billing details for {subscriptions.count()} subscriptions...")
+
+        synced_count = 0
+        error_count = 0
+
+        for subscription in subscriptions.iterator():
+            try:
+                stripe_sub = stripe.Subscription.retrieve(
+                    subscription.stripe_subscription_id,
+                    expand=['items.data.price']
+                )
+                subscription.sync_billing_from_stripe(stripe_sub)
+
+                if not options['dry_run']:
+                    subscription.save(update_fields=[
+                        'billing_interval', 'subscription_created_at',
+                        'current_period_start', 'current_period_end', 'updated_at'
+                    ])
+
+                synced_count += 1
+                started = subscription.subscription_created_at
+                self.stdout.write(
+                    f"✓ {subscription.user.username}: {subscription.billing_interval or 'unknown'}"
+                    + (f" (started {started:%Y-%m-%d})" if started else '')
+                )
+            except Exception as e:
+                error_count += 1
+                self.stderr.write(f"✗ {subscription.user.username}: {str(e)}")
+
+        action = "Would sync" if options['dry_run'] else "Synced"
+        self.stdout.write(self.style.SUCCESS(f"\n{action} {synced_count} subscriptions ({error_count} errors)"))
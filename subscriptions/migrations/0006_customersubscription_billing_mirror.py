@@ -0,0 +1,37 @@
+# Generated by Django 5.1.8 on 2026-10-17 00:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('subscriptions', '0005_accountsetuptoken'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customersubscription',
+            name='billing_interval',
+            field=models.CharField(blank=True, max_length=10, null=True),
+        ),
+        migrations.AddField(
+            model_name='customersubscription',
+            name='subscription_created_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='customersubscription',
+            name='current_period_start',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='customersubscription',
+            name='current_period_end',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='customersubscription',
+            index=models.Index(fields=['billing_interval', 'subscription_active'], name='subscriptio_billing_82ac7b_idx'),
+        ),
+    ]
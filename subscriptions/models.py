@@ -2,7 +2,7 @@ from django.db import models
 from django.conf import settings
 from django.utils.crypto import get_random_string
 from django.utils import timezone
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone as dt_timezone
 
 class CustomerSubscription(models.Model):
     """Store minimal subscription data - Stripe is the source of truth"""
@@ -17,8 +17,21 @@ class CustomerSubscription(models.Model):
     status = models.CharField(max_length=50, blank=True, null=True)
     plan_id = models.CharField(max_length=255, blank=True, null=True)
     subscription_active = models.BooleanField(default=False)
+    
+    # Mirrored from Stripe by the subscription webhooks, so billing jobs
+    # (e.g. yearly resets) don't need to call the Stripe API
+    billing_interval = models.CharField(max_length=10, blank=True, null=True)
+    subscription_created_at = models.DateTimeField(blank=True, null=True)
+    current_period_start = models.DateTimeField(blank=True, null=True)
+    current_period_end = models.DateTimeField(blank=True, null=True)
+    
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['billing_interval', 'subscription_active']),
+        ]
 
     def get_usage_data(self):
         """Get the usage data for this subscription's user"""
@@ -83,6 +96,46 @@ class CustomerSubscription(models.Model):
         from usage_limits.tier_config import TierLimits
         return TierLimits.get_limit_for_tier(self.get_tier_name())
 
+    def sync_billing_from_stripe(self, stripe_subscription, price=None):
+        """
+        Copy billing interval and period dates from a Stripe subscription
+        onto this record (caller saves). price defaults to the first item's.
+        """
+        def to_datetime(timestamp):
+            return datetime.fromtimestamp(timestamp, tz=dt_timezone.utc) if timestamp else None
+        
+        # Bracket access - .items is the dict method on Stripe objects
+        try:
+            items = stripe_subscription['items']['data']
+        except (KeyError, TypeError):
+            items = []
+        item = items[0] if items else None
+        
+        if price is None and item is not None:
+            price = item.get('price')
+        recurring = price.get('recurring') if price else None
+        if recurring:
+            self.billing_interval = recurring.get('interval')
+        
+        self.subscription_created_at = to_datetime(stripe_subscription.get('created')) or self.subscription_created_at
+        
+        # Newer API versions report the period per item rather than on the subscription
+        period_source = stripe_subscription if stripe_subscription.get('current_period_start') else (item or {})
+        self.current_period_start = to_datetime(period_source.get('current_period_start')) or self.current_period_start
+        self.current_period_end = to_datetime(period_source.get('current_period_end')) or self.current_period_end
+    
+    def get_yearly_reset_period(self, now=None):
+        """
+        (days since the subscription started, reset period 0-11) for a
+        yearly subscription, or None if it isn't one.
+        """
+        if self.billing_interval != 'year' or not self.subscription_created_at:
+            return None
+        
+        days_since_start = ((now or timezone.now()) - self.subscription_created_at).days
+        # Period 1-11 (11 resets after initial purchase)
+        return days_since_start, min(days_since_start // 30, 11)
+
     def __str__(self):
         return f"{self.user.username}'s subscription"
 
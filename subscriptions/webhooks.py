@@ -164,6 +164,7 @@ def handle_subscription_updated(subscription):
         # Update plan_id
         plan_id_set = False
         old_plan_id = customer_subscription.plan_id
+        stripe_price = None
         try:
             stripe.api_key = settings.STRIPE_SECRET_KEY
             subscription_items = stripe.SubscriptionItem.list(
@@ -174,6 +175,7 @@ def handle_subscription_updated(subscription):
             if subscription_items.data:
                 price_item = subscription_items.data[0]
                 customer_subscription.plan_id = price_item.price.id
+                stripe_price = price_item.price
                 plan_id_set = True
                 sync_product_and_price(price_item.price)
                 logger.info(f"✓ Updated plan_id to {price_item.price.id}")
@@ -192,6 +194,9 @@ def handle_subscription_updated(subscription):
             except Exception as e:
                 logger.error(f"Fallback plan_id retrieval failed: {str(e)}")
 
+        # Interval and period dates for billing jobs (renewals arrive here too)
+        customer_subscription.sync_billing_from_stripe(subscription, price=stripe_price)
+
         customer_subscription.save()
         logger.info(
             f"✓ Subscription updated: {subscription.id} for {customer_subscription.user.email} "
@@ -471,6 +476,7 @@ def handle_subscription_created(subscription):
         customer_subscription.status = subscription.status
         customer_subscription.subscription_active = subscription.status in ['active', 'trialing']
 
+        stripe_price = None
         try:
             subscription_items = stripe.SubscriptionItem.list(
                 subscription=subscription.id,
@@ -479,10 +485,12 @@ def handle_subscription_created(subscription):
             if subscription_items.data:
                 price_item = subscription_items.data[0]
                 customer_subscription.plan_id = price_item.price.id
+                stripe_price = price_item.price
                 sync_product_and_price(price_item.price)
         except Exception as e:
             logger.error(f"Error retrieving subscription items: {str(e)}")
 
+        customer_subscription.sync_billing_from_stripe(subscription, price=stripe_price)
         customer_subscription.save()
         logger.info(f"✓ Subscription created: {subscription.id}")
 
@@ -9,6 +9,9 @@ class UsageLimitsConfig(AppConfig):
     name = 'usage_limits'
     
     def ready(self):
+        # Cached plan invalidation on subscription/product/price changes
+        from . import signals  # noqa: F401
+        
         # Test Redis connection on startup
         from .redis_client import RedisClient
         try:
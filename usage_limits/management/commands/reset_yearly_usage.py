@@ -3,11 +3,9 @@
 from django.core.management.base import BaseCommand, CommandError
 from django.contrib.auth import get_user_model
 from django.utils import timezone
-from datetime import datetime, timedelta
-import stripe
-from django.conf import settings
 
 from subscriptions.models import CustomerSubscription
+from usage_limits.tasks import get_yearly_subscribers
 from usage_limits.usage_tracker import UsageTracker
 
 User = get_user_model()
@@ -48,8 +46,6 @@ class Command(BaseCommand):
         )
     
     def handle(self, *args, **options):
-        stripe.api_key = settings.STRIPE_SECRET_KEY
-        
         if options['show_eligible']:
             self.show_eligible_users()
             return
@@ -217,88 +213,29 @@ class Command(BaseCommand):
                 self.stderr.write(f"✗ Error resetting {user.username}: {str(e)}")
     
     def get_yearly_subscribers(self):
-        """Get all yearly subscribers with their data"""
-        subscriptions = CustomerSubscription.objects.filter(
-            subscription_active=True,
-            stripe_subscription_id__isnull=False
-        ).select_related('user')
-        
-        yearly_subscribers = []
-        
-        for subscription in subscriptions:
-            if not subscription.user:
-                continue
-            
-            try:
-                stripe_sub = stripe.Subscription.retrieve(subscription.stripe_subscription_id)
-                
-                # Check if yearly
-                if not (stripe_sub.items.data and stripe_sub.items.data[0].plan.interval == 'year'):
-                    continue
-                
-                start_date = datetime.fromtimestamp(stripe_sub.created)
-                start_date = timezone.make_aware(start_date)
-                now = timezone.now()
-                days_since_start = (now - start_date).days
-                period = min(days_since_start // 30, 11)
-                
-                usage_data = UsageTracker.get_usage_data(subscription.user)
-                
-                yearly_subscribers.append({
-                    'user': subscription.user,
-                    'subscription': subscription,
-                    'start_date': start_date,
-                    'days_since_start': days_since_start,
-                    'period': period,
-                    'current_usage': usage_data['current'],
-                    'limit': usage_data['limit'],
-                    'stripe_sub_id': subscription.stripe_subscription_id
-                })
-                
-            except Exception as e:
-                self.stderr.write(f"Error processing {subscription.user.username}: {str(e)}")
-                continue
-        
-        return yearly_subscribers
+        """Get all yearly subscribers with their data (from the local billing mirror)"""
+        return get_yearly_subscribers()
     
     def get_user_subscription_info(self, user):
         """Get detailed subscription info for a user"""
-        try:
-            subscription = CustomerSubscription.objects.filter(
-                user=user,
-                subscription_active=True
-            ).first()
-            
-            if not subscription or not subscription.stripe_subscription_id:
-                return {
-                    'plan_type': 'No subscription',
-                    'start_date': 'N/A',
-                    'days_active': 0,
-                    'period': 0
-                }
-            
-            stripe_sub = stripe.Subscription.retrieve(subscription.stripe_subscription_id)
-            start_date = datetime.fromtimestamp(stripe_sub.created)
-            start_date = timezone.make_aware(start_date)
-            now = timezone.now()
-            days_active = (now - start_date).days
-            period = min(days_active // 30, 11)
-            
-            plan_type = 'Monthly'
-            if stripe_sub.items.data and stripe_sub.items.data[0].plan.interval == 'year':
-                plan_type = 'Yearly'
-            
-            return {
-                'plan_type': plan_type,
-                'start_date': start_date.strftime('%Y-%m-%d'),
-                'days_active': days_active,
-                'period': period
-            }
-            
-        except Exception as e:
+        subscription = CustomerSubscription.objects.filter(
+            user=user,
+            subscription_active=True
+        ).first()
+        
+        if not subscription or not subscription.subscription_created_at:
             return {
-                'plan_type': f'Error: {str(e)}',
+                'plan_type': 'No subscription',
                 'start_date': 'N/A',
                 'days_active': 0,
                 'period': 0
-            }
\ No newline at end of file
+            }
+        
+        days_active = (timezone.now() - subscription.subscription_created_at).days
+        
+        return {
+            'plan_type': 'Yearly' if subscription.billing_interval == 'year' else 'Monthly',
+            'start_date': subscription.subscription_created_at.strftime('%Y-%m-%d'),
+            'days_active': days_active,
+            'period': min(days_active // 30, 11)
+        }
@@ -1,6 +1,7 @@
 # usage_limits/redis_client.py
 import redis
 import logging
+import time
 from django.conf import settings
 
 logger = logging.getLogger(__name__)
@@ -52,4 +53,55 @@ class DummyRedisClient:
         pass
 
     def ttl(self, *args, **kwargs):
-        return 0
\ No newline at end of file
+        return 0
+
+
+class KeyScanner:
+    """
+    Walk keys matching a pattern with SCAN - unlike KEYS it never blocks the
+    server (shared with the Celery broker and cache) for more than one small
+    step. Stops at a deadline and, with a cursor_key, picks up where it left
+    off on the next run.
+    """
+    
+    CURSOR_TTL = 2 * 24 * 60 * 60
+    
+    def __init__(self, redis_client, match, count=500, cursor_key=None):
+        self.redis_client = redis_client
+        self.match = match
+        self.count = count
+        self.cursor_key = cursor_key
+        self.finished = False
+    
+    def batches(self, deadline=None):
+        """
+        Yield lists of keys until the keyspace is covered or time.monotonic()
+        passes deadline.
+        
+        The cursor is saved only once the consumer has handled a batch and
+        asks for the next one - if processing raises, the next run starts
+        at that batch again rather than skipping it.
+        """
+        cursor = 0
+        if self.cursor_key:
+            cursor = int(self.redis_client.get(self.cursor_key) or 0)
+        
+        while True:
+            next_cursor, keys = self.redis_client.scan(cursor=cursor, match=self.match, count=self.count)
+            if keys:
+                yield keys
+            cursor = next_cursor
+            self._save_cursor(cursor)
+            if not cursor:
+                self.finished = True
+                return
+            if deadline is not None and time.monotonic() >= deadline:
+                return
+    
+    def _save_cursor(self, cursor):
+        if not self.cursor_key:
+            return
+        if cursor:
+            self.redis_client.set(self.cursor_key, cursor, ex=self.CURSOR_TTL)
+        else:
+            self.redis_client.delete(self.cursor_key)
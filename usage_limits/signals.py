@@ -0,0 +1,34 @@
+# usage_limits/signals.py - Keep UsageTracker's cached plans in step with billing data
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+import logging
+
+from subscriptions.models import CustomerSubscription, Price, Product
+
+from .usage_tracker import UsageTracker
+
+logger = logging.getLogger(__name__)
+
+
+@receiver([post_save, post_delete], sender=CustomerSubscription)
+def invalidate_subscriber_plan(sender, instance, **kwargs):
+    """Stripe webhooks save the subscription on every plan/status change"""
+    UsageTracker.invalidate_user_limit(instance.user_id)
+
+
+@receiver([post_save, post_delete], sender=Price)
+def invalidate_price_subscribers(sender, instance, **kwargs):
+    """A price may be re-pointed at a product with a different token allowance"""
+    count = UsageTracker.invalidate_limits_for_plans([instance.stripe_id])
+    if count:
+        logger.info(f"Price {instance.stripe_id} changed - dropped cached plans for {count} subscriber(s)")
+
+
+@receiver(post_save, sender=Product)
+def invalidate_product_subscribers(sender, instance, **kwargs):
+    """Token allowance lives on the product, shared by all of its prices"""
+    plan_ids = list(instance.prices.values_list('stripe_id', flat=True))
+    count = UsageTracker.invalidate_limits_for_plans(plan_ids) if plan_ids else 0
+    if count:
+        logger.info(f"Product {instance.stripe_id} changed - dropped cached plans for {count} subscriber(s)")
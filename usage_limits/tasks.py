@@ -4,9 +4,9 @@ from celery import shared_task
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 from django.conf import settings
-from datetime import datetime
 import stripe
 import logging
+import time
 
 from subscriptions.models import CustomerSubscription
 from .usage_tracker import UsageTracker
@@ -19,62 +19,48 @@ def process_automatic_yearly_resets(self):
     """
     Automatic daily task to check and reset yearly subscribers who are eligible.
     This replaces manual commands with full automation.
-    """
-    stripe.api_key = settings.STRIPE_SECRET_KEY
     
+    Runs entirely off the local billing mirror on CustomerSubscription (kept
+    current by the Stripe webhooks): one indexed query plus Redis pipelines.
+    Stripe is only called for subscriptions the mirror doesn't cover yet.
+    """
     try:
         # Get all active yearly subscriptions
         yearly_subscribers = get_yearly_subscribers()
         
-        eligible_users = []
-        reset_count = 0
-        error_count = 0
-        
         logger.info(f"Checking {len(yearly_subscribers)} yearly subscribers for resets")
         
-        for user_data in yearly_subscribers:
-            user = user_data['user']
-            
-            try:
-                # Check if eligible for reset
-                eligible, reason = UsageTracker.check_yearly_reset_eligible(user)
-                
-                if eligible:
-                    eligible_users.append(user_data)
-                    
-                    # Perform the reset
-                    if UsageTracker.reset_usage(user):
-                        # Mark reset as completed
-                        period = user_data['period']
-                        UsageTracker.mark_yearly_reset_complete(user, period)
-                        
-                        reset_count += 1
-                        logger.info(
-                            f"Auto-reset successful: {user.username} "
-                            f"(period {period}/11, was: {user_data['current_usage']}/{user_data['limit']})"
-                        )
-                    else:
-                        error_count += 1
-                        logger.error(f"Failed to reset usage for {user.username}")
-                else:
-                    logger.debug(f"User {user.username} not eligible: {reason}")
-                    
-            except Exception as e:
-                error_count += 1
-                logger.error(f"Error processing yearly reset for {user.username}: {str(e)}")
+        # Nothing to reset in the first 30 days
+        candidates = {
+            user_data['user'].id: user_data
+            for user_data in yearly_subscribers
+            if user_data['days_since_start'] >= 30
+        }
+        
+        # Skip anyone already reset this period, then reset the rest together
+        pending = UsageTracker.get_pending_yearly_resets(
+            (user_id, user_data['period']) for user_id, user_data in candidates.items()
+        )
+        reset_count = UsageTracker.apply_yearly_resets(pending)
+        
+        for user_id, period in pending:
+            user_data = candidates[user_id]
+            logger.info(
+                f"Auto-reset successful: {user_data['user'].username} "
+                f"(period {period}/11, was: {user_data['current_usage']}/{user_data['limit']})"
+            )
         
         # Log summary
         logger.info(
             f"Yearly reset automation completed: "
-            f"{reset_count} resets performed, {error_count} errors, "
-            f"{len(eligible_users)} eligible users found"
+            f"{reset_count} resets performed, {len(pending)} eligible users found"
         )
         
         return {
             'success': True,
             'reset_count': reset_count,
-            'eligible_count': len(eligible_users),
-            'error_count': error_count,
+            'eligible_count': len(pending),
+            'error_count': 0,
             'total_yearly_subscribers': len(yearly_subscribers)
         }
         
@@ -119,137 +105,135 @@ def reset_single_user(self, user_id):
             'error': str(e)
         }
 
-def get_yearly_subscribers():
+def sync_unmirrored_subscriptions():
     """
-    FIXED: Get all active yearly subscribers without the items() method conflict.
+    Fill in the billing mirror from Stripe for active subscriptions that
+    predate it (or missed their webhook), so they aren't skipped by resets.
+    Each row is fetched once; after that it's read from the mirror.
+    
+    Returns:
+        list: the synced subscriptions that turned out to be yearly
     """
-    subscriptions = CustomerSubscription.objects.filter(
+    unmirrored = CustomerSubscription.objects.filter(
         subscription_active=True,
+        billing_interval__isnull=True,
         stripe_subscription_id__isnull=False
-    ).select_related('user')
+    ).exclude(stripe_subscription_id='').select_related('user')
     
-    yearly_subscribers = []
-    
-    for subscription in subscriptions:
-        if not subscription.user:
-            continue
-        
+    yearly = []
+    for subscription in unmirrored.iterator():
         try:
-            # FIXED: Use safe method to check if subscription is yearly
-            is_yearly = check_subscription_yearly_safe(subscription.stripe_subscription_id)
-            
-            if not is_yearly:
-                logger.debug(f"User {subscription.user.username} not yearly")
-                continue
-            
-            # Get subscription start date
-            stripe_sub = stripe.Subscription.retrieve(subscription.stripe_subscription_id)
-            
-            # Calculate subscription periods
-            start_date = datetime.fromtimestamp(stripe_sub.created)
-            start_date = timezone.make_aware(start_date)
-            now = timezone.now()
-            days_since_start = (now - start_date).days
-            
-            # Period 1-11 (11 resets after initial purchase)
-            period = min(days_since_start // 30, 11)
-            
-            # Get current usage data
-            usage_data = UsageTracker.get_usage_data(subscription.user)
-            
-            yearly_subscribers.append({
-                'user': subscription.user,
-                'subscription': subscription,
-                'start_date': start_date,
-                'days_since_start': days_since_start,
-                'period': period,
-                'current_usage': usage_data['current'],
-                'limit': usage_data['limit'],
-                'stripe_sub_id': subscription.stripe_subscription_id
-            })
-            
-            logger.info(f"Found yearly subscriber: {subscription.user.username} (period {period})")
-            
+            stripe.api_key = settings.STRIPE_SECRET_KEY
+            stripe_sub = stripe.Subscription.retrieve(
+                subscription.stripe_subscription_id,
+                expand=['items.data.price']
+            )
+            subscription.sync_billing_from_stripe(stripe_sub)
+            subscription.save(update_fields=[
+                'billing_interval', 'subscription_created_at',
+                'current_period_start', 'current_period_end', 'updated_at'
+            ])
         except Exception as e:
-            logger.error(f"Error processing subscription for {subscription.user.username}: {str(e)}")
+            logger.error(f"Could not sync billing from Stripe for user {subscription.user_id}: {str(e)}")
             continue
+        
+        logger.warning(
+            f"Subscription for user {subscription.user_id} had no billing mirror - "
+            f"synced from Stripe ({subscription.billing_interval or 'unknown'} interval)"
+        )
+        if subscription.billing_interval == 'year' and subscription.subscription_created_at:
+            yearly.append(subscription)
     
-    return yearly_subscribers
+    return yearly
+
 
-def check_subscription_yearly_safe(stripe_subscription_id):
+def get_yearly_subscribers():
     """
-    FIXED: Safely check if a subscription is yearly without the items() method conflict.
+    All active yearly subscribers with their reset period and usage, from
+    the local billing mirror. Stripe is only called for rows the mirror
+    doesn't cover yet (see sync_unmirrored_subscriptions).
     """
-    try:
-        # Method 1: Use separate SubscriptionItem.list call (most reliable)
-        try:
-            items = stripe.SubscriptionItem.list(
-                subscription=stripe_subscription_id,
-                expand=['data.price']
-            )
-            
-            if items.data:
-                item = items.data[0]
-                if hasattr(item.price, 'recurring') and item.price.recurring:
-                    interval = item.price.recurring.interval
-                    logger.debug(f"Subscription {stripe_subscription_id} interval: {interval}")
-                    return interval == 'year'
-            
-        except Exception as e:
-            logger.debug(f"SubscriptionItem.list failed for {stripe_subscription_id}: {str(e)}")
-        
-        # Method 2: Use bracket notation to avoid items() method conflict
-        try:
-            stripe_sub = stripe.Subscription.retrieve(stripe_subscription_id)
-            items_data = stripe_sub['items']['data']  # FIXED: Use bracket notation instead of .items.data
-            
-            if items_data:
-                item = items_data[0]
-                if 'price' in item and 'recurring' in item['price']:
-                    interval = item['price']['recurring']['interval']
-                    logger.debug(f"Subscription {stripe_subscription_id} interval (bracket): {interval}")
-                    return interval == 'year'
-            
-        except Exception as e:
-            logger.debug(f"Bracket notation failed for {stripe_subscription_id}: {str(e)}")
-        
-        # All methods failed
-        return False
+    subscriptions = list(CustomerSubscription.objects.filter(
+        billing_interval='year',
+        subscription_active=True,
+        subscription_created_at__isnull=False
+    ).select_related('user'))
+    subscriptions.extend(sync_unmirrored_subscriptions())
+    
+    # Current usage for everyone in one Redis round trip
+    usage_data = UsageTracker.get_usage_data_many(subscription.user for subscription in subscriptions)
+    
+    now = timezone.now()
+    yearly_subscribers = []
+    
+    for subscription in subscriptions:
+        days_since_start, period = subscription.get_yearly_reset_period(now)
+        user_usage = usage_data[subscription.user_id]
         
-    except Exception as e:
-        logger.error(f"All methods failed for subscription {stripe_subscription_id}: {str(e)}")
-        return False
+        yearly_subscribers.append({
+            'user': subscription.user,
+            'subscription': subscription,
+            'start_date': subscription.subscription_created_at,
+            'days_since_start': days_since_start,
+            'period': period,
+            'current_usage': user_usage['current'],
+            'limit': user_usage['limit'],
+            'stripe_sub_id': subscription.stripe_subscription_id
+        })
+    
+    return yearly_subscribers
+
+
+# Housekeeping walks the keyspace with SCAN in steps of this many keys and
+# stops after CLEANUP_TIME_BUDGET seconds, resuming on the next run
+CLEANUP_SCAN_COUNT = 500
+CLEANUP_TIME_BUDGET = 30
+YEARLY_RESET_KEY_TTL = 40 * 24 * 60 * 60
 
 
 @shared_task(bind=True)
-def cleanup_usage_system(self):
+def cleanup_usage_system(self, time_budget=CLEANUP_TIME_BUDGET):
     """
     Daily cleanup task to maintain Redis health and clear old data.
     """
     try:
-        from .redis_client import RedisClient
+        from .redis_client import KeyScanner, RedisClient
         redis_client = RedisClient.get_client()
+        deadline = time.monotonic() + time_budget
         
-        # Clean up expired yearly reset keys (older than 40 days)
-        pattern = "yearly_reset:*"
-        keys = redis_client.keys(pattern)
-        
+        # Cap yearly reset markers at 40 days
+        yearly_scanner = KeyScanner(
+            redis_client, 'yearly_reset:*', count=CLEANUP_SCAN_COUNT,
+            cursor_key='usage_cleanup:cursor:yearly_reset'
+        )
+        keys_processed = 0
         cleaned_keys = 0
-        for key in keys:
-            ttl = redis_client.ttl(key)
-            if ttl < 0:  # No expiry set
-                # Set expiry for 40 days
-                redis_client.expire(key, 40 * 24 * 60 * 60)
-            elif ttl > 40 * 24 * 60 * 60:  # More than 40 days
-                redis_client.expire(key, 40 * 24 * 60 * 60)
-                cleaned_keys += 1
+        for keys in yearly_scanner.batches(deadline):
+            keys_processed += len(keys)
+            cleaned_keys += cap_key_ttls(redis_client, keys, YEARLY_RESET_KEY_TTL)
         
-        logger.info(f"Usage cleanup completed: processed {len(keys)} keys, cleaned {cleaned_keys}")
+        # Usage counters (and their reservations/cached plans) for deleted users
+        usage_scanner = KeyScanner(
+            redis_client, 'usage:*', count=CLEANUP_SCAN_COUNT,
+            cursor_key='usage_cleanup:cursor:usage'
+        )
+        orphaned_keys = 0
+        for keys in usage_scanner.batches(deadline):
+            keys_processed += len(keys)
+            orphaned_keys += delete_orphaned_usage_keys(redis_client, keys)
+        
+        finished = yearly_scanner.finished and usage_scanner.finished
+        logger.info(
+            f"Usage cleanup {'completed' if finished else 'paused (time budget reached)'}: "
+            f"processed {keys_processed} keys, cleaned {cleaned_keys}, removed {orphaned_keys} orphaned"
+        )
         
         return {
             'success': True,
-            'keys_processed': len(keys),
-            'keys_cleaned': cleaned_keys
+            'finished': finished,
+            'keys_processed': keys_processed,
+            'keys_cleaned': cleaned_keys,
+            'orphaned_keys_removed': orphaned_keys
         }
         
     except Exception as e:
@@ -257,4 +241,49 @@ def cleanup_usage_system(self):
         return {
             'success': False,
             'error': str(e)
-        }
\ No newline at end of file
+        }
+
+
+def cap_key_ttls(redis_client, keys, max_ttl):
+    """Give keys without an expiry (or a longer one) max_ttl - two pipelined round trips"""
+    pipe = redis_client.pipeline(transaction=False)
+    for key in keys:
+        pipe.ttl(key)
+    ttls = pipe.execute()
+    
+    capped = 0
+    pipe = redis_client.pipeline(transaction=False)
+    for key, ttl in zip(keys, ttls):
+        if ttl == -1 or ttl > max_ttl:
+            pipe.expire(key, max_ttl)
+            capped += 1
+    if capped:
+        pipe.execute()
+    return capped
+
+
+def delete_orphaned_usage_keys(redis_client, keys):
+    """Delete usage keys whose user no longer exists - one query per batch"""
+    key_user_ids = {}
+    for key in keys:
+        try:
+            key_user_ids[key] = int(key.split(':', 1)[1])
+        except (IndexError, ValueError):
+            continue
+    
+    existing = set(User.objects.filter(id__in=set(key_user_ids.values())).values_list('id', flat=True))
+    orphaned_ids = {user_id for user_id in key_user_ids.values() if user_id not in existing}
+    if not orphaned_ids:
+        return 0
+    
+    stale_keys = []
+    for user_id in orphaned_ids:
+        stale_keys.extend([
+            UsageTracker._get_usage_key(user_id),
+            UsageTracker._get_reservations_key(user_id),
+            UsageTracker._get_plan_key(user_id),
+        ])
+    redis_client.delete(*stale_keys)
+    
+    logger.info(f"Removed usage keys for {len(orphaned_ids)} deleted user(s)")
+    return len(orphaned_ids)
@@ -1,3 +1,88 @@
-from django.test import TestCase
+import fakeredis
+import pytest
 
-# Create your tests here.
+from saas_base.users.tests.factories import UserFactory
+from usage_limits.redis_client import RedisClient
+from usage_limits.usage_tracker import UsageTracker
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def redis_client(monkeypatch):
+    """In-memory Redis (with Lua) in place of the shared client"""
+    client = fakeredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(RedisClient, "_instance", client)
+    return client
+
+
+@pytest.fixture
+def limited_user(redis_client):
+    """A user whose cached plan allows 5 credits"""
+    user = UserFactory()
+    redis_client.set(UsageTracker._get_plan_key(user.id), UsageTracker._encode_plan(5, "active"))
+    return user
+
+
+def test_reserve_holds_credits_until_committed(limited_user):
+    reservation_id = UsageTracker.reserve_usage(limited_user, 3)
+
+    assert reservation_id
+    assert UsageTracker.get_reserved_usage(limited_user) == 3
+    assert UsageTracker.get_current_usage(limited_user) == 0
+
+
+def test_reserve_refuses_past_limit_counting_held_credits(limited_user):
+    assert UsageTracker.reserve_usage(limited_user, 3)
+
+    assert UsageTracker.reserve_usage(limited_user, 3) is None
+    assert UsageTracker.get_reserved_usage(limited_user) == 3
+
+
+def test_reserve_many_is_all_or_nothing(limited_user):
+    assert UsageTracker.reserve_usage_many(limited_user, [2, 2, 2]) is None
+    assert UsageTracker.get_reserved_usage(limited_user) == 0
+
+    reservation_ids = UsageTracker.reserve_usage_many(limited_user, [2, 3])
+    assert len(reservation_ids) == 2
+    assert UsageTracker.get_reserved_usage(limited_user) == 5
+
+
+def test_commit_charges_delivered_count_and_drops_reservation(limited_user):
+    reservation_id = UsageTracker.reserve_usage(limited_user, 3)
+
+    assert UsageTracker.commit_usage(limited_user, reservation_id, 2)
+    assert UsageTracker.get_current_usage(limited_user) == 2
+    assert UsageTracker.get_reserved_usage(limited_user) == 0
+
+
+def test_commit_defaults_to_reserved_amount(limited_user):
+    reservation_id = UsageTracker.reserve_usage(limited_user, 3)
+
+    assert UsageTracker.commit_usage(limited_user, reservation_id)
+    assert UsageTracker.get_current_usage(limited_user) == 3
+
+
+def test_release_gives_credits_back(limited_user):
+    reservation_id = UsageTracker.reserve_usage(limited_user, 4)
+
+    assert UsageTracker.release_usage(limited_user.id, reservation_id)
+    assert UsageTracker.get_reserved_usage(limited_user) == 0
+    assert UsageTracker.get_current_usage(limited_user) == 0
+    assert UsageTracker.reserve_usage(limited_user, 5)
+
+
+def test_release_after_commit_is_a_no_op(limited_user):
+    reservation_id = UsageTracker.reserve_usage(limited_user, 2)
+    UsageTracker.commit_usage(limited_user, reservation_id, 2)
+
+    assert not UsageTracker.release_usage(limited_user.id, reservation_id)
+    assert UsageTracker.get_current_usage(limited_user) == 2
+
+
+def test_expired_reservation_no_longer_holds_credits(limited_user, redis_client):
+    reservation_id = UsageTracker.reserve_usage(limited_user, 5)
+    redis_client.hset(UsageTracker._get_reservations_key(limited_user.id), reservation_id, "5:1")
+
+    assert UsageTracker.get_reserved_usage(limited_user) == 0
+    assert UsageTracker.reserve_usage(limited_user, 5)
@@ -55,6 +55,20 @@ class TierLimits:
         except Exception:
             return cls.TIERS['free']['monthly_limit']
 
+    @classmethod
+    def get_user_tier(cls, user):
+        """Get the tier name for a user ('free' without an active subscription)"""
+        if not user or not user.is_authenticated:
+            return 'free'
+        
+        try:
+            subscription = getattr(user, 'subscription', None)
+            if not subscription or not subscription.subscription_active:
+                return 'free'
+            return cls.get_tier_from_price_id(subscription.plan_id)
+        except Exception:
+            return 'free'
+
     @classmethod
     def get_tier_from_price_id(cls, price_id):
         """Get the tier name from a Stripe price ID"""
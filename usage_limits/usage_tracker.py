@@ -1,15 +1,107 @@
-# usage_limits/usage_tracker.py - Simplified without batch processing or reservations
+# usage_limits/usage_tracker.py - Atomic usage counting with quota reservations
 
 import logging
-from datetime import datetime, timedelta
+import time
+import uuid
+from datetime import timedelta
 from django.utils import timezone
 
 from .redis_client import RedisClient
 
 logger = logging.getLogger(__name__)
 
+# How long a user's resolved plan (limit + subscription type) stays cached in
+# Redis. Subscription, Product and Price changes invalidate it explicitly
+# (see signals.py), so this only bounds staleness from missed invalidations.
+PLAN_CACHE_TTL = 60 * 60
+
+FREE_TIER_LIMIT = 3
+
+# Reservations not committed or released within this window are dropped,
+# so a crashed worker can't hold quota forever. Must outlast a job's retries.
+RESERVATION_TTL = 2 * 60 * 60
+
+# Shared by the quota scripts: read the limit from the cached plan
+# ("limit:subscription_type"), or cache the plan passed by the caller.
+# Returns nil when neither is available so the caller can resolve the plan
+# (DB) and call again.
+_LIMIT_PRELUDE = """
+local plan = redis.call('GET', KEYS[3])
+if not plan then
+    if ARGV[1] == '' then
+        return nil
+    end
+    plan = ARGV[1]
+    redis.call('SET', KEYS[3], plan, 'EX', ARGV[2])
+end
+local limit = tonumber(string.match(plan, '^(%d+)'))
+"""
+
+# Live reservations (dropping expired ones) - values are "count:expires_at"
+_RESERVED_PRELUDE = """
+local now = tonumber(redis.call('TIME')[1])
+local reserved = 0
+local entries = redis.call('HGETALL', KEYS[2])
+for i = 1, #entries, 2 do
+    local count, expires = string.match(entries[i + 1], '(%d+):(%d+)')
+    if tonumber(expires) <= now then
+        redis.call('HDEL', KEYS[2], entries[i])
+    else
+        reserved = reserved + tonumber(count)
+    end
+end
+"""
+
+# KEYS: usage, reservations, plan. ARGV: fallback_plan, plan_ttl, count
+# Returns {1, new_usage} or {0, current_usage} when over the limit.
+INCREMENT_SCRIPT = _LIMIT_PRELUDE + """
+local used = tonumber(redis.call('GET', KEYS[1]) or '0')
+local count = tonumber(ARGV[3])
+if used + count > limit then
+    return {0, used}
+end
+return {1, redis.call('INCRBY', KEYS[1], count)}
+"""
+
+# KEYS: usage, reservations, plan
+# ARGV: fallback_plan, plan_ttl, reservation_ttl, id1, count1, id2, count2...
+# All or nothing. Returns {1, remaining} or {0, remaining} when over the limit.
+RESERVE_SCRIPT = _LIMIT_PRELUDE + _RESERVED_PRELUDE + """
+local used = tonumber(redis.call('GET', KEYS[1]) or '0')
+local ttl = tonumber(ARGV[3])
+local requested = 0
+for i = 5, #ARGV, 2 do
+    requested = requested + tonumber(ARGV[i])
+end
+if used + reserved + requested > limit then
+    return {0, limit - used - reserved}
+end
+for i = 4, #ARGV, 2 do
+    redis.call('HSET', KEYS[2], ARGV[i], ARGV[i + 1] .. ':' .. (now + ttl))
+end
+redis.call('EXPIRE', KEYS[2], ttl)
+return {1, limit - used - reserved - requested}
+"""
+
+# KEYS: usage, reservations. ARGV: reservation_id, count ('' = amount reserved)
+# Charges the usage and drops the reservation. Returns the amount charged,
+# or -1 if the reservation no longer exists.
+COMMIT_SCRIPT = """
+local entry = redis.call('HGET', KEYS[2], ARGV[1])
+if not entry then
+    return -1
+end
+local count = tonumber(ARGV[2]) or tonumber(string.match(entry, '(%d+):'))
+redis.call('HDEL', KEYS[2], ARGV[1])
+redis.call('INCRBY', KEYS[1], count)
+return count
+"""
+
+
 class UsageTracker:
-    """Simple usage tracker for individual processing"""
+    """Usage tracker - atomic increments plus reserve/commit/release for queued jobs"""
+    
+    _scripts = {}
     
     @classmethod
     def _get_usage_key(cls, user_id):
@@ -21,67 +113,269 @@ class UsageTracker:
         """Get Redis key for yearly reset tracking"""
         return f"yearly_reset:{user_id}:{period}"
     
+    @classmethod
+    def _get_reservations_key(cls, user_id):
+        """Get Redis key for user's outstanding quota reservations"""
+        return f"usage_reservations:{user_id}"
+    
+    @classmethod
+    def _get_plan_key(cls, user_id):
+        """Get Redis key for user's cached plan ("limit:subscription_type")"""
+        return f"usage_plan:{user_id}"
+    
+    @classmethod
+    def _script(cls, redis_client, source):
+        script = cls._scripts.get(source)
+        if script is None or script.registered_client is not redis_client:
+            script = redis_client.register_script(source)
+            cls._scripts[source] = script
+        return script
+    
+    @classmethod
+    def _run_quota_script(cls, source, user, args):
+        """
+        Run a quota script in one round trip against the cached plan. Only
+        on a cache miss is the plan resolved from the database and passed
+        in for the script to cache.
+        """
+        redis_client = RedisClient.get_client()
+        script = cls._script(redis_client, source)
+        keys = [
+            cls._get_usage_key(user.id),
+            cls._get_reservations_key(user.id),
+            cls._get_plan_key(user.id),
+        ]
+        
+        result = script(keys=keys, args=['', PLAN_CACHE_TTL] + list(args))
+        if result is None:
+            plan = cls._encode_plan(*cls._resolve_plan(user.id))
+            result = script(keys=keys, args=[plan, PLAN_CACHE_TTL] + list(args))
+        return result
+    
+    @staticmethod
+    def _encode_plan(limit, subscription_type):
+        return f"{limit}:{subscription_type}"
+    
+    @staticmethod
+    def _decode_plan(plan):
+        limit, _, subscription_type = plan.partition(':')
+        return int(limit), subscription_type or 'free'
+    
+    @classmethod
+    def invalidate_user_limit(cls, *user_ids):
+        """Drop cached plans so the next check re-reads the subscription"""
+        if not user_ids:
+            return
+        
+        try:
+            RedisClient.get_client().delete(*[cls._get_plan_key(user_id) for user_id in user_ids])
+        except Exception as e:
+            logger.error(f"Error invalidating cached limits for users {list(user_ids)}: {str(e)}")
+    
+    @classmethod
+    def invalidate_limits_for_plans(cls, plan_ids):
+        """Drop cached plans for every subscriber on these Stripe price IDs"""
+        from subscriptions.models import CustomerSubscription
+        
+        user_ids = list(
+            CustomerSubscription.objects.filter(plan_id__in=list(plan_ids)).values_list('user_id', flat=True)
+        )
+        cls.invalidate_user_limit(*user_ids)
+        return len(user_ids)
+    
     @classmethod
     def _get_user_subscription(cls, user_id):
         """Get user subscription safely"""
         try:
-            from django.contrib.auth import get_user_model
             from subscriptions.models import CustomerSubscription
-            User = get_user_model()
             
-            user = User.objects.get(id=user_id)
             return CustomerSubscription.objects.filter(
-                user=user, 
+                user_id=user_id,
                 subscription_active=True
             ).first()
         except Exception:
             return None
     
+    @classmethod
+    def _resolve_plan(cls, user_id):
+        """
+        Work out (monthly limit, subscription type) from the database -
+        callers should go through the cache in get_user_plan.
+        """
+        return cls._resolve_plans([user_id])[user_id]
+    
+    @classmethod
+    def _resolve_plans(cls, user_ids):
+        """(monthly limit, subscription type) per user, in one subscription + price query"""
+        plans = {user_id: (FREE_TIER_LIMIT, 'free') for user_id in user_ids}
+        if not plans:
+            return plans
+        
+        try:
+            from django.db.models import OuterRef, Subquery
+            from subscriptions.models import CustomerSubscription, Price
+            from .tier_config import TierLimits
+            
+            subscriptions = CustomerSubscription.objects.filter(
+                user_id__in=user_ids,
+                subscription_active=True
+            ).annotate(
+                product_tokens=Subquery(
+                    Price.objects.filter(stripe_id=OuterRef('plan_id')).values('product__tokens')[:1]
+                )
+            ).values_list('user_id', 'plan_id', 'product_tokens')
+            
+            for user_id, plan_id, product_tokens in subscriptions:
+                # Product tokens first, then tier-based limits
+                if product_tokens and product_tokens > 0:
+                    limit = product_tokens
+                else:
+                    limit = TierLimits.get_limit_for_tier(TierLimits.get_tier_from_price_id(plan_id))
+                plans[user_id] = (limit, 'active')
+                
+        except Exception as e:
+            logger.error(f"Error determining limits for users {list(user_ids)}: {str(e)}")
+        
+        return plans
+    
+    @classmethod
+    def get_user_plan(cls, user):
+        """(monthly limit, subscription type) for a user, from the Redis cache when possible"""
+        try:
+            redis_client = RedisClient.get_client()
+            plan = redis_client.get(cls._get_plan_key(user.id))
+            if plan:
+                return cls._decode_plan(plan)
+        except Exception as e:
+            logger.error(f"Error reading cached plan for user {user.id}: {str(e)}")
+            return cls._resolve_plan(user.id)
+        
+        limit, subscription_type = cls._resolve_plan(user.id)
+        try:
+            redis_client.set(cls._get_plan_key(user.id), cls._encode_plan(limit, subscription_type), ex=PLAN_CACHE_TTL)
+        except Exception as e:
+            logger.error(f"Error caching plan for user {user.id}: {str(e)}")
+        return limit, subscription_type
+    
     @classmethod
     def increment_usage(cls, user, count=1):
-        """Simple atomic increment for individual processing"""
+        """Atomic check-and-increment against the cached limit (one round trip)"""
         if not user or not user.is_authenticated:
             return False
         
-        redis_client = RedisClient.get_client()
-        usage_key = cls._get_usage_key(user.id)
-        
         try:
-            # Atomic check-and-increment
-            with redis_client.pipeline() as pipe:
-                while True:
-                    try:
-                        pipe.watch(usage_key)
-                        
-                        # Get current values
-                        current_usage = int(pipe.get(usage_key) or 0)
-                        user_limit = cls.get_user_limit(user)
-                        
-                        # Check if increment would exceed limit
-                        if current_usage + count > user_limit:
-                            pipe.unwatch()
-                            logger.warning(f"Usage limit exceeded for user {user.id}: {current_usage + count} > {user_limit}")
-                            return False
-                        
-                        # Execute atomic increment
-                        pipe.multi()
-                        pipe.incrby(usage_key, count)
-                        # No expiry - tokens don't auto-reset
-                        
-                        pipe.execute()
-                        
-                        logger.info(f"Usage incremented for user {user.id}: +{count} (total: {current_usage + count}/{user_limit})")
-                        return True
-                        
-                    except redis_client.WatchError:
-                        # Key was modified during transaction, retry
-                        logger.debug(f"Redis watch error for user {user.id}, retrying")
-                        continue
-                        
+            allowed, usage = cls._run_quota_script(INCREMENT_SCRIPT, user, [count])
+            
+            if not allowed:
+                logger.warning(f"Usage limit exceeded for user {user.id}: {usage} + {count} over limit")
+                return False
+            
+            logger.info(f"Usage incremented for user {user.id}: +{count} (total: {usage})")
+            return True
+            
         except Exception as e:
             logger.error(f"Error incrementing usage for user {user.id}: {str(e)}")
             return False
     
+    @classmethod
+    def reserve_usage(cls, user, count=1):
+        """
+        Hold `count` credits for a queued job until it is committed or released.
+        
+        Returns:
+            str or None: Reservation ID, None if it would exceed the limit, or
+            '' if Redis is unavailable (untracked - commit falls back to
+            increment_usage)
+        """
+        reservation_ids = cls.reserve_usage_many(user, [count])
+        return reservation_ids[0] if reservation_ids else reservation_ids
+    
+    @classmethod
+    def reserve_usage_many(cls, user, counts):
+        """
+        Reserve credits for several jobs at once - all or nothing.
+        
+        Returns:
+            list or None: One reservation ID per count, None if the total
+            would exceed the limit, or [''] * len(counts) if Redis is unavailable
+        """
+        if not user or not user.is_authenticated:
+            return None
+        
+        reservation_ids = [uuid.uuid4().hex for _ in counts]
+        args = [RESERVATION_TTL]
+        for reservation_id, count in zip(reservation_ids, counts):
+            args.extend([reservation_id, count])
+        
+        try:
+            reserved, remaining = cls._run_quota_script(RESERVE_SCRIPT, user, args)
+        except Exception as e:
+            logger.error(f"Error reserving usage for user {user.id}: {str(e)}")
+            return [''] * len(counts)
+        
+        if not reserved:
+            logger.warning(f"Reservation of {sum(counts)} refused for user {user.id} ({remaining} remaining)")
+            return None
+        
+        logger.info(f"Reserved {sum(counts)} credit(s) for user {user.id} across {len(counts)} job(s) ({remaining} remaining)")
+        return reservation_ids
+    
+    @classmethod
+    def commit_usage(cls, user, reservation_id, count=None):
+        """
+        Charge a reservation - `count` credits (what was actually delivered)
+        or the full reserved amount - and drop it.
+        
+        Falls back to increment_usage if the reservation is untracked or
+        has expired.
+        """
+        if not user or not user.is_authenticated:
+            return False
+        
+        if reservation_id:
+            try:
+                redis_client = RedisClient.get_client()
+                charged = cls._script(redis_client, COMMIT_SCRIPT)(
+                    keys=[cls._get_usage_key(user.id), cls._get_reservations_key(user.id)],
+                    args=[reservation_id, '' if count is None else count],
+                )
+                if int(charged) >= 0:
+                    logger.info(f"Committed reservation {reservation_id} for user {user.id}: +{charged}")
+                    return True
+                logger.warning(f"Reservation {reservation_id} for user {user.id} expired, charging directly")
+            except Exception as e:
+                logger.error(f"Error committing reservation {reservation_id} for user {user.id}: {str(e)}")
+                return False
+        
+        return cls.increment_usage(user, count or 1)
+    
+    @classmethod
+    def release_usage(cls, user_id, reservation_id):
+        """Give a reservation's credits back (job failed or was never queued)"""
+        if not reservation_id:
+            return False
+        
+        try:
+            released = RedisClient.get_client().hdel(cls._get_reservations_key(user_id), reservation_id)
+            if released:
+                logger.info(f"Released reservation {reservation_id} for user {user_id}")
+            return bool(released)
+        except Exception as e:
+            logger.error(f"Error releasing reservation {reservation_id} for user {user_id}: {str(e)}")
+            return False
+    
+    @classmethod
+    def get_reserved_usage(cls, user):
+        """Credits currently held by queued jobs"""
+        if not user or not user.is_authenticated:
+            return 0
+        
+        try:
+            return cls._live_reserved(RedisClient.get_client().hvals(cls._get_reservations_key(user.id)))
+        except Exception as e:
+            logger.error(f"Error getting reserved usage for user {user.id}: {str(e)}")
+            return 0
+    
     @classmethod
     def get_current_usage(cls, user):
         """Get current monthly usage"""
@@ -102,70 +396,85 @@ class UsageTracker:
     def get_user_limit(cls, user):
         """Get user's monthly limit based on subscription"""
         if not user or not user.is_authenticated:
-            return 3  # Free tier default - UPDATED from 2 to 3
+            return FREE_TIER_LIMIT
         
-        try:
-            subscription = cls._get_user_subscription(user.id)
-            
-            if not subscription or not subscription.subscription_active:
-                return 3  # Free tier - UPDATED from 2 to 3
-            
-            # Try to get limit from Product model first
-            plan_id = subscription.plan_id
-            if plan_id:
-                try:
-                    from subscriptions.models import Price
-                    price = Price.objects.select_related('product').get(stripe_id=plan_id)
-                    if price.product.tokens > 0:
-                        return price.product.tokens
-                except:
-                    pass
-            
-            # Fallback to tier-based limits
-            from .tier_config import TierLimits
-            tier = TierLimits.get_tier_from_price_id(plan_id)
-            limit = TierLimits.get_limit_for_tier(tier)
-            
-            return limit
-            
-        except Exception as e:
-            logger.error(f"Error determining limit for user {user.id}: {str(e)}")
-            return 3  # UPDATED from 2 to 3
+        return cls.get_user_plan(user)[0]
+    
+    @classmethod
+    def _live_reserved(cls, entries):
+        """Sum reservation values ("count:expires_at"), skipping expired ones"""
+        now = time.time()
+        reserved = 0
+        for entry in entries:
+            count, expires = entry.split(':')
+            if int(expires) > now:
+                reserved += int(count)
+        return reserved
     
     @classmethod
     def get_usage_data(cls, user):
-        """Get simplified usage data without Stripe API calls"""
+        """Usage, limit and plan in one Redis round trip (plus a DB lookup on a cold plan cache)"""
         if not user or not user.is_authenticated:
             return {
                 'current': 0,
-                'limit': 3,  # UPDATED from 2 to 3
-                'remaining': 3,  # UPDATED from 2 to 3
+                'limit': FREE_TIER_LIMIT,
+                'remaining': FREE_TIER_LIMIT,
                 'percentage': 0,
                 'subscription_type': 'free'
             }
         
-        current = cls.get_current_usage(user)
-        limit = cls.get_user_limit(user)
-        remaining = max(0, limit - current)
-        percentage = int((current / limit) * 100) if limit > 0 else 100
-        
-        # Simplified subscription type - no Stripe API call needed
-        subscription_type = 'free'
+        return cls.get_usage_data_many([user])[user.id]
+    
+    @classmethod
+    def get_usage_data_many(cls, users):
+        """
+        get_usage_data for many users at once, keyed by user ID - one
+        pipelined Redis round trip, plus one query for any users whose plan
+        isn't cached (those plans are then cached in a second round trip).
+        """
+        user_ids = list(dict.fromkeys(user.id for user in users))
+        if not user_ids:
+            return {}
         
+        redis_client = RedisClient.get_client()
         try:
-            subscription = cls._get_user_subscription(user.id)
-            if subscription and subscription.subscription_active:
-                subscription_type = 'active'
-        except Exception:
-            pass
+            pipe = redis_client.pipeline(transaction=False)
+            pipe.mget([cls._get_usage_key(user_id) for user_id in user_ids])
+            pipe.mget([cls._get_plan_key(user_id) for user_id in user_ids])
+            for user_id in user_ids:
+                pipe.hvals(cls._get_reservations_key(user_id))
+            results = pipe.execute()
+            usages, plans, reservations = results[0], results[1], results[2:]
+        except Exception as e:
+            logger.error(f"Error getting usage for {len(user_ids)} user(s): {str(e)}")
+            usages, plans, reservations = [None] * len(user_ids), [None] * len(user_ids), [[]] * len(user_ids)
+        
+        resolved = cls._resolve_plans([user_id for user_id, plan in zip(user_ids, plans) if not plan])
+        if resolved:
+            try:
+                pipe = redis_client.pipeline(transaction=False)
+                for user_id, plan in resolved.items():
+                    pipe.set(cls._get_plan_key(user_id), cls._encode_plan(*plan), ex=PLAN_CACHE_TTL)
+                pipe.execute()
+            except Exception as e:
+                logger.error(f"Error caching plans for {len(resolved)} user(s): {str(e)}")
         
-        return {
-            'current': current,
-            'limit': limit,
-            'remaining': remaining,
-            'percentage': percentage,
-            'subscription_type': subscription_type
-        }
+        usage_data = {}
+        for user_id, usage, plan, entries in zip(user_ids, usages, plans, reservations):
+            current = int(usage) if usage else 0
+            limit, subscription_type = resolved[user_id] if user_id in resolved else cls._decode_plan(plan)
+            # Credits held by queued jobs aren't available either
+            remaining = max(0, limit - current - cls._live_reserved(entries))
+            
+            usage_data[user_id] = {
+                'current': current,
+                'limit': limit,
+                'remaining': remaining,
+                'percentage': int((current / limit) * 100) if limit > 0 else 100,
+                'subscription_type': subscription_type
+            }
+        
+        return usage_data
     
     @classmethod
     def reset_usage(cls, user):
@@ -188,43 +497,20 @@ class UsageTracker:
     
     @classmethod
     def check_yearly_reset_eligible(cls, user):
-        """FIXED: Check if yearly subscriber is eligible for reset"""
+        """Check if yearly subscriber is eligible for reset (from the local billing mirror)"""
         try:
             subscription = cls._get_user_subscription(user.id)
             if not subscription or not subscription.subscription_active:
                 return False, "No active subscription"
             
-            if not subscription.stripe_subscription_id:
-                return False, "No Stripe subscription ID"
-            
-            import stripe
-            from django.conf import settings
-            stripe.api_key = settings.STRIPE_SECRET_KEY
-            
-            # Use the FIXED method to check if subscription is yearly
-            is_yearly = cls._check_subscription_yearly_safe(subscription.stripe_subscription_id)
-            
-            if not is_yearly:
+            reset_period = subscription.get_yearly_reset_period()
+            if reset_period is None:
                 return False, "Not a yearly subscription"
             
-            # Get subscription start date
-            stripe_sub = stripe.Subscription.retrieve(subscription.stripe_subscription_id)
-            
-            # Calculate subscription periods (11 resets after initial)
-            start_date = datetime.fromtimestamp(stripe_sub.created)
-            start_date = timezone.make_aware(start_date)
-            now = timezone.now()
-            days_since_start = (now - start_date).days
-            
+            days_since_start, period = reset_period
             if days_since_start < 30:
                 return False, f"Too early - only {days_since_start} days since start"
             
-            # Period 1-11 (11 resets after initial purchase)
-            period = min(days_since_start // 30, 11)
-            
-            if period > 11:
-                return False, "All yearly resets completed (11 resets)"
-            
             # Check if already reset this period
             reset_key = cls._get_yearly_reset_key(user.id, period)
             redis_client = RedisClient.get_client()
@@ -236,50 +522,45 @@ class UsageTracker:
         except Exception as e:
             logger.error(f"Error checking yearly reset eligibility for user {user.id}: {str(e)}")
             return False, f"Error: {str(e)}"
-
+    
     @classmethod
-    def _check_subscription_yearly_safe(cls, stripe_subscription_id):
-        """FIXED: Safely check if subscription is yearly"""
-        try:
-            import stripe
-            from django.conf import settings
-            stripe.api_key = settings.STRIPE_SECRET_KEY
-            
-            # Method 1: Use separate SubscriptionItem.list call (most reliable)
-            try:
-                items = stripe.SubscriptionItem.list(
-                    subscription=stripe_subscription_id,
-                    expand=['data.price']
-                )
-                
-                if items.data:
-                    item = items.data[0]
-                    if hasattr(item.price, 'recurring') and item.price.recurring:
-                        return item.price.recurring.interval == 'year'
-                
-            except Exception as e:
-                logger.debug(f"SubscriptionItem.list failed for {stripe_subscription_id}: {str(e)}")
-            
-            # Method 2: Use bracket notation to avoid items() method conflict
-            try:
-                stripe_sub = stripe.Subscription.retrieve(stripe_subscription_id)
-                items_data = stripe_sub['items']['data']  # FIXED: bracket notation
-                
-                if items_data:
-                    item = items_data[0]
-                    if 'price' in item and 'recurring' in item['price']:
-                        return item['price']['recurring']['interval'] == 'year'
-                
-            except Exception as e:
-                logger.debug(f"Bracket notation failed for {stripe_subscription_id}: {str(e)}")
-            
-            return False
-            
-        except Exception as e:
-            logger.error(f"All methods failed for subscription {stripe_subscription_id}: {str(e)}")
-            return False
-
-
+    def get_pending_yearly_resets(cls, user_periods):
+        """
+        Of (user_id, period) pairs, those not yet reset for that period -
+        one pipelined round trip.
+        """
+        user_periods = list(user_periods)
+        if not user_periods:
+            return []
+        
+        pipe = RedisClient.get_client().pipeline(transaction=False)
+        for user_id, period in user_periods:
+            pipe.exists(cls._get_yearly_reset_key(user_id, period))
+        done = pipe.execute()
+        
+        return [user_period for user_period, already_reset in zip(user_periods, done) if not already_reset]
+    
+    @classmethod
+    def apply_yearly_resets(cls, user_periods):
+        """
+        Reset usage and mark the period complete for each (user_id, period)
+        in one pipelined round trip. Returns the number applied.
+        """
+        user_periods = list(user_periods)
+        if not user_periods:
+            return 0
+        
+        marked_at = timezone.now().isoformat()
+        pipe = RedisClient.get_client().pipeline(transaction=False)
+        for user_id, period in user_periods:
+            pipe.set(cls._get_usage_key(user_id), 0)
+            # Mark for 35 days to prevent duplicate resets
+            pipe.setex(cls._get_yearly_reset_key(user_id, period), 35 * 24 * 60 * 60, marked_at)
+        pipe.execute()
+        
+        logger.info(f"Applied yearly resets for {len(user_periods)} user(s)")
+        return len(user_periods)
+    
     @classmethod
     def mark_yearly_reset_complete(cls, user, period):
         """Mark yearly reset as completed for a period"""
@@ -314,6 +595,8 @@ class UsageTracker:
             
             # Reset to 0
             redis_client.set(usage_key, 0)
+            # The payment may be for a different plan
+            cls.invalidate_user_limit(user.id)
             
             logger.info(
                 f"Payment received - reset usage for user {user.id} "
@@ -354,6 +637,7 @@ class UsageTracker:
             # Reset usage to 0 (giving them a fresh start with free tier)
             redis_client.set(usage_key, 0)
             # No expiry - tokens don't auto-reset
+            cls.invalidate_user_limit(user.id)
             
             logger.warning(
                 f"🔓 Subscription inactive - reset {user.email} to free tier "
@@ -2,6 +2,7 @@
 from django.contrib import admin
 from django.utils.html import format_html
 from django.urls import reverse
+from saas_base.utils.counters import BufferedCounter
 from .models import CoupleProfile, WeddingLink
 
 
@@ -134,6 +135,12 @@ class WeddingLinkAdmin(admin.ModelAdmin):
     def get_queryset(self, request):
         """Optimize queries"""
         return super().get_queryset(request).select_related('couple_profile')
+    
+    def get_changelist_instance(self, request):
+        """Include clicks still buffered in Redis - one lookup for the page"""
+        changelist = super().get_changelist_instance(request)
+        BufferedCounter.merge_pending(changelist.result_list)
+        return changelist
 
 
 # Custom admin site titles
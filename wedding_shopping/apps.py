@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class WeddingShoppingConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'wedding_shopping'
+
+    def ready(self):
+        # Page cache invalidation
+        from . import signals  # noqa: F401
\ No newline at end of file
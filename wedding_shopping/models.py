@@ -6,6 +6,8 @@ from django.utils.text import slugify
 import re
 import urllib.parse
 
+from saas_base.utils.counters import BufferedCounter
+
 User = get_user_model()
 
 
@@ -188,9 +190,11 @@ class WeddingLink(models.Model):
         return f"{self.couple_profile} - {self.title}"
     
     def increment_clicks(self):
-        """Increment click count"""
-        self.click_count += 1
-        self.save(update_fields=['click_count'])
+        """
+        Count a click. Buffered in Redis and flushed to the DB periodically;
+        click_count on this instance includes the not-yet-flushed clicks.
+        """
+        self.click_count += BufferedCounter.increment(self)
     
     @property
     def final_url(self):
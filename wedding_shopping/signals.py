@@ -0,0 +1,30 @@
+# wedding_shopping/signals.py
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from saas_base.utils.page_cache import bump_cache_version
+from .models import CoupleProfile, WeddingLink
+
+
+@receiver(post_save, sender=CoupleProfile)
+@receiver(post_delete, sender=CoupleProfile)
+def invalidate_wedding_pages(sender, raw=False, **kwargs):
+    """Drop cached wedding pages and fragments"""
+    if raw:
+        return
+    bump_cache_version('wedding')
+
+
+@receiver(post_save, sender=WeddingLink)
+@receiver(post_delete, sender=WeddingLink)
+def invalidate_wedding_pages_for_link(sender, instance, raw=False, **kwargs):
+    """
+    Links are part of the couple's page: invalidate the cache and move the
+    profile's updated_at (its Last-Modified) forward. Click counts are
+    flushed with update() and deliberately don't get here.
+    """
+    if raw:
+        return
+    CoupleProfile.objects.filter(pk=instance.couple_profile_id).update(updated_at=timezone.now())
+    bump_cache_version('wedding')
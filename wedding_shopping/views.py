@@ -10,6 +10,9 @@ from django.utils import timezone
 from django.core.paginator import Paginator
 import urllib.parse
 
+from saas_base.utils.page_cache import (
+    cache_public_page, conditional_page, fragment_cache_context, get_page_etag, serve_cached_page
+)
 from .models import CoupleProfile, WeddingLink
 from .forms import CoupleProfileForm, WeddingLinkFormSet
 
@@ -77,9 +80,30 @@ class PublicCoupleDetailView(DetailView):
         
         return obj
     
+    def get(self, request, *args, **kwargs):
+        # Permission check first - a private page never reaches the cache
+        self.object = couple = self.get_object()
+        
+        last_modified = couple.updated_at
+        if couple.wedding_date:
+            # The countdown changes at midnight
+            last_modified = max(last_modified, timezone.localtime().replace(hour=0, minute=0, second=0, microsecond=0))
+        
+        return conditional_page(
+            request,
+            lambda: serve_cached_page(
+                'wedding',
+                lambda: self.render_to_response(self.get_context_data(object=couple)),
+                request
+            ),
+            etag=get_page_etag(request, 'wedding', couple.pk, last_modified.isoformat()),
+            last_modified=last_modified,
+        )
+    
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         couple = self.object
+        context.update(fragment_cache_context('wedding'))
         
         # Check if user is the owner
         is_owner = self.request.user.is_authenticated and couple.user == self.request.user
@@ -274,6 +298,7 @@ def wedding_link_redirect(request, pk):
     return redirect(wedding_link.url)
 
 
+@cache_public_page('wedding')
 def public_couples_list(request):
     """List of public couple profiles - ONLY shows published pages"""
     couples_list = CoupleProfile.objects.filter(is_public=True).order_by('-created_at')